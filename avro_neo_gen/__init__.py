@@ -1 +1,2 @@
 from .avro_schema import AvroSchema
+from .core import __version__
@@ -3,7 +3,9 @@
 See class docstring for details.
 """
 
+import hashlib
 from typing import Any, Generic, Iterator, Optional, TypeVar, Union
+from weakref import WeakValueDictionary
 
 from avro.schema import (
     ArraySchema,
@@ -15,9 +17,13 @@ from avro.schema import (
     UnionSchema,
 )
 
+from avro_neo_gen.core.neo_gen_registry import fingerprint64
+
 T = TypeVar("T", bound=Schema | Field)
 Self = TypeVar("Self", bound="AvroSchema")
 
+_UNSET: Any = object()
+
 
 class AvroSchema(Generic[T]):
     """Wrapper class for Apache Avro Schema types.
@@ -35,19 +41,66 @@ class AvroSchema(Generic[T]):
     :type schema: Union[:class:`AvroSchema`, :class:`T`]
     :raises TypeError: If provided schema
 
-    .. note:: Class can be safely called on :class:`AvroSchema`, which will
-        return a new instance which re-wraps the previously wrapped value.
+    .. note:: Wrappers are interned, calling the class on an
+        :class:`avro.schema.Schema`, or on an :class:`AvroSchema`, that is
+        already wrapped returns the existing wrapper. Derived values such as
+        ``fullname`` and ``fields`` are computed once per wrapper, so the
+        wrapped schema must not be mutated after it is first wrapped.
     """
 
-    def __init__(self, schema: T) -> None:
-        """Initialize :class:`AvroSchema`."""
-        match schema:
-            case AvroSchema():
-                self._schema: T = schema._schema
-            case Schema() | Field():  # type: ignore
-                self._schema = schema
-            case _:
-                raise TypeError from None
+    __slots__ = (
+        "_schema",
+        "_fullname",
+        "_namespace_components",
+        "_fields",
+        "_schemas",
+        "_contained_schemas",
+        "_fingerprints",
+        "__weakref__",
+    )
+
+    _schema: T
+    _fullname: Optional[str]
+    _namespace_components: tuple[str, ...]
+    _fields: tuple["AvroSchema[Field]", ...]
+    _schemas: tuple["AvroSchema[Schema]", ...]
+    _contained_schemas: tuple[Any, ...]
+    _fingerprints: dict[str, bytes]
+
+    _interned: "WeakValueDictionary[tuple[type, int], AvroSchema]" = WeakValueDictionary()
+
+    def __new__(cls: type[Self], schema: T) -> Self:
+        """Return the interned wrapper of ``schema``, creating it if needed."""
+        if isinstance(schema, AvroSchema):
+            schema = schema._schema
+
+        # The wrapper holds a strong reference to ``schema``, so its ``id``
+        # can not be reused while the interned entry exists, unless the
+        # wrapper was repointed, which the identity check catches.
+        key = (cls, id(schema))
+        interned = cls._interned.get(key)
+        if interned is not None and interned._schema is schema:
+            return interned  # type: ignore
+
+        if not isinstance(schema, Schema | Field):
+            raise TypeError from None
+
+        avro_schema = super().__new__(cls)  # type: ignore
+        avro_schema._schema = schema
+        avro_schema._fullname = _UNSET
+        avro_schema._namespace_components = _UNSET
+        avro_schema._fields = _UNSET
+        avro_schema._schemas = _UNSET
+        avro_schema._contained_schemas = _UNSET
+        avro_schema._fingerprints = {}
+        if interned is not None:
+            cls._interned[key] = avro_schema
+            return avro_schema
+        return cls._interned.setdefault(key, avro_schema)  # type: ignore
+
+    def __reduce__(self) -> tuple[type, tuple[T]]:
+        """Pickle as the wrapped schema, re-interning on unpickle."""
+        return self.__class__, (self._schema,)
 
     def __getattr__(self, name: str) -> Any:
         """Delegate missing attributes to ``self.schema``.
@@ -59,15 +112,19 @@ class AvroSchema(Generic[T]):
         .. note:: Wraps internal values in :class:`AvroSchema` before
             returning if the value is an :class:`avro.schema.Schema`.
         """
-        attr = getattr(self.schema, name)
-        if isinstance(attr, Schema | Field):
-            return AvroSchema(attr)
+        if name == "fields" and isinstance(self._schema, RecordSchema):
+            if self._fields is _UNSET:
+                self._fields = tuple(map(AvroSchema, self._schema.fields))
+            return list(self._fields)
 
-        if isinstance(self.schema, RecordSchema) and name == "fields":
-            return list(map(AvroSchema, attr))
+        if name == "schemas" and isinstance(self._schema, UnionSchema):
+            if self._schemas is _UNSET:
+                self._schemas = tuple(map(AvroSchema, self._schema.schemas))
+            return list(self._schemas)
 
-        if isinstance(self.schema, UnionSchema) and name == "schemas":
-            return list(map(AvroSchema, attr))
+        attr = getattr(self._schema, name)
+        if isinstance(attr, Schema | Field):
+            return AvroSchema(attr)
 
         return attr
 
@@ -111,20 +168,22 @@ class AvroSchema(Generic[T]):
         .. note:: Wraps internal values in instances of :class:`AvroSchema`
 
         """
-        contained_schemas: list[Union[Schema, Field]] = []
-        match self.schema:
-            case RecordSchema():  # type: ignore
-                contained_schemas = [field.type for field in self.fields]
-            case Field():  # type: ignore
-                contained_schemas = [self.type]
-            case ArraySchema():  # type: ignore
-                contained_schemas = [self.items]
-            case MapSchema():  # type: ignore
-                contained_schemas = [self.values]
-            case UnionSchema():  # type: ignore
-                contained_schemas = self.schemas
-
-        yield from contained_schemas
+        if self._contained_schemas is _UNSET:
+            contained_schemas: list[Union[Schema, Field]] = []
+            match self.schema:
+                case RecordSchema():  # type: ignore
+                    contained_schemas = [field.type for field in self.schema.fields]
+                case Field():  # type: ignore
+                    contained_schemas = [self.schema.type]
+                case ArraySchema():  # type: ignore
+                    contained_schemas = [self.schema.items]
+                case MapSchema():  # type: ignore
+                    contained_schemas = [self.schema.values]
+                case UnionSchema():  # type: ignore
+                    contained_schemas = self.schema.schemas
+            self._contained_schemas = tuple(map(AvroSchema, contained_schemas))
+
+        return iter(self._contained_schemas)
 
     @property
     def schema(self) -> T:
@@ -164,7 +223,7 @@ class AvroSchema(Generic[T]):
         :rtype: Optional[str]
         """
         if self.is_named:
-            return self.schema.name
+            return self.schema.name  # type: ignore[union-attr]
         return None
 
     @property
@@ -176,7 +235,7 @@ class AvroSchema(Generic[T]):
         :rtype: Optional[str]
         """
         if self.is_named:
-            return self.schema.namespace
+            return self.schema.namespace  # type: ignore[union-attr]
         return None
 
     @property
@@ -187,9 +246,9 @@ class AvroSchema(Generic[T]):
             namespace.
         :rtype: list[str]
         """
-        if self.namespace:
-            return self.namespace.split(".")
-        return []
+        if self._namespace_components is _UNSET:
+            self._namespace_components = tuple(self.namespace.split(".")) if self.namespace else ()
+        return list(self._namespace_components)
 
     @property
     def fullname(self) -> Optional[str]:
@@ -199,9 +258,9 @@ class AvroSchema(Generic[T]):
             :class:`avro.schema.NamedSchema`, None otherwise.
         :rtype: Optional[str]
         """
-        if self.is_named:
-            return self.to_canonical_json()["name"]
-        return None
+        if self._fullname is _UNSET:
+            self._fullname = self.to_canonical_json()["name"] if self.is_named else None
+        return self._fullname
 
     @property
     def fullname_components(self) -> list[str]:
@@ -214,3 +273,50 @@ class AvroSchema(Generic[T]):
         if self.fullname:
             return self.fullname.split(".")
         return []
+
+    def fingerprint(self, algorithm: str = "CRC-64-AVRO") -> bytes:
+        """Fingerprint of the Parsing Canonical Form of the contained schema.
+
+        Fingerprints are computed once per algorithm and cached.
+
+        :param algorithm: ``"CRC-64-AVRO"``, or a :mod:`hashlib` algorithm
+            name such as ``"md5"`` or ``"sha256"``, defaults to
+            ``"CRC-64-AVRO"``.
+        :type algorithm: str
+        :return: Fingerprint digest, CRC-64-AVRO is 8 bytes little-endian.
+        :rtype: bytes
+        :raises ValueError: If ``algorithm`` is not supported.
+        """
+        fingerprint = self._fingerprints.get(algorithm)
+        if fingerprint is None:
+            canonical_form = self.schema.canonical_form  # type: ignore[union-attr]
+            if algorithm == "CRC-64-AVRO":
+                fingerprint = fingerprint64(canonical_form)
+            else:
+                fingerprint = hashlib.new(algorithm, canonical_form.encode("utf-8")).digest()
+            self._fingerprints[algorithm] = fingerprint
+        return fingerprint
+
+    @property
+    def fingerprint64(self) -> bytes:
+        """CRC-64-AVRO fingerprint, as used by single object encoding.
+
+        :rtype: bytes
+        """
+        return self.fingerprint("CRC-64-AVRO")
+
+    @property
+    def fingerprint_md5(self) -> bytes:
+        """MD5 fingerprint.
+
+        :rtype: bytes
+        """
+        return self.fingerprint("md5")
+
+    @property
+    def fingerprint_sha256(self) -> bytes:
+        """SHA-256 fingerprint.
+
+        :rtype: bytes
+        """
+        return self.fingerprint("sha256")
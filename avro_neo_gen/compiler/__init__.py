@@ -2,4 +2,8 @@ from .compile_avro_schema import compile_avro_schema
 from .compile_avro_schema_record_body import compile_avro_schema_record_body
 from .compile_avro_schema_record_builder import compile_avro_schema_record_builder
 from .compile_avro_schema_type_signature import compile_avro_schema_type_signature
-from .compile_parser_namespace_map import compile_parser_namespace_map
+from .compile_cache import CompileCache
+from .compile_parser_namespace_map import (
+    compile_parser_namespace_map,
+    iter_compile_parser_namespace_map,
+)
@@ -1,6 +1,6 @@
 """Compile AvroSchema into Python AST."""
 
-from ast import AST, Assign, Call, ClassDef, Constant, keyword
+from ast import AST, Assign, Attribute, Call, ClassDef, Constant, Load, keyword
 
 from avro.schema import (
     EnumSchema,
@@ -21,7 +21,10 @@ from avro_neo_gen.utils import pyast_load_name
 
 
 def _named_schema_class_members(avro_schema: AvroSchema[NamedSchema]) -> list[AST]:
-    """Generate class schema and canonical_schema fields.
+    """Generate class schema, canonical_schema and fingerprint fields.
+
+    Fingerprints are computed here, at compile time, and emitted as hex
+    literals so generated classes never hash their schema at runtime.
 
     :param avro_schema: Source Avro schema being compiled.
     :type avro_schema: class:`AvroSchema`
@@ -52,6 +55,22 @@ def _named_schema_class_members(avro_schema: AvroSchema[NamedSchema]) -> list[AS
             ),
             lineno=None,
         ),
+        *(
+            Assign(
+                targets=[pyast_load_name(name)],
+                value=Call(
+                    func=Attribute(value=pyast_load_name("bytes"), attr="fromhex", ctx=Load()),
+                    args=[Constant(value=fingerprint.hex())],
+                    keywords=[],
+                ),
+                lineno=None,
+            )
+            for name, fingerprint in (
+                ("__fingerprint64__", avro_schema.fingerprint64),
+                ("__fingerprint_md5__", avro_schema.fingerprint_md5),
+                ("__fingerprint_sha256__", avro_schema.fingerprint_sha256),
+            )
+        ),
     ]
 
 
@@ -74,12 +93,16 @@ def _named_schema_class_def(avro_schema: AvroSchema, bases: list[str], body: lis
     )
 
 
-def compile_avro_schema(avro_schema: AvroSchema[NamedSchema]) -> list[AST]:
+def compile_avro_schema(avro_schema: AvroSchema[NamedSchema], slots: bool = False) -> list[AST]:
     """Compile a named Avro schema into Python AST.
 
     :param avro_schema: Instance of :class:`AvroSchema` which contains a
         :class:`avro.schema.NamedSchema` to be compiled.
     :type avro_schema: AvroSchema
+    :param slots: Compile records as ``__slots__`` backed
+        :class:`NeoGenSlotsRecord` subclasses rather than
+        :class:`NeoGenDictRecord` subclasses, defaults to `False`.
+    :type slots: bool
     :return: The list of Python AST nodes which comprise the bases of the
         compiled source.
     :rtype: list[:class:`ast.AST`]
@@ -89,8 +112,8 @@ def compile_avro_schema(avro_schema: AvroSchema[NamedSchema]) -> list[AST]:
             return [
                 _named_schema_class_def(
                     avro_schema,
-                    ["NeoGenRecord"],
-                    compile_avro_schema_record_body(avro_schema),
+                    ["NeoGenSlotsRecord" if slots else "NeoGenDictRecord"],
+                    compile_avro_schema_record_body(avro_schema, slots=slots),
                 ),
                 compile_avro_schema_record_builder(avro_schema),
             ]
@@ -1,18 +1,22 @@
 """Compile the AvroSchema record body to pass up to the class compiler."""
 
 from ast import (
+    AST,
+    AnnAssign,
     Assign,
     Attribute,
-    Call,
     Constant,
+    Dict,
     FunctionDef,
     Load,
+    Pass,
     Return,
     Store,
     Subscript,
+    Tuple,
     arg,
     arguments,
-    keyword,
+    stmt,
 )
 
 from avro.schema import Field, RecordSchema
@@ -21,10 +25,34 @@ from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.compiler.compile_avro_schema_type_signature import (
     compile_avro_schema_type_signature,
 )
-from avro_neo_gen.utils import flat_map, pyast_load_name
+from avro_neo_gen.utils import flat_map, pyast_load_name, pyast_store_name
 
 
-def _compile_init_func(avro_schema: AvroSchema[RecordSchema]) -> FunctionDef:
+def _compile_init_datum_body(avro_schema: AvroSchema[RecordSchema]) -> list[stmt]:
+    return [
+        Assign(
+            lineno=None,  # type: ignore[arg-type]
+            targets=[Attribute(value=pyast_load_name("self"), attr="_datum", ctx=Store())],
+            value=Dict(
+                keys=[Constant(value=field.schema.name) for field in avro_schema.fields],
+                values=[pyast_load_name(field.schema.name) for field in avro_schema.fields],
+            ),
+        )
+    ]
+
+
+def _compile_init_slots_body(avro_schema: AvroSchema[RecordSchema]) -> list[stmt]:
+    return [
+        Assign(
+            lineno=None,  # type: ignore[arg-type]
+            targets=[Attribute(value=pyast_load_name("self"), attr=field.schema.name, ctx=Store())],
+            value=pyast_load_name(field.schema.name),
+        )
+        for field in avro_schema.fields
+    ] or [Pass()]
+
+
+def _compile_init_func(avro_schema: AvroSchema[RecordSchema], slots: bool = False) -> FunctionDef:
     return FunctionDef(
         lineno=None,
         decorator_list=[],
@@ -43,18 +71,30 @@ def _compile_init_func(avro_schema: AvroSchema[RecordSchema]) -> FunctionDef:
             defaults=[],
         ),
         returns=Constant(value=None),
-        body=[
+        body=_compile_init_slots_body(avro_schema) if slots else _compile_init_datum_body(avro_schema),
+    )
+
+
+def _compile_slots_members(avro_schema: AvroSchema[RecordSchema]) -> list[AST]:
+    """Generate ``__slots__``, ``__fields__`` and the per field annotations for slots mode."""
+    return [
+        *[
             Assign(
-                lineno=None,
-                targets=[Attribute(value=pyast_load_name("self"), attr="_datum", ctx=Store())],
-                value=Call(
-                    func=pyast_load_name("record_builder_internal"),
-                    args=[],
-                    keywords=[keyword(arg="self_name", value=Constant(value="self"))],
-                ),
+                lineno=None,  # type: ignore[arg-type]
+                targets=[pyast_store_name(name)],
+                value=Tuple(elts=[Constant(value=field.schema.name) for field in avro_schema.fields], ctx=Load()),
             )
+            for name in ("__slots__", "__fields__")
         ],
-    )
+        *[
+            AnnAssign(  # type: ignore[call-overload]
+                target=pyast_store_name(field.schema.name),
+                annotation=compile_avro_schema_type_signature(field),
+                simple=1,
+            )
+            for field in avro_schema.fields
+        ],
+    ]
 
 
 def _compile_field_property_funcs(avro_schema: AvroSchema[Field]) -> list[FunctionDef]:
@@ -116,14 +156,24 @@ def _compile_field_property_funcs(avro_schema: AvroSchema[Field]) -> list[Functi
     ]
 
 
-def compile_avro_schema_record_body(avro_schema: AvroSchema[RecordSchema]) -> list[FunctionDef]:
+def compile_avro_schema_record_body(avro_schema: AvroSchema[RecordSchema], slots: bool = False) -> list[AST]:
     """Compile Record body init and property functions.
 
-    :returns: List of :class:`ast.AST` functions for the internals of a
+    :param avro_schema: Source Avro record schema being compiled.
+    :type avro_schema: :class:`AvroSchema`[:class:`avro.schema.RecordSchema`]
+    :param slots: Generate a ``__slots__`` body for a
+        :class:`NeoGenSlotsRecord`, storing each field in its own slot in
+        place of the ``_datum`` dict and property pairs, and listing the
+        fields in ``__fields__``, defaults to `False`.
+    :type slots: bool
+    :returns: List of :class:`ast.AST` statements for the internals of a
         :class:`NeoGenRecord`
-    :rtype: list[:class:`ast.FunctionDef`]
+    :rtype: list[:class:`ast.AST`]
 
     """
+    if slots:
+        return [*_compile_slots_members(avro_schema), _compile_init_func(avro_schema, slots=True)]
+
     return [
         _compile_init_func(avro_schema),
         *flat_map(_compile_field_property_funcs, avro_schema.fields),
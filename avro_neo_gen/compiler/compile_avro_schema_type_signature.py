@@ -3,6 +3,7 @@
 import contextlib
 from ast import AST, Constant, Load, Name, Subscript, Tuple
 from typing import Union
+from weakref import finalize
 
 from avro.schema import (
     ArraySchema,
@@ -18,6 +19,8 @@ from avro.schema import (
 from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.utils import pyast_load_name
 
+_type_signatures: dict[int, AST] = {}
+
 
 def _logical_schema_type_signature(avro_schema: AvroSchema[LogicalSchema]) -> Name:
     match avro_schema.logical_type:  # noqa: R503 - Base case raises exception
@@ -164,14 +167,7 @@ def _named_schema_type_signautre(avro_schema: AvroSchema) -> AST:
     return Constant(value=avro_schema.name)
 
 
-def compile_avro_schema_type_signature(avro_schema: AvroSchema[Schema]) -> AST:
-    """Generate a Python type signature from an Avro Schema or Protocol.
-
-    :param avro_schema: Avro type to be compiled.
-    :type avro_schema: :class:`AvroSchema`[:class:`avro.schema.Schema`]
-    :returns: Python AST type signature
-    :rtype: :class:`ast.AST`
-    """
+def _compile_type_signature(avro_schema: AvroSchema[Schema]) -> AST:
     match avro_schema.schema:  # noqa: R503 - Base case raises exception
         case PrimitiveSchema():  # type: ignore
             return _primitve_schmea_type_signautre(avro_schema)
@@ -181,9 +177,33 @@ def compile_avro_schema_type_signature(avro_schema: AvroSchema[Schema]) -> AST:
             return _map_schema_type_signautre(avro_schema)
         case UnionSchema():  # type: ignore
             return _union_schema_type_signautre(avro_schema)
-        case Field():  # type: ignore
-            return compile_avro_schema_type_signature(AvroSchema(avro_schema.type))
         case NamedSchema():  # type: ignore
             return _named_schema_type_signautre(avro_schema)
         case _:
             raise NotImplementedError
+
+
+def compile_avro_schema_type_signature(avro_schema: AvroSchema[Schema]) -> AST:
+    """Generate a Python type signature from an Avro Schema or Protocol.
+
+    :param avro_schema: Avro type to be compiled.
+    :type avro_schema: :class:`AvroSchema`[:class:`avro.schema.Schema`]
+    :returns: Python AST type signature
+    :rtype: :class:`ast.AST`
+
+    Type signatures are memoized per schema object, a field sharing the
+    signature of its type, and dropped when the schema is garbage collected.
+    The same AST is returned on every call and may appear more than once in
+    a module, so it must not be mutated.
+    """
+    if isinstance(avro_schema.schema, Field):
+        avro_schema = AvroSchema(avro_schema.schema.type)
+
+    schema = avro_schema.schema
+    key = id(schema)
+    type_signature = _type_signatures.get(key)
+    if type_signature is None:
+        type_signature = _type_signatures[key] = _compile_type_signature(avro_schema)
+        # Entries are keyed by ``id``, so they must go before it can be reused.
+        finalize(schema, _type_signatures.pop, key, None)
+    return type_signature
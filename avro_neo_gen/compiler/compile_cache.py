@@ -0,0 +1,159 @@
+"""Persistent, content addressed cache of compiled schema source."""
+
+import hashlib
+import json
+import os
+from functools import cache
+from itertools import chain
+from pathlib import Path
+from typing import NamedTuple, Optional, TypedDict, Union
+
+from avro_neo_gen.avro_schema import AvroSchema
+from avro_neo_gen.core import __version__
+from avro_neo_gen.type_defs import LinkerRequiredImports
+
+__all__ = ["CompileCache", "CompileCacheEntry", "CompileCacheStats"]
+
+DEFAULT_CACHE_PATH = Path(".avro_neo_gen_cache")
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+
+class CompileCacheEntry(TypedDict):
+    """Cached compiler output for a single named schema."""
+
+    source: str
+    required_imports: LinkerRequiredImports
+
+
+class CompileCacheStats(NamedTuple):
+    """Counters for a single :class:`CompileCache` instance."""
+
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+
+
+@cache
+def _generator_digest() -> str:
+    """Digest of the generator version and source, excluding the corelib.
+
+    Any change to the code generator invalidates every cache entry, even
+    between releases.
+    """
+    package_path = Path(__file__).parent.parent
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    for source_path in sorted(package_path.glob("**/*.py")):
+        if "core" not in source_path.relative_to(package_path).parts:
+            digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+class CompileCache:
+    """Persistent, content addressed cache of compiled schema source.
+
+    :param path: Cache directory, created on first write, defaults to
+        ``.avro_neo_gen_cache``.
+    :type path: Union[str, Path]
+    :param max_size: Size in bytes the cache is trimmed to by
+        :meth:`evict`, defaults to 256 MiB.
+    :type max_size: int
+
+    Entries are keyed by the SHA-256 of a schema's canonical form, its full
+    JSON, the compile options, and the generator version. Each entry holds
+    the unparsed source of the compiled schema and the imports it requires.
+
+    Reading an entry refreshes its modification time, so :meth:`evict`
+    removes the least recently used entries first.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH, max_size: int = DEFAULT_CACHE_MAX_SIZE) -> None:
+        """Initialize :class:`CompileCache`."""
+        self.path = Path(path)
+        self.max_size = max_size
+        self._hits = self._misses = self._writes = self._evictions = 0
+
+    @property
+    def stats(self) -> CompileCacheStats:
+        """Hit, miss, write and eviction counts since initialization."""
+        return CompileCacheStats(hits=self._hits, misses=self._misses, writes=self._writes, evictions=self._evictions)
+
+    def key(self, avro_schema: AvroSchema, slots: bool = False) -> str:
+        """Calculate the cache key of a named schema.
+
+        The canonical form alone is not enough, as docs, defaults and logical
+        types are dropped from it but still appear in the generated class.
+
+        :param avro_schema: Named schema to be compiled.
+        :type avro_schema: AvroSchema
+        :param slots: Schema is compiled in ``__slots__`` mode.
+        :type slots: bool
+        :return: Hex digest identifying the compiled output.
+        :rtype: str
+        """
+        digest = hashlib.sha256(_generator_digest().encode("utf-8"))
+        digest.update(json.dumps(avro_schema.to_canonical_json()).encode("utf-8"))
+        digest.update(json.dumps(avro_schema.to_json(), sort_keys=True).encode("utf-8"))
+        digest.update(b"slots" if slots else b"")
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CompileCacheEntry]:
+        """Fetch a cached entry, or `None` if it is missing or unreadable."""
+        entry_path = self._entry_path(key)
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return CompileCacheEntry(
+            source=entry["source"],
+            required_imports={module: set(names) for module, names in entry["required_imports"].items()},
+        )
+
+    def put(self, key: str, entry: CompileCacheEntry) -> None:
+        """Store an entry, replacing any existing entry atomically."""
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        staging_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        staging_path.write_text(
+            json.dumps(
+                {
+                    "source": entry["source"],
+                    "required_imports": {module: sorted(names) for module, names in entry["required_imports"].items()},
+                }
+            ),
+            encoding="utf-8",
+        )
+        staging_path.replace(entry_path)
+        self._writes += 1
+
+    def evict(self) -> None:
+        """Remove least recently used entries until within ``max_size``.
+
+        Staging files left behind by interrupted writes count towards the size
+        of the cache, and are evicted along with the entries.
+        """
+        if not self.path.is_dir():
+            return
+
+        entries = sorted(
+            (
+                (entry_path.stat(), entry_path)
+                for entry_path in chain(self.path.glob("*/*.json"), self.path.glob("*/*.tmp"))
+            ),
+            key=lambda entry: entry[0].st_mtime,
+        )
+        size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry_path in entries:
+            if size <= self.max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            size -= stat.st_size
+            self._evictions += 1
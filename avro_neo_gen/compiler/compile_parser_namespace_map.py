@@ -1,10 +1,18 @@
 """Compile parser namespace map."""
 
 import contextlib
-from ast import AST
+import os
+from ast import AST, Module, unparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, Optional
 
 from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.compiler.compile_avro_schema import compile_avro_schema
+from avro_neo_gen.compiler.compile_cache import CompileCache, CompileCacheEntry
+from avro_neo_gen.linker.avro_schema_required_imports import (
+    avro_schema_required_imports,
+)
 from avro_neo_gen.type_defs import (
     CompilerNamespaceMap,
     CompilerNamespaceMapCell,
@@ -12,19 +20,123 @@ from avro_neo_gen.type_defs import (
 )
 
 
-def compile_parser_namespace_map(namespace_map: ParserNamespaceMap) -> CompilerNamespaceMap:
+def _safe_compile(avro_schema: AvroSchema, slots: bool) -> list[AST]:
+    with contextlib.suppress(NotImplementedError):
+        return compile_avro_schema(avro_schema, slots=slots)
+    return []
+
+
+def _compile_entry(avro_schema: AvroSchema, slots: bool) -> CompileCacheEntry:
+    """Compile a named schema to unparsed source, as cached and as returned by worker processes."""
+    return CompileCacheEntry(
+        source=unparse(Module(body=_safe_compile(avro_schema, slots), type_ignores=[])),  # type: ignore[arg-type]
+        required_imports=avro_schema_required_imports(avro_schema, slots=slots),
+    )
+
+
+def _compile_entries(
+    namespace_map: ParserNamespaceMap, slots: bool, cache: Optional[CompileCache], jobs: int
+) -> dict[int, CompileCacheEntry]:
+    """Compile every named schema in worker processes, keyed by ``id`` of the schema.
+
+    Cache lookups and writes stay in this process. Cache misses are sent to
+    the workers in contiguous batches, in namespace order, and results are
+    collected in the same order, so the output does not depend on ``jobs``.
+    """
+    entries: dict[int, CompileCacheEntry] = {}
+    pending: dict[int, tuple[AvroSchema, Optional[str]]] = {}
+    for avro_schemas in namespace_map.values():
+        for avro_schema in avro_schemas:
+            schema_id = id(avro_schema)
+            if not avro_schema.is_named or schema_id in entries or schema_id in pending:
+                continue
+            key = None
+            if cache is not None:
+                key = cache.key(avro_schema, slots=slots)
+                entry = cache.get(key)
+                if entry is not None:
+                    entries[schema_id] = entry
+                    continue
+            pending[schema_id] = (avro_schema, key)
+
+    compile_entry = partial(_compile_entry, slots=slots)
+    pending_schemas = [avro_schema for avro_schema, _ in pending.values()]
+    if len(pending_schemas) <= 1:
+        compiled = list(map(compile_entry, pending_schemas))
+    else:
+        workers = jobs or os.cpu_count() or 1
+        chunksize = max(1, len(pending_schemas) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            compiled = list(executor.map(compile_entry, pending_schemas, chunksize=chunksize))
+
+    for (schema_id, (_, key)), entry in zip(pending.items(), compiled):
+        entries[schema_id] = entry
+        if cache is not None:
+            cache.put(key, entry)  # type: ignore
+    return entries
+
+
+def iter_compile_parser_namespace_map(
+    namespace_map: ParserNamespaceMap, slots: bool = False, cache: Optional[CompileCache] = None, jobs: int = 1
+) -> Iterator[tuple[str, list[CompilerNamespaceMapCell]]]:
+    """Compile parser namespace map one namespace at a time.
+
+    Takes the same arguments as :func:`compile_parser_namespace_map`, and
+    yields the same cells in the same order. A namespace is only compiled
+    when the next item is requested, and its AST is not referenced once it
+    has been yielded, so a consumer which links and emits each namespace
+    before requesting the next holds about one namespace of AST at a time.
+    With ``jobs``, named schemas are still compiled up front, and only their
+    unparsed source is held.
+
+    :return: Namespaces and their compiled cells.
+    :rtype: Iterator[tuple[str, list[:class:`CompilerNamespaceMapCell`]]]
+    """
+    entries = None if jobs == 1 else _compile_entries(namespace_map, slots, cache, jobs)
+
+    def _compile_cell(avro_schema: AvroSchema) -> CompilerNamespaceMapCell:
+        if not avro_schema.is_named or entries is None and cache is None:
+            return CompilerNamespaceMapCell(schema=avro_schema, ast=_safe_compile(avro_schema, slots))
+
+        if entries is not None:
+            entry = entries[id(avro_schema)]
+        else:
+            key = cache.key(avro_schema, slots=slots)  # type: ignore
+            entry = cache.get(key)  # type: ignore
+            if entry is None:
+                entry = _compile_entry(avro_schema, slots)
+                cache.put(key, entry)  # type: ignore
+
+        return CompilerNamespaceMapCell(
+            schema=avro_schema, ast=None, source=entry["source"], required_imports=entry["required_imports"]
+        )
+
+    for namespace, schemas in namespace_map.items():
+        yield namespace, list(map(_compile_cell, schemas))
+
+
+def compile_parser_namespace_map(
+    namespace_map: ParserNamespaceMap, slots: bool = False, cache: Optional[CompileCache] = None, jobs: int = 1
+) -> CompilerNamespaceMap:
     """Compile parser namespace map.
 
+    :param namespace_map: Parsed schemas keyed by namespace.
+    :type namespace_map: :class:`ParserNamespaceMap`
+    :param slots: Compile records as ``__slots__`` backed classes, defaults
+        to `False`.
+    :type slots: bool
+    :param cache: Compile cache for named schemas, defaults to `None`.
+    :type cache: Optional[:class:`CompileCache`]
+    :param jobs: Number of worker processes used to compile named schemas,
+        ``0`` uses one per CPU, defaults to ``1`` which compiles in process.
+    :type jobs: int
     :return: CompilerNamespaceMap
     :rtype: :class:`CompilerNamespaceMap`
-    """
 
-    def _safe_compile(avro_schema: AvroSchema) -> list[AST]:
-        with contextlib.suppress(NotImplementedError):
-            return compile_avro_schema(avro_schema)
-        return []
-
-    return {
-        namespace: [CompilerNamespaceMapCell(schema=schema, ast=_safe_compile(schema)) for schema in schemas]
-        for namespace, schemas in namespace_map.items()
-    }
+    With a ``cache``, named schemas are compiled only on a cache miss, and
+    their cells carry unparsed ``source`` and ``required_imports`` rather
+    than AST. Named schemas compiled by worker processes are returned the
+    same way, whether or not there is a cache, and the linked module is the
+    same whatever the number of ``jobs``.
+    """
+    return dict(iter_compile_parser_namespace_map(namespace_map, slots=slots, cache=cache, jobs=jobs))
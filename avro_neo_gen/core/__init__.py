@@ -1,4 +1,14 @@
+from importlib.metadata import PackageNotFoundError, version
+
 from .abstract_neo_gen_record_builder import AbstractNeoGenRecordBuilder
 from .neo_gen_enum import NeoGenEnum
 from .neo_gen_fixed import NeoGenFixed, NeoGenFixedDecimal
-from .neo_gen_record import NeoGenRecord
+from .neo_gen_record import NeoGenDictRecord, NeoGenRecord, NeoGenSlotsRecord
+
+UNKNOWN_VERSION = "0.0.0"
+
+try:
+    __version__ = version("avro-neo-gen")
+except PackageNotFoundError:
+    # Not installed, such as when run from a source checkout.
+    __version__ = UNKNOWN_VERSION
@@ -4,10 +4,16 @@ import json
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from io import BufferedIOBase
-from typing import Any, Type, TypeVar
+from typing import Any, Iterable, Iterator, Optional, Type, TypeVar
 
+from avro_neo_gen.core.driver.binary_codec import (
+    ITER_READ_BUFFER_SIZE,
+    Buffer,
+    WriterSchema,
+)
 from avro_neo_gen.core.driver.driver_proxy import DriverProxy
 from avro_neo_gen.core.neo_gen_encodable import NeoGenEncodable
+from avro_neo_gen.core.neo_gen_registry import register_schema_type
 from avro_neo_gen.core.neo_gen_type import NeoGenType
 from avro_neo_gen.core.type_defs import AvroSchemaTypeAlias
 
@@ -19,10 +25,21 @@ Self = TypeVar("Self", bound="AbstractNeoGenObject")
 class AbstractNeoGenObject(ABC, NeoGenType, NeoGenEncodable):
     """Generated type abstract class."""
 
+    __slots__ = ()
+
     __canonical_schema__: OrderedDict[str, Any]
     __schema__: AvroSchemaTypeAlias
+    __fingerprint64__: bytes
+    __fingerprint_md5__: bytes
+    __fingerprint_sha256__: bytes
     __driver_proxy__ = DriverProxy()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register generated classes by fingerprint as they are defined."""
+        super().__init_subclass__(**kwargs)
+        if "__fingerprint64__" in cls.__dict__:
+            register_schema_type(cls)
+
     @abstractmethod
     def __init__(self, datum: Any) -> None:
         """Abstract constructor."""
@@ -54,14 +71,101 @@ class AbstractNeoGenObject(ABC, NeoGenType, NeoGenEncodable):
         return json.dumps(self.schema)
 
     @classmethod
-    def read(cls: Type[Self], source: BufferedIOBase) -> Self:
-        """Read encoded avro schema via DriverProxy into a new typed instance."""
-        return cls.__driver_proxy__.read(cls, source)
+    def read(cls: Type[Self], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> Self:
+        """Read encoded avro schema via DriverProxy into a new typed instance.
+
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to this class's schema. Data written with
+            an older or newer version of the schema is resolved against it.
+        :type writer_schema: Optional[WriterSchema]
+        """
+        return cls.__driver_proxy__.read(cls, source, writer_schema)
 
     def write(self, target: BufferedIOBase) -> None:
         """Write instance values into an  encoded avro schema via DriverProxy."""
         self.__class__.__driver_proxy__.write(self, target)
 
+    @classmethod
+    def from_bytes(
+        cls: Type[Self], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[Self, int]:
+        """Read encoded avro schema from a buffer via DriverProxy into a new typed instance.
+
+        :param buf: ``bytes``, ``bytearray`` or ``memoryview`` holding the
+            encoded datum.
+        :type buf: Buffer
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :param writer_schema: Schema the datum was written with, defaults to
+            this class's schema.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance and the offset of the first byte after the datum.
+        :rtype: tuple[Self, int]
+        """
+        return cls.__driver_proxy__.from_bytes(cls, buf, offset, writer_schema)
+
+    def to_bytes(self) -> bytes:
+        """Write instance values into encoded avro schema bytes via DriverProxy."""
+        out = bytearray()
+        self.__class__.__driver_proxy__.write_into(self, out)
+        return bytes(out)
+
+    def write_into(self, out: bytearray) -> None:
+        """Append instance values as encoded avro schema to a buffer via DriverProxy."""
+        self.__class__.__driver_proxy__.write_into(self, out)
+
+    @classmethod
+    def read_many(
+        cls: Type[Self],
+        source: BufferedIOBase,
+        count: Optional[int] = None,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> list[Self]:
+        """Read consecutive encoded avro schemas via DriverProxy into new typed instances.
+
+        :param count: Number of records to read, defaults to reading until
+            the end of ``source``.
+        :type count: Optional[int]
+        :param writer_schema: Schema the datums were written with, defaults to
+            this class's schema.
+        :type writer_schema: Optional[WriterSchema]
+        """
+        return cls.__driver_proxy__.read_many(cls, source, count, writer_schema)
+
+    @classmethod
+    def iter_read(
+        cls: Type[Self],
+        source: BufferedIOBase,
+        buffer_size: int = ITER_READ_BUFFER_SIZE,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> Iterator[Self]:
+        """Lazily read consecutive encoded avro schemas via DriverProxy until the end of ``source``.
+
+        ``source`` is read ``buffer_size`` bytes at a time, and instances are
+        decoded from the buffered bytes as they are iterated, so memory use
+        does not grow with the length of the stream.
+
+        .. highlight:: python
+        .. code-block::
+
+            for user in User.iter_read(sys.stdin.buffer):
+                ...
+
+        :param buffer_size: Number of bytes to read from ``source`` at a
+            time, defaults to 1 MiB.
+        :type buffer_size: int
+        :param writer_schema: Schema the datums were written with, defaults to
+            this class's schema.
+        :type writer_schema: Optional[WriterSchema]
+        :raises NeoGenCodecUnderflowError: If ``source`` ends within a datum.
+        """
+        return cls.__driver_proxy__.iter_read(cls, source, buffer_size, writer_schema)
+
+    @classmethod
+    def write_many(cls: Type[Self], records: Iterable[Self], target: BufferedIOBase) -> None:
+        """Write instances into consecutive encoded avro schemas via DriverProxy."""
+        cls.__driver_proxy__.write_many(records, target)
+
     @abstractmethod
     def encode(self) -> Any:
         """Cast typed entity to representational data per caonical_schema."""
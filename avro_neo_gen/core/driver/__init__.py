@@ -1 +1,9 @@
+from .container_file import ContainerReader, ContainerWriter, iter_records
 from .driver_proxy import DriverProxy
+from .schema_registry import (
+    FileSchemaRegistry,
+    InMemorySchemaRegistry,
+    SchemaRegistryBackend,
+)
+from .schema_registry_driver import SchemaRegistryDriver
+from .single_object_driver import SingleObjectDriver, decode_any
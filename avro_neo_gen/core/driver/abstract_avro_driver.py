@@ -1,10 +1,17 @@
 """Abstract base class for all Avro Drivers."""
 
 from abc import ABC, abstractmethod
-from io import BufferedIOBase
-from typing import TYPE_CHECKING, Type, TypeVar
+from functools import partial
+from io import BufferedIOBase, BytesIO
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Type, TypeVar
 
 from avro_neo_gen.core.driver.avro_driver_type import AvroDriverType
+from avro_neo_gen.core.driver.binary_codec import (
+    ITER_READ_BUFFER_SIZE,
+    Buffer,
+    WriterSchema,
+    iter_decode,
+)
 
 if TYPE_CHECKING:
     from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
@@ -12,15 +19,168 @@ if TYPE_CHECKING:
 S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
 
 
+def _at_end(source: BufferedIOBase) -> bool:
+    """Check whether a seekable stream has no bytes left to read."""
+    position = source.tell()
+    at_end = not source.read(1)
+    source.seek(position)
+    return at_end
+
+
 class AbstractAvroDriver(ABC, AvroDriverType):
     """Abstract base class for all Avro Drivers."""
 
     @abstractmethod
-    def read(self, schema_type: Type[S], source: BufferedIOBase) -> S:
-        """Read a single schema from source stream and return a typed instance."""
+    def read(self, schema_type: Type[S], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> S:
+        """Read a single schema from source stream and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type``.
+        :rtype: S
+        """
         raise NotImplementedError
 
     @abstractmethod
     def write(self, schema: S, target: BufferedIOBase) -> None:
         """Write a single schema to target stream."""
         raise NotImplementedError
+
+    def read_many(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        count: Optional[int] = None,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> list[S]:
+        """Read consecutive schemas from source stream into typed instances.
+
+        Drivers may override this to amortize per-record setup across the
+        batch, the default implementation calls :meth:`read` per record.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param count: Number of records to read, defaults to reading until
+            the end of ``source``.
+        :type count: Optional[int]
+        :param writer_schema: Schema the datums were written with, defaults to
+            the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instances of ``schema_type``, in stream order.
+        :rtype: list[S]
+        """
+        read = self.read if writer_schema is None else partial(self.read, writer_schema=writer_schema)
+        if count is not None:
+            return [read(schema_type, source) for _ in range(count)]
+
+        if not source.seekable():
+            source = BytesIO(source.read())
+
+        records = []
+        while not _at_end(source):
+            records.append(read(schema_type, source))
+        return records
+
+    def iter_read(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        buffer_size: int = ITER_READ_BUFFER_SIZE,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> Iterator[S]:
+        """Lazily read consecutive schemas from source stream until it ends.
+
+        ``source`` is read in chunks of ``buffer_size`` bytes, and records are
+        decoded from the buffered chunk with :meth:`from_bytes`, which must
+        raise :class:`NeoGenCodecUnderflowError` when the chunk ends within a
+        record. Memory use is bounded by the chunk and the largest record,
+        not by the length of the stream.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param buffer_size: Number of bytes to read from ``source`` at a time.
+        :type buffer_size: int
+        :param writer_schema: Schema the datums were written with, defaults to
+            the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: Lazy iterator over new instances of ``schema_type``, in
+            stream order.
+        :rtype: Iterator[S]
+        :raises NeoGenCodecUnderflowError: If ``source`` ends within a record.
+        """
+        from_bytes = self.from_bytes if writer_schema is None else partial(self.from_bytes, writer_schema=writer_schema)
+        return iter_decode(source, partial(from_bytes, schema_type), buffer_size)
+
+    def write_many(self, schemas: Iterable[S], target: BufferedIOBase) -> None:
+        """Write consecutive schemas to target stream.
+
+        Drivers may override this to buffer the encoded batch, the default
+        implementation calls :meth:`write` per record.
+
+        :param schemas: Generated class instances to encode.
+        :type schemas: Iterable[S]
+        :param target: Stream to write the encoded datums to.
+        :type target: BufferedIOBase
+        """
+        for schema in schemas:
+            self.write(schema, target)
+
+    def from_bytes(
+        self, schema_type: Type[S], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[S, int]:
+        """Read a single schema from a buffer and return a typed instance.
+
+        Drivers may override this to decode straight from ``buf``, the
+        default implementation wraps it in a stream for :meth:`read`.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param buf: Buffer holding the encoded datum.
+        :type buf: Buffer
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :param writer_schema: Schema the datum was written with, defaults to
+            the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type`` and the offset of the first
+            byte after the datum.
+        :rtype: tuple[S, int]
+        """
+        source = BytesIO(buf)
+        source.seek(offset)
+        if writer_schema is None:
+            return self.read(schema_type, source), source.tell()
+        return self.read(schema_type, source, writer_schema=writer_schema), source.tell()
+
+    def write_into(self, schema: S, out: bytearray) -> None:
+        """Append a single encoded schema to a buffer.
+
+        Drivers may override this to encode straight into ``out``, the
+        default implementation writes through a stream with :meth:`write`.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param out: Buffer to append the encoded datum to.
+        :type out: bytearray
+        """
+        target = BytesIO()
+        self.write(schema, target)
+        out += target.getbuffer()
+
+    def invalidate(self, schema_type: Optional[Type["AbstractNeoGenObject"]] = None) -> None:
+        """Drop any per-class state cached by the driver.
+
+        :param schema_type: Generated class to invalidate, defaults to every
+            cached class.
+        :type schema_type: Optional[Type[AbstractNeoGenObject]]
+        """
+        pass
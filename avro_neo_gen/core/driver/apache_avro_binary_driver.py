@@ -1,13 +1,23 @@
 """Driver impl. using the Apache Avro python library."""
 
 import json
-from io import BufferedIOBase
-from typing import TYPE_CHECKING, Type, TypeVar
+from io import BufferedIOBase, BytesIO
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 import avro.io
 import avro.schema
 
-from avro_neo_gen.core.driver.abstract_avro_driver import AbstractAvroDriver
+from avro_neo_gen.core.driver.abstract_avro_driver import (
+    AbstractAvroDriver,
+    _at_end,
+)
+from avro_neo_gen.core.driver.binary_codec import (
+    Buffer,
+    WriterSchema,
+    writer_schema_fingerprint,
+)
+from avro_neo_gen.core.neo_gen_error import NeoGenCodecUnderflowError
 
 if TYPE_CHECKING:
     from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
@@ -18,20 +28,116 @@ __all__ = ["ApacheAvroBinaryDriver"]
 S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
 
 
+class _ApacheAvroSchemaCacheEntry(NamedTuple):
+    """Parsed schema and datum reader / writer for one generated class."""
+
+    schema: avro.schema.Schema
+    datum_reader: avro.io.DatumReader
+    datum_writer: avro.io.DatumWriter
+
+
+class _BufferReader:
+    """Minimal reader over a buffer, copying only the bytes requested.
+
+    Reading past the end of the buffer raises
+    :class:`NeoGenCodecUnderflowError`, as the buffer holds a single datum
+    which can only run short if it is truncated.
+    """
+
+    __slots__ = ("_view", "_pos")
+
+    def __init__(self, buf: Buffer, offset: int) -> None:
+        self._view = memoryview(buf)
+        self._pos = offset
+
+    def read(self, size: int) -> bytes:
+        start = self._pos
+        end = start + size
+        if end > len(self._view):
+            raise NeoGenCodecUnderflowError
+        chunk = bytes(self._view[start:end])
+        self._pos = end
+        return chunk
+
+    def seek(self, pos: int) -> None:
+        self._pos = pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class _BufferWriter:
+    """Minimal writer appending to a bytearray."""
+
+    __slots__ = ("write",)
+
+    def __init__(self, out: bytearray) -> None:
+        self.write = out.extend
+
+
 class ApacheAvroBinaryDriver(AbstractAvroDriver):
-    """Driver impl. using the Apache Avro python library."""
+    """Driver impl. using the Apache Avro python library.
+
+    Schemas are parsed once per generated class, the parsed schema and its
+    :class:`avro.io.DatumReader` and :class:`avro.io.DatumWriter` are cached
+    until :meth:`invalidate` is called. Resolving datum readers are cached
+    the same way, per writer schema fingerprint and generated class.
+    """
+
+    def __init__(self) -> None:
+        """Initialize ApacheAvroBinaryDriver."""
+        self._cache: WeakKeyDictionary[type, _ApacheAvroSchemaCacheEntry] = WeakKeyDictionary()
+        self._resolving_readers: WeakKeyDictionary[type, dict[bytes, avro.io.DatumReader]] = WeakKeyDictionary()
 
-    def read(self, schema_type: Type[S], source: BufferedIOBase) -> S:
+    def _cache_entry(self, schema_type: Type["AbstractNeoGenObject"]) -> _ApacheAvroSchemaCacheEntry:
+        try:
+            return self._cache[schema_type]
+        except KeyError:
+            avro_schema = avro.schema.parse(json.dumps(schema_type.__canonical_schema__))
+            entry = self._cache[schema_type] = _ApacheAvroSchemaCacheEntry(
+                schema=avro_schema,
+                datum_reader=avro.io.DatumReader(writers_schema=avro_schema, readers_schema=avro_schema),
+                datum_writer=avro.io.DatumWriter(writers_schema=avro_schema),
+            )
+            return entry
+
+    def _datum_reader(
+        self, schema_type: Type["AbstractNeoGenObject"], writer_schema: Optional[WriterSchema]
+    ) -> avro.io.DatumReader:
+        if writer_schema is None:
+            return self._cache_entry(schema_type).datum_reader
+
+        if not isinstance(writer_schema, str):
+            writer_schema = json.dumps(writer_schema)
+        fingerprint = writer_schema_fingerprint(writer_schema)
+        if fingerprint == schema_type.__fingerprint64__:
+            return self._cache_entry(schema_type).datum_reader
+
+        datum_readers = self._resolving_readers.get(schema_type)
+        if datum_readers is None:
+            datum_readers = self._resolving_readers[schema_type] = {}
+        try:
+            return datum_readers[fingerprint]
+        except KeyError:
+            datum_reader = datum_readers[fingerprint] = avro.io.DatumReader(
+                writers_schema=avro.schema.parse(writer_schema),
+                readers_schema=avro.schema.parse(json.dumps(schema_type.__schema__)),
+            )
+            return datum_reader
+
+    def read(self, schema_type: Type[S], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> S:
         """Read a single schema from source stream and return a typed instance.
 
         :param schema_type:
         :type schema_type: Type[S]
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
         :return:
         :rtype: S
         """
-        avro_schema = avro.schema.parse(json.dumps(schema_type.__canonical_schema__))
-        datum_reader = avro.io.DatumReader(writers_schema=avro_schema, readers_schema=avro_schema)
-        datum = datum_reader.read(decoder=avro.io.BinaryDecoder(reader=source))
+        datum_reader = self._datum_reader(schema_type, writer_schema)
+        datum = datum_reader.read(decoder=avro.io.BinaryDecoder(reader=source))  # type: ignore[arg-type]
         return schema_type.decode(datum)
 
     def write(self, schema: S, target: BufferedIOBase) -> None:
@@ -40,6 +146,102 @@ class ApacheAvroBinaryDriver(AbstractAvroDriver):
         :param schema_type:
         :type schema_type: S
         """
-        avro_schema = avro.schema.parse(schema.canonical_schema_json)
-        datum_writer = avro.io.DatumWriter(writers_schema=avro_schema)
-        datum_writer.write(datum=schema.encode(), encoder=avro.io.BinaryEncoder(writer=target))
+        datum_writer = self._cache_entry(schema.__class__).datum_writer
+        encoder = avro.io.BinaryEncoder(writer=target)  # type: ignore[arg-type]
+        datum_writer.write(datum=schema.encode(), encoder=encoder)
+
+    def from_bytes(
+        self, schema_type: Type[S], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[S, int]:
+        """Read a single schema from a buffer and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type`` and the offset of the first
+            byte after the datum.
+        :rtype: tuple[S, int]
+        """
+        reader = _BufferReader(buf, offset)
+        datum_reader = self._datum_reader(schema_type, writer_schema)
+        datum = datum_reader.read(decoder=avro.io.BinaryDecoder(reader=reader))  # type: ignore
+        return schema_type.decode(datum), reader.tell()
+
+    def write_into(self, schema: S, out: bytearray) -> None:
+        """Append a single encoded schema to a buffer.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        """
+        datum_writer = self._cache_entry(schema.__class__).datum_writer
+        encoder = avro.io.BinaryEncoder(writer=_BufferWriter(out))  # type: ignore
+        datum_writer.write(datum=schema.encode(), encoder=encoder)
+
+    def read_many(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        count: Optional[int] = None,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> list[S]:
+        """Read consecutive schemas from source stream into typed instances.
+
+        One :class:`avro.io.BinaryDecoder` is shared across the batch.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param count: Number of records to read, defaults to reading until
+            the end of ``source``.
+        :type count: Optional[int]
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instances of ``schema_type``, in stream order.
+        :rtype: list[S]
+        """
+        if count is None and not source.seekable():
+            source = BytesIO(source.read())
+
+        read = self._datum_reader(schema_type, writer_schema).read
+        decode = schema_type.decode
+        decoder = avro.io.BinaryDecoder(reader=source)  # type: ignore[arg-type]
+
+        if count is not None:
+            return [decode(read(decoder)) for _ in range(count)]
+
+        records = []
+        while not _at_end(source):
+            records.append(decode(read(decoder)))
+        return records
+
+    def write_many(self, schemas: Iterable[S], target: BufferedIOBase) -> None:
+        """Write consecutive schemas to target stream.
+
+        The batch is encoded into one buffer and written with a single call.
+
+        :param schemas: Generated class instances to encode.
+        :type schemas: Iterable[S]
+        """
+        buffer = BytesIO()
+        encoder = avro.io.BinaryEncoder(writer=buffer)
+        for schema in schemas:
+            self._cache_entry(schema.__class__).datum_writer.write(datum=schema.encode(), encoder=encoder)
+        target.write(buffer.getbuffer())
+
+    def invalidate(self, schema_type: Optional[Type["AbstractNeoGenObject"]] = None) -> None:
+        """Drop cached schemas, for ``schema_type`` only if provided.
+
+        :param schema_type: Generated class to invalidate, defaults to every
+            cached class.
+        :type schema_type: Optional[Type[AbstractNeoGenObject]]
+        """
+        if schema_type is None:
+            self._cache.clear()
+            self._resolving_readers.clear()
+        else:
+            self._cache.pop(schema_type, None)
+            self._resolving_readers.pop(schema_type, None)
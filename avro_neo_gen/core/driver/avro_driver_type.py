@@ -1,10 +1,11 @@
 """Interface for Avro Drivers."""
 
 from io import BufferedIOBase
-from typing import TYPE_CHECKING, Protocol, Type, TypeVar
+from typing import TYPE_CHECKING, Optional, Protocol, Type, TypeVar
 
 if TYPE_CHECKING:
     from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+    from avro_neo_gen.core.driver.binary_codec import WriterSchema
 
 S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
 
@@ -12,7 +13,7 @@ S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
 class AvroDriverType(Protocol):
     """Avro data driver type Protocol."""
 
-    def read(self, schema: Type[S], source: BufferedIOBase) -> S:
+    def read(self, schema: Type[S], source: BufferedIOBase, writer_schema: Optional["WriterSchema"] = None) -> S:
         """Read a single schema from source stream and return a typed instance."""
         ...
 
@@ -0,0 +1,1381 @@
+"""Schema specialized Avro binary codec.
+
+A :class:`BinaryCodec` walks an Avro schema exactly once, building a tree of
+closures which encode and decode datums of that schema. Encoding and decoding
+a datum then only pays for the closures themselves rather than for
+interpreting the schema on every call.
+
+Decoders operate on any indexable byte buffer (``bytes``, ``bytearray``, or
+``memoryview``) and return the decoded datum along with the offset of the
+first unread byte. Encoders append to a ``bytearray``.
+"""
+
+import json
+import struct
+from copy import deepcopy
+from functools import lru_cache
+from io import BufferedIOBase
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenCodecError,
+    NeoGenCodecUnderflowError,
+)
+from avro_neo_gen.core.neo_gen_registry import fingerprint64, parsing_canonical_form
+from avro_neo_gen.core.type_defs import AvroSchemaTypeAlias
+
+if TYPE_CHECKING:
+    from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+
+__all__ = [
+    "BinaryCodec",
+    "LazyDatum",
+    "clear_binary_codec_cache",
+    "get_binary_codec",
+    "get_resolving_binary_codec",
+    "iter_decode",
+    "read_long",
+    "write_long",
+    "writer_schema_fingerprint",
+]
+
+Buffer = Union[bytes, bytearray, memoryview]
+Encoder = Callable[[Any, bytearray], None]
+Decoder = Callable[[Buffer, int], tuple[Any, int]]
+Validator = Callable[[Any], bool]
+WriterSchema = Union[str, AvroSchemaTypeAlias, Mapping[str, Any]]
+
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+
+_INT_MIN, _INT_MAX = -(1 << 31), (1 << 31) - 1
+_LONG_MIN, _LONG_MAX = -(1 << 63), (1 << 63) - 1
+
+_READ_CHUNK_SIZE = 4096
+
+ITER_READ_BUFFER_SIZE = 1 << 20
+
+T = TypeVar("T")
+
+
+def write_long(datum: int, out: bytearray) -> None:
+    """Append the zig-zag varint encoding of ``datum`` to ``out``.
+
+    :param datum: Avro ``int`` or ``long`` value.
+    :type datum: int
+    :param out: Output buffer.
+    :type out: bytearray
+    """
+    datum = (datum << 1) ^ (datum >> 63)
+    if datum >> 64:
+        raise NeoGenCodecError("Value out of range for Avro long")
+    while datum & ~0x7F:
+        out.append((datum & 0x7F) | 0x80)
+        datum >>= 7
+    out.append(datum)
+
+
+def read_long(buf: Buffer, pos: int) -> tuple[int, int]:
+    """Decode a zig-zag varint from ``buf`` at ``pos``.
+
+    :param buf: Source buffer.
+    :type buf: Buffer
+    :param pos: Offset of the first byte of the value.
+    :type pos: int
+    :return: The decoded value and the offset of the next unread byte.
+    :rtype: tuple[int, int]
+    """
+    byte = buf[pos]
+    pos += 1
+    datum = byte & 0x7F
+    shift = 7
+    while byte & 0x80:
+        byte = buf[pos]
+        pos += 1
+        datum |= (byte & 0x7F) << shift
+        shift += 7
+    return (datum >> 1) ^ -(datum & 1), pos
+
+
+def _read_slice(buf: Buffer, pos: int, size: int) -> tuple[Buffer, int]:
+    end = pos + size
+    chunk = buf[pos:end]
+    if len(chunk) != size:
+        raise NeoGenCodecUnderflowError
+    return chunk, end
+
+
+def _read_sized(buf: Buffer, pos: int) -> tuple[Buffer, int]:
+    size, pos = read_long(buf, pos)
+    if size < 0:
+        raise NeoGenCodecError(f"Negative length prefix: {size}")
+    return _read_slice(buf, pos, size)
+
+
+class _Node(NamedTuple):
+    encode: Encoder
+    decode: Decoder
+    validate: Validator
+
+
+def _encode_null(datum: None, out: bytearray) -> None:
+    pass
+
+
+def _decode_null(buf: Buffer, pos: int) -> tuple[None, int]:
+    return None, pos
+
+
+def _encode_boolean(datum: bool, out: bytearray) -> None:
+    out.append(1 if datum else 0)
+
+
+def _decode_boolean(buf: Buffer, pos: int) -> tuple[bool, int]:
+    return buf[pos] == 1, pos + 1
+
+
+def _write_int(datum: int, out: bytearray) -> None:
+    if not _INT_MIN <= datum <= _INT_MAX:
+        raise NeoGenCodecError(f"Value out of range for Avro int: {datum}")
+    write_long(datum, out)
+
+
+def _encode_float(datum: float, out: bytearray) -> None:
+    try:
+        out += _FLOAT.pack(datum)
+    except OverflowError:
+        raise NeoGenCodecError(f"Value out of range for Avro float: {datum}") from None
+
+
+def _decode_float(buf: Buffer, pos: int) -> tuple[float, int]:
+    chunk, pos = _read_slice(buf, pos, 4)
+    return _FLOAT.unpack(chunk)[0], pos
+
+
+def _encode_double(datum: float, out: bytearray) -> None:
+    try:
+        out += _DOUBLE.pack(datum)
+    except OverflowError:
+        raise NeoGenCodecError(f"Value out of range for Avro double: {datum}") from None
+
+
+def _decode_double(buf: Buffer, pos: int) -> tuple[float, int]:
+    chunk, pos = _read_slice(buf, pos, 8)
+    return _DOUBLE.unpack(chunk)[0], pos
+
+
+def _encode_bytes(datum: Buffer, out: bytearray) -> None:
+    write_long(len(datum), out)
+    out += datum
+
+
+def _decode_bytes(buf: Buffer, pos: int) -> tuple[bytes, int]:
+    chunk, pos = _read_sized(buf, pos)
+    return bytes(chunk), pos
+
+
+def _encode_string(datum: str, out: bytearray) -> None:
+    data = datum.encode("utf-8")
+    write_long(len(data), out)
+    out += data
+
+
+def _decode_string(buf: Buffer, pos: int) -> tuple[str, int]:
+    chunk, pos = _read_sized(buf, pos)
+    return str(chunk, "utf-8"), pos
+
+
+def _is_int(datum: Any) -> bool:
+    return isinstance(datum, int) and not isinstance(datum, bool) and _INT_MIN <= datum <= _INT_MAX
+
+
+def _is_long(datum: Any) -> bool:
+    return isinstance(datum, int) and not isinstance(datum, bool) and _LONG_MIN <= datum <= _LONG_MAX
+
+
+def _is_float(datum: Any) -> bool:
+    return isinstance(datum, int | float) and not isinstance(datum, bool)
+
+
+def _fits(packer: struct.Struct) -> Callable[[Any], bool]:
+    def validate(datum: Any) -> bool:
+        if not _is_float(datum):
+            return False
+        try:
+            packer.pack(datum)
+        except OverflowError:
+            return False
+        return True
+
+    return validate
+
+
+_PRIMITIVE_NODES: dict[str, _Node] = {
+    "null": _Node(_encode_null, _decode_null, lambda datum: datum is None),
+    "boolean": _Node(_encode_boolean, _decode_boolean, lambda datum: isinstance(datum, bool)),
+    "int": _Node(_write_int, read_long, _is_int),
+    "long": _Node(write_long, read_long, _is_long),
+    "float": _Node(_encode_float, _decode_float, _fits(_FLOAT)),
+    "double": _Node(_encode_double, _decode_double, _fits(_DOUBLE)),
+    "bytes": _Node(_encode_bytes, _decode_bytes, lambda datum: isinstance(datum, bytes | bytearray | memoryview)),
+    "string": _Node(_encode_string, _decode_string, lambda datum: isinstance(datum, str)),
+}
+
+
+def _fullname(name: str, namespace: Optional[str]) -> str:
+    if "." in name or not namespace:
+        return name
+    return f"{namespace}.{name}"
+
+
+class _Compiler:
+    """Single use schema to closure tree compiler.
+
+    Named types are tracked by fullname so later references, and recursive
+    references, resolve to the same compiled node.
+    """
+
+    def __init__(self) -> None:
+        self.names: dict[str, _Node] = {}
+
+    def compile(self, schema: Any, namespace: Optional[str] = None) -> _Node:  # noqa: A003
+        match schema:
+            case str() if schema in _PRIMITIVE_NODES:
+                return _PRIMITIVE_NODES[schema]
+            case str():
+                try:
+                    return self.names[_fullname(schema, namespace)]
+                except KeyError:
+                    raise NeoGenCodecError(f"Unknown Avro type reference: {schema}") from None
+            case list():
+                return self._compile_union(schema, namespace)
+            case {"type": "record" | "error" | "request"}:
+                return self._compile_record(schema, namespace)
+            case {"type": "enum"}:
+                return self._compile_enum(schema, namespace)
+            case {"type": "fixed"}:
+                return self._compile_fixed(schema, namespace)
+            case {"type": "array"}:
+                return self._compile_array(schema, namespace)
+            case {"type": "map"}:
+                return self._compile_map(schema, namespace)
+            case {"type": str(type_name)}:
+                return self.compile(type_name, namespace)
+            case _:
+                raise NeoGenCodecError(f"Unsupported Avro schema: {schema!r}")
+
+    def _register(self, schema: dict[str, Any], namespace: Optional[str], node: _Node) -> tuple[str, Optional[str]]:
+        fullname = _fullname(schema["name"], schema.get("namespace", namespace))
+        self.names[fullname] = node
+        return fullname, fullname.rpartition(".")[0] or None
+
+    def _compile_record(self, schema: dict[str, Any], namespace: Optional[str]) -> _Node:
+        # Register a forwarding node first so that recursive references can be
+        # compiled before the record itself is complete.
+        cell: list[_Node] = []
+        forward = _Node(
+            lambda datum, out: cell[0].encode(datum, out),
+            lambda buf, pos: cell[0].decode(buf, pos),
+            lambda datum: cell[0].validate(datum),
+        )
+        fullname, namespace = self._register(schema, namespace, forward)
+
+        fields = tuple((field["name"], self.compile(field["type"], namespace)) for field in schema["fields"])
+        encoders = tuple((name, node.encode) for name, node in fields)
+        decoders = tuple((name, node.decode) for name, node in fields)
+        validators = tuple((name, node.validate) for name, node in fields)
+
+        def encode(datum: dict[str, Any], out: bytearray) -> None:
+            get = datum.get
+            for name, encode_field in encoders:
+                encode_field(get(name), out)
+
+        def decode(buf: Buffer, pos: int) -> tuple[dict[str, Any], int]:
+            datum: dict[str, Any] = {}
+            for name, decode_field in decoders:
+                datum[name], pos = decode_field(buf, pos)
+            return datum, pos
+
+        def validate(datum: Any) -> bool:
+            return isinstance(datum, dict) and all(
+                validate_field(datum.get(name)) for name, validate_field in validators
+            )
+
+        node = _Node(encode, decode, validate)
+        cell.append(node)
+        self.names[fullname] = node
+        return node
+
+    def _compile_enum(self, schema: dict[str, Any], namespace: Optional[str]) -> _Node:
+        symbols = tuple(schema["symbols"])
+        indexes = {symbol: index for index, symbol in enumerate(symbols)}
+        symbol_count = len(symbols)
+
+        def encode(datum: str, out: bytearray) -> None:
+            try:
+                write_long(indexes[datum], out)
+            except KeyError:
+                raise NeoGenCodecError(f"Unknown enum symbol: {datum!r}") from None
+
+        def decode(buf: Buffer, pos: int) -> tuple[str, int]:
+            index, pos = read_long(buf, pos)
+            if not 0 <= index < symbol_count:
+                raise NeoGenCodecError(f"Enum index out of range: {index}")
+            return symbols[index], pos
+
+        node = _Node(encode, decode, lambda datum: isinstance(datum, str) and datum in indexes)
+        self._register(schema, namespace, node)
+        return node
+
+    def _compile_fixed(self, schema: dict[str, Any], namespace: Optional[str]) -> _Node:
+        size: int = schema["size"]
+
+        def encode(datum: Union[Buffer, str], out: bytearray) -> None:
+            if isinstance(datum, str):
+                datum = datum.encode("utf-8")
+            if len(datum) != size:
+                raise NeoGenCodecError(f"Fixed value must be {size} bytes, got {len(datum)}")
+            out += datum
+
+        def decode(buf: Buffer, pos: int) -> tuple[bytes, int]:
+            chunk, pos = _read_slice(buf, pos, size)
+            return bytes(chunk), pos
+
+        def validate(datum: Any) -> bool:
+            return isinstance(datum, bytes | bytearray | memoryview | str) and len(datum) == size
+
+        node = _Node(encode, decode, validate)
+        self._register(schema, namespace, node)
+        return node
+
+    def _compile_array(self, schema: dict[str, Any], namespace: Optional[str]) -> _Node:
+        items = self.compile(schema["items"], namespace)
+        encode_item, decode_item, validate_item = items
+
+        def encode(datum: list[Any], out: bytearray) -> None:
+            if datum:
+                write_long(len(datum), out)
+                for item in datum:
+                    encode_item(item, out)
+            out.append(0)
+
+        def decode(buf: Buffer, pos: int) -> tuple[list[Any], int]:
+            datum: list[Any] = []
+            append = datum.append
+            count, pos = read_long(buf, pos)
+            while count:
+                if count < 0:
+                    count = -count
+                    _, pos = read_long(buf, pos)
+                for _ in range(count):
+                    item, pos = decode_item(buf, pos)
+                    append(item)
+                count, pos = read_long(buf, pos)
+            return datum, pos
+
+        def validate(datum: Any) -> bool:
+            return isinstance(datum, list | tuple) and all(map(validate_item, datum))
+
+        return _Node(encode, decode, validate)
+
+    def _compile_map(self, schema: dict[str, Any], namespace: Optional[str]) -> _Node:
+        values = self.compile(schema["values"], namespace)
+        encode_value, decode_value, validate_value = values
+
+        def encode(datum: dict[str, Any], out: bytearray) -> None:
+            if datum:
+                write_long(len(datum), out)
+                for key, value in datum.items():
+                    _encode_string(key, out)
+                    encode_value(value, out)
+            out.append(0)
+
+        def decode(buf: Buffer, pos: int) -> tuple[dict[str, Any], int]:
+            datum: dict[str, Any] = {}
+            count, pos = read_long(buf, pos)
+            while count:
+                if count < 0:
+                    count = -count
+                    _, pos = read_long(buf, pos)
+                for _ in range(count):
+                    key, pos = _decode_string(buf, pos)
+                    datum[key], pos = decode_value(buf, pos)
+                count, pos = read_long(buf, pos)
+            return datum, pos
+
+        def validate(datum: Any) -> bool:
+            return isinstance(datum, dict) and all(
+                isinstance(key, str) and validate_value(value) for key, value in datum.items()
+            )
+
+        return _Node(encode, decode, validate)
+
+    def _compile_union(self, schema: list[Any], namespace: Optional[str]) -> _Node:
+        branches = tuple(self.compile(branch, namespace) for branch in schema)
+        candidates = tuple((index, node.validate, node.encode) for index, node in enumerate(branches))
+        decoders = tuple(node.decode for node in branches)
+        branch_count = len(branches)
+
+        def encode(datum: Any, out: bytearray) -> None:
+            # First matching branch wins, as with the reference implementation.
+            for index, validate_branch, encode_branch in candidates:
+                if validate_branch(datum):
+                    write_long(index, out)
+                    encode_branch(datum, out)
+                    return
+            raise NeoGenCodecError(f"Datum does not match any union branch: {datum!r}")
+
+        def decode(buf: Buffer, pos: int) -> tuple[Any, int]:
+            index, pos = read_long(buf, pos)
+            if not 0 <= index < branch_count:
+                raise NeoGenCodecError(f"Union index out of range: {index}")
+            return decoders[index](buf, pos)
+
+        def validate(datum: Any) -> bool:
+            return any(validate_branch(datum) for _, validate_branch, _ in candidates)
+
+        return _Node(encode, decode, validate)
+
+
+def _promote(decode: Decoder, cast: Callable[[Any], Any]) -> Decoder:
+    def promote(buf: Buffer, pos: int) -> tuple[Any, int]:
+        datum, pos = decode(buf, pos)
+        return cast(datum), pos
+
+    return promote
+
+
+_PROMOTIONS: dict[tuple[str, str], Decoder] = {
+    ("int", "long"): read_long,
+    ("int", "float"): _promote(read_long, float),
+    ("int", "double"): _promote(read_long, float),
+    ("long", "float"): _promote(read_long, float),
+    ("long", "double"): _promote(read_long, float),
+    ("float", "double"): _decode_float,
+    ("string", "bytes"): _decode_bytes,
+    ("bytes", "string"): _decode_string,
+}
+
+
+def _skip_long(buf: Buffer, pos: int) -> tuple[None, int]:
+    while buf[pos] & 0x80:
+        pos += 1
+    return None, pos + 1
+
+
+def _skip_sized(buf: Buffer, pos: int) -> tuple[None, int]:
+    size, pos = read_long(buf, pos)
+    if size < 0:
+        raise NeoGenCodecError(f"Negative length prefix: {size}")
+    end = pos + size
+    if size:
+        # Touch the last byte so truncated data underflows, as decoding would.
+        buf[end - 1]
+    return None, end
+
+
+def _skip_fixed(size: int) -> Decoder:
+    def skip(buf: Buffer, pos: int) -> tuple[None, int]:
+        end = pos + size
+        if size:
+            buf[end - 1]
+        return None, end
+
+    return skip
+
+
+def _skip_blocks(skip_item: Decoder, item_size: Optional[int] = None) -> Decoder:
+    """Skip array or map blocks.
+
+    Blocks prefixed with their size in bytes, and blocks of fixed size items,
+    are jumped over without looking at the items.
+    """
+
+    def skip(buf: Buffer, pos: int) -> tuple[None, int]:
+        count, pos = read_long(buf, pos)
+        while count:
+            if count < 0:
+                _, pos = _skip_sized(buf, pos)
+            elif item_size is not None:
+                pos += count * item_size
+                if item_size:
+                    buf[pos - 1]
+            else:
+                for _ in range(count):
+                    _, pos = skip_item(buf, pos)
+            count, pos = read_long(buf, pos)
+        return None, pos
+
+    return skip
+
+
+def _skip_sequence(skips: list[Decoder]) -> Decoder:
+    if len(skips) == 1:
+        return skips[0]
+
+    def skip(buf: Buffer, pos: int) -> tuple[None, int]:
+        for skip_item in skips:
+            _, pos = skip_item(buf, pos)
+        return None, pos
+
+    return skip
+
+
+_PRIMITIVE_SKIPS: dict[str, Decoder] = {
+    "null": _decode_null,
+    "boolean": _skip_fixed(1),
+    "int": _skip_long,
+    "long": _skip_long,
+    "float": _skip_fixed(4),
+    "double": _skip_fixed(8),
+    "bytes": _skip_sized,
+    "string": _skip_sized,
+}
+
+_PRIMITIVE_SIZES: dict[str, int] = {"null": 0, "boolean": 1, "float": 4, "double": 8}
+
+_NamedSchemas = dict[str, tuple[dict[str, Any], Optional[str]]]
+
+
+def _index_names(schema: Any, namespace: Optional[str], names: _NamedSchemas) -> None:
+    """Index the named types defined in ``schema`` by fullname."""
+    match schema:
+        case list():
+            for branch in schema:
+                _index_names(branch, namespace, names)
+        case {"type": "record" | "error" | "request" | "enum" | "fixed", "name": str(name)}:
+            fullname = _fullname(name, schema.get("namespace", namespace))
+            namespace = fullname.rpartition(".")[0] or None
+            names[fullname] = (schema, namespace)
+            for field in schema.get("fields", ()):
+                _index_names(field["type"], namespace, names)
+        case {"type": "array"}:
+            _index_names(schema["items"], namespace, names)
+        case {"type": "map"}:
+            _index_names(schema["values"], namespace, names)
+        case {"type": dict() | list() as type_schema}:
+            _index_names(type_schema, namespace, names)
+
+
+def _deref(schema: Any, namespace: Optional[str], names: _NamedSchemas) -> tuple[Any, Optional[str]]:
+    """Resolve name references and nested type objects to a definition."""
+    match schema:
+        case str() if schema not in _PRIMITIVE_NODES:
+            try:
+                return names[_fullname(schema, namespace)]
+            except KeyError:
+                raise NeoGenCodecError(f"Unknown Avro type reference: {schema}") from None
+        case {"type": "record" | "error" | "request" | "enum" | "fixed", "name": str(name)}:
+            return names[_fullname(name, schema.get("namespace", namespace))]
+        case {"type": "array" | "map"}:
+            return schema, namespace
+        case {"type": type_schema}:
+            return _deref(type_schema, namespace, names)
+    return schema, namespace
+
+
+def _type_name(schema: Any) -> str:
+    match schema:
+        case str():
+            return schema
+        case list():
+            return "union"
+        case {"type": "error" | "request"}:
+            return "record"
+    return schema["type"]
+
+
+def _names_match(writer: dict[str, Any], writer_namespace: Optional[str], reader: dict[str, Any]) -> bool:
+    writer_fullname = _fullname(writer["name"], writer_namespace)
+    return writer_fullname.rpartition(".")[2] == reader["name"].rpartition(".")[2] or any(
+        _fullname(alias, reader.get("namespace")) == writer_fullname for alias in reader.get("aliases", ())
+    )
+
+
+class _Resolver:
+    """Single use compiler of decoders reading writer schema data as a reader schema.
+
+    Resolution follows the Avro specification: record fields are matched by
+    name or alias, reader fields missing from the writer take their default,
+    writer fields missing from the reader are skipped, enum symbols missing
+    from the reader take the reader's default, and numeric, string and bytes
+    values are promoted. Unions are resolved branch by branch, a writer
+    branch with no match in the reader only fails if it is actually read.
+    """
+
+    def __init__(self, writer_schema: Any, reader_schema: Any) -> None:
+        self.writer = _Compiler()
+        self.writer_names: _NamedSchemas = {}
+        self.reader_names: _NamedSchemas = {}
+        _index_names(writer_schema, None, self.writer_names)
+        _index_names(reader_schema, None, self.reader_names)
+        self.resolved: dict[tuple[str, str], Decoder] = {}
+        self.skipped: dict[str, Decoder] = {}
+
+    def project(self, writer: Any, reader: Any, fields: Iterable[str]) -> Decoder:
+        """Resolve a record, decoding only ``fields`` and skipping the rest."""
+        writer, writer_namespace = _deref(writer, None, self.writer_names)
+        reader, reader_namespace = _deref(reader, None, self.reader_names)
+        if _type_name(writer) != "record" or _type_name(reader) != "record":
+            raise NeoGenCodecError(f"Only records can be projected: {reader!r}")
+
+        projection = frozenset(fields)
+        unknown = projection.difference(field["name"] for field in reader["fields"])
+        if unknown:
+            raise NeoGenCodecError(f"Unknown fields in projection: {', '.join(sorted(unknown))}")
+        return self._resolve_record(writer, writer_namespace, reader, reader_namespace, projection)
+
+    def lazy(self, schema: Any) -> Decoder:
+        """Compile a decoder which copies out a record and defers decoding its fields."""
+        record, namespace = _deref(schema, None, self.writer_names)
+        if _type_name(record) != "record":
+            raise NeoGenCodecError(f"Only records can be decoded lazily: {record!r}")
+
+        layout = _LazyLayout(
+            {field["name"]: index for index, field in enumerate(record["fields"])},
+            tuple(self.resolve(field["type"], namespace, field["type"], namespace) for field in record["fields"]),
+            tuple(self.skip(field["type"], namespace) for field in record["fields"]),
+        )
+        skip = self.skip(record, namespace)
+
+        def decode(buf: Buffer, pos: int) -> tuple[LazyDatum, int]:
+            _, end = skip(buf, pos)
+            return LazyDatum(schema, bytes(buf[pos:end]), layout), end
+
+        return decode
+
+    def skip(self, writer: Any, writer_namespace: Optional[str]) -> Decoder:
+        """Compile a decoder which advances over a datum without building it."""
+        writer, writer_namespace = _deref(writer, writer_namespace, self.writer_names)
+        match _type_name(writer):
+            case "union":
+                return self._skip_union(writer, writer_namespace)
+            case "record":
+                return self._skip_record(writer, writer_namespace)
+            case "enum":
+                return _skip_long
+            case "fixed":
+                return _skip_fixed(writer["size"])
+            case "array":
+                items, items_namespace = _deref(writer["items"], writer_namespace, self.writer_names)
+                if isinstance(items, str) and items in _PRIMITIVE_SIZES:
+                    return _skip_blocks(_PRIMITIVE_SKIPS[items], _PRIMITIVE_SIZES[items])
+                if _type_name(items) == "fixed":
+                    return _skip_blocks(_skip_fixed(items["size"]), items["size"])
+                return _skip_blocks(self.skip(items, items_namespace))
+            case "map":
+                skip_value = self.skip(writer["values"], writer_namespace)
+
+                def skip_entry(buf: Buffer, pos: int) -> tuple[None, int]:
+                    _, pos = _skip_sized(buf, pos)
+                    return skip_value(buf, pos)
+
+                return _skip_blocks(skip_entry)
+            case type_name if type_name in _PRIMITIVE_SKIPS:
+                return _PRIMITIVE_SKIPS[type_name]
+        raise NeoGenCodecError(f"Unsupported Avro schema: {writer!r}")
+
+    def _skip_union(self, writer: list[Any], writer_namespace: Optional[str]) -> Decoder:
+        skips = [self.skip(branch, writer_namespace) for branch in writer]
+        branch_count = len(skips)
+
+        def skip(buf: Buffer, pos: int) -> tuple[None, int]:
+            index, pos = read_long(buf, pos)
+            if not 0 <= index < branch_count:
+                raise NeoGenCodecError(f"Union index out of range: {index}")
+            return skips[index](buf, pos)
+
+        return skip
+
+    def _skip_record(self, writer: dict[str, Any], writer_namespace: Optional[str]) -> Decoder:
+        fullname = _fullname(writer["name"], writer_namespace)
+        if fullname in self.skipped:
+            return self.skipped[fullname]
+
+        cell: list[Decoder] = []
+        self.skipped[fullname] = lambda buf, pos: cell[0](buf, pos)
+        skip = _skip_sequence([self.skip(field["type"], writer_namespace) for field in writer["fields"]])
+        cell.append(skip)
+        self.skipped[fullname] = skip
+        return skip
+
+    def resolve(
+        self, writer: Any, writer_namespace: Optional[str], reader: Any, reader_namespace: Optional[str]
+    ) -> Decoder:
+        writer, writer_namespace = _deref(writer, writer_namespace, self.writer_names)
+        reader, reader_namespace = _deref(reader, reader_namespace, self.reader_names)
+        writer_type, reader_type = _type_name(writer), _type_name(reader)
+
+        if writer_type == "union":
+            return self._resolve_writer_union(writer, writer_namespace, reader, reader_namespace)
+
+        if reader_type == "union":
+            for branch in reader:
+                try:
+                    return self.resolve(writer, writer_namespace, branch, reader_namespace)
+                except NeoGenCodecError:
+                    continue
+
+        elif writer_type in _PRIMITIVE_NODES:
+            if writer_type == reader_type:
+                return _PRIMITIVE_NODES[writer_type].decode
+            if (writer_type, reader_type) in _PROMOTIONS:
+                return _PROMOTIONS[writer_type, reader_type]
+
+        elif writer_type == reader_type == "array":
+            return self._resolve_array(writer, writer_namespace, reader, reader_namespace)
+
+        elif writer_type == reader_type == "map":
+            return self._resolve_map(writer, writer_namespace, reader, reader_namespace)
+
+        elif writer_type == reader_type and _names_match(writer, writer_namespace, reader):
+            if writer_type == "record":
+                return self._resolve_record(writer, writer_namespace, reader, reader_namespace)
+            if writer_type == "enum":
+                return self._resolve_enum(writer, reader)
+            if writer_type == "fixed" and writer["size"] == reader["size"]:
+                return self.writer.compile(writer, writer_namespace).decode
+
+        raise NeoGenCodecError(f"Writer schema {writer!r} can not be read as reader schema {reader!r}")
+
+    def _resolve_writer_union(
+        self, writer: list[Any], writer_namespace: Optional[str], reader: Any, reader_namespace: Optional[str]
+    ) -> Decoder:
+        def unresolved(error: NeoGenCodecError) -> Decoder:
+            def decode(buf: Buffer, pos: int) -> tuple[Any, int]:
+                raise error
+
+            return decode
+
+        decoders = []
+        for branch in writer:
+            try:
+                decoders.append(self.resolve(branch, writer_namespace, reader, reader_namespace))
+            except NeoGenCodecError as error:
+                decoders.append(unresolved(error))
+        branch_count = len(decoders)
+
+        def decode(buf: Buffer, pos: int) -> tuple[Any, int]:
+            index, pos = read_long(buf, pos)
+            if not 0 <= index < branch_count:
+                raise NeoGenCodecError(f"Union index out of range: {index}")
+            return decoders[index](buf, pos)
+
+        return decode
+
+    def _resolve_array(
+        self, writer: dict[str, Any], writer_namespace: Optional[str], reader: Any, reader_namespace: Optional[str]
+    ) -> Decoder:
+        decode_item = self.resolve(writer["items"], writer_namespace, reader["items"], reader_namespace)
+
+        def decode(buf: Buffer, pos: int) -> tuple[list[Any], int]:
+            datum: list[Any] = []
+            append = datum.append
+            count, pos = read_long(buf, pos)
+            while count:
+                if count < 0:
+                    count = -count
+                    _, pos = read_long(buf, pos)
+                for _ in range(count):
+                    item, pos = decode_item(buf, pos)
+                    append(item)
+                count, pos = read_long(buf, pos)
+            return datum, pos
+
+        return decode
+
+    def _resolve_map(
+        self, writer: dict[str, Any], writer_namespace: Optional[str], reader: Any, reader_namespace: Optional[str]
+    ) -> Decoder:
+        decode_value = self.resolve(writer["values"], writer_namespace, reader["values"], reader_namespace)
+
+        def decode(buf: Buffer, pos: int) -> tuple[dict[str, Any], int]:
+            datum: dict[str, Any] = {}
+            count, pos = read_long(buf, pos)
+            while count:
+                if count < 0:
+                    count = -count
+                    _, pos = read_long(buf, pos)
+                for _ in range(count):
+                    key, pos = _decode_string(buf, pos)
+                    datum[key], pos = decode_value(buf, pos)
+                count, pos = read_long(buf, pos)
+            return datum, pos
+
+        return decode
+
+    def _resolve_record(
+        self,
+        writer: dict[str, Any],
+        writer_namespace: Optional[str],
+        reader: dict[str, Any],
+        reader_namespace: Optional[str],
+        projection: Optional[frozenset[str]] = None,
+    ) -> Decoder:
+        key = (_fullname(writer["name"], writer_namespace), _fullname(reader["name"], reader_namespace))
+        if projection is None and key in self.resolved:
+            return self.resolved[key]
+
+        # Register a forwarding decoder first so that recursive references can
+        # be resolved before the record itself is complete. Projections only
+        # apply at the top level so are never referenced recursively.
+        cell: list[Decoder] = []
+        if projection is None:
+            self.resolved[key] = lambda buf, pos: cell[0](buf, pos)
+
+        reader_fields = {
+            field["name"]: field for field in reader["fields"] if projection is None or field["name"] in projection
+        }
+        for field in list(reader_fields.values()):
+            for alias in field.get("aliases", ()):
+                reader_fields.setdefault(alias, field)
+
+        steps: list[tuple[Optional[str], Decoder]] = []
+        matched = set()
+        skips: list[Decoder] = []
+        for writer_field in writer["fields"]:
+            reader_field = reader_fields.get(writer_field["name"])
+            if reader_field is None:
+                skips.append(self.skip(writer_field["type"], writer_namespace))
+                continue
+            if skips:
+                steps.append((None, _skip_sequence(skips)))
+                skips = []
+            matched.add(reader_field["name"])
+            steps.append(
+                (
+                    reader_field["name"],
+                    self.resolve(writer_field["type"], writer_namespace, reader_field["type"], reader_namespace),
+                )
+            )
+        if skips:
+            steps.append((None, _skip_sequence(skips)))
+
+        defaults: list[tuple[str, Any]] = []
+        for field in reader["fields"]:
+            if field["name"] in matched or projection is not None and field["name"] not in projection:
+                continue
+            if "default" not in field:
+                raise NeoGenCodecError(f"Reader field {field['name']!r} is missing from writer and has no default")
+            defaults.append((field["name"], self._default_datum(field["type"], reader_namespace, field["default"])))
+
+        def decode(buf: Buffer, pos: int) -> tuple[dict[str, Any], int]:
+            datum: dict[str, Any] = {}
+            for name, decode_field in steps:
+                value, pos = decode_field(buf, pos)
+                if name is not None:
+                    datum[name] = value
+            for name, default in defaults:
+                datum[name] = deepcopy(default) if isinstance(default, dict | list) else default
+            return datum, pos
+
+        cell.append(decode)
+        if projection is None:
+            self.resolved[key] = decode
+        return decode
+
+    def _resolve_enum(self, writer: dict[str, Any], reader: dict[str, Any]) -> Decoder:
+        reader_symbols = set(reader["symbols"])
+        default = reader.get("default")
+        symbols = tuple(symbol if symbol in reader_symbols else default for symbol in writer["symbols"])
+        symbol_count = len(symbols)
+
+        def decode(buf: Buffer, pos: int) -> tuple[str, int]:
+            index, pos = read_long(buf, pos)
+            if not 0 <= index < symbol_count:
+                raise NeoGenCodecError(f"Enum index out of range: {index}")
+            symbol = symbols[index]
+            if symbol is None:
+                raise NeoGenCodecError(f"Enum symbol {writer['symbols'][index]!r} is unknown to the reader")
+            return symbol, pos
+
+        return decode
+
+    def _default_datum(self, schema: Any, namespace: Optional[str], default: Any) -> Any:
+        """Convert a JSON encoded field default to a datum of ``schema``."""
+        schema, namespace = _deref(schema, namespace, self.reader_names)
+        match _type_name(schema):
+            case "union":
+                return self._default_datum(schema[0], namespace, default)
+            case "record":
+                return {
+                    field["name"]: self._default_datum(
+                        field["type"], namespace, default.get(field["name"], field.get("default"))
+                    )
+                    for field in schema["fields"]
+                }
+            case "array":
+                return [self._default_datum(schema["items"], namespace, item) for item in default]
+            case "map":
+                return {key: self._default_datum(schema["values"], namespace, value) for key, value in default.items()}
+            case "bytes" | "fixed":
+                return default.encode("latin-1") if isinstance(default, str) else default
+            case "float" | "double":
+                return float(default)
+        return default
+
+
+def _encode_projection(datum: Any, out: bytearray) -> None:
+    raise NeoGenCodecError("Projected datums can not be encoded")
+
+
+class _LazyLayout(NamedTuple):
+    indexes: dict[str, int]
+    decoders: tuple[Decoder, ...]
+    skips: tuple[Decoder, ...]
+
+
+class LazyDatum(Mapping[str, Any]):
+    """Record datum which decodes each field from the encoded record on first access.
+
+    Field offsets are found on demand, by skipping over the fields before the
+    one accessed, and decoded values are cached. Assigning a field marks the
+    datum as modified, as does handing out a decoded record, array or map
+    value, which could be modified in place. Unmodified datums are written
+    back as their original bytes, see :meth:`BinaryCodec.encode_object_into`.
+
+    :param schema: Record schema the datum was encoded with.
+    :type schema: Any
+    :param raw: Encoded record.
+    :type raw: bytes
+    """
+
+    __slots__ = ("schema", "raw", "modified", "_layout", "_offsets", "_values")
+
+    def __init__(self, schema: Any, raw: bytes, layout: _LazyLayout) -> None:
+        """Initialize :class:`LazyDatum`."""
+        self.schema = schema
+        self.raw = raw
+        self.modified = False
+        self._layout = layout
+        self._offsets = [0]
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        """Field value, decoded on first access."""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        index = self._layout.indexes[name]
+        offsets = self._offsets
+        try:
+            while len(offsets) <= index:
+                _, pos = self._layout.skips[len(offsets) - 1](self.raw, offsets[-1])
+                offsets.append(pos)
+            value, _ = self._layout.decoders[index](self.raw, offsets[index])
+        except IndexError as err:
+            raise NeoGenCodecUnderflowError from err
+        except (UnicodeDecodeError, struct.error) as err:
+            raise NeoGenCodecError from err
+
+        if isinstance(value, dict | list):
+            self.modified = True
+        self._values[name] = value
+        return value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        """Assign a field value, marking the datum as modified."""
+        self._values[name] = value
+        self.modified = True
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names, in schema order."""
+        return iter(self._layout.indexes)
+
+    def __len__(self) -> int:
+        """Number of fields."""
+        return len(self._layout.indexes)
+
+
+class _StreamBuffer:
+    """Index an unseekable byte stream as though it were a buffer.
+
+    Bytes are pulled from the stream only as far as the decoder indexes, so
+    nothing past the end of the datum is consumed.
+    """
+
+    __slots__ = ("_source", "_data")
+
+    def __init__(self, source: BufferedIOBase) -> None:
+        self._source = source
+        self._data = bytearray()
+
+    def _fill(self, size: int) -> None:
+        while len(self._data) < size:
+            chunk = self._source.read(size - len(self._data))
+            if not chunk:
+                return
+            self._data += chunk
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            self._fill(key.stop)
+            return bytes(self._data[key])
+        self._fill(key + 1)
+        return self._data[key]
+
+
+def iter_decode(
+    source: BufferedIOBase, decode: Callable[[Buffer, int], tuple[T, int]], buffer_size: int = ITER_READ_BUFFER_SIZE
+) -> Iterator[T]:
+    """Decode consecutive datums from a byte stream until it ends.
+
+    ``source`` is read ``buffer_size`` bytes at a time, and datums are decoded
+    from the buffered bytes, so reading costs one call per chunk rather than
+    per datum. At most one chunk and the bytes of one partially read datum are
+    held at a time, however long the stream. Seekable streams are left
+    positioned after the last datum yielded, when the iterator is exhausted
+    or closed.
+
+    :param source: Stream positioned at the start of an encoded datum.
+    :type source: BufferedIOBase
+    :param decode: Decoder of a single datum at an offset in a buffer,
+        returning the datum and the offset of the first byte after it. It
+        must raise :class:`NeoGenCodecUnderflowError` if the buffer ends
+        within the datum.
+    :type decode: Callable[[Buffer, int], tuple[T, int]]
+    :param buffer_size: Number of bytes to read from ``source`` at a time.
+    :type buffer_size: int
+    :return: Lazy iterator over the decoded datums.
+    :rtype: Iterator[T]
+    :raises NeoGenCodecUnderflowError: If ``source`` ends within a datum.
+    """
+    start = source.tell() if source.seekable() else None
+    consumed = pos = 0
+    data = b""
+    try:
+        while True:
+            if pos == len(data):
+                consumed += pos
+                data = source.read(buffer_size)
+                pos = 0
+                if not data:
+                    return
+            try:
+                datum, pos = decode(data, pos)
+            except NeoGenCodecUnderflowError:
+                chunk = source.read(max(buffer_size, len(data) - pos))
+                if not chunk:
+                    raise
+                consumed += pos
+                data = data[pos:] + chunk
+                pos = 0
+                continue
+            yield datum
+    finally:
+        if start is not None:
+            source.seek(start + consumed + pos)
+
+
+class BinaryCodec:
+    """Avro binary encoder and decoder specialized to a single schema.
+
+    :param schema: Avro schema as decoded JSON, usually the
+        ``__canonical_schema__`` of a generated class.
+    :type schema: Union[AvroSchemaTypeAlias, Mapping[str, Any]]
+    :param writer_schema: Schema the data to decode was written with, as
+        decoded JSON, defaults to ``schema``. When provided, datums are
+        decoded by resolving ``writer_schema`` against ``schema``.
+    :type writer_schema: Optional[Union[AvroSchemaTypeAlias, Mapping[str, Any]]]
+    :param fields: Record fields to decode, defaults to all. Other fields are
+        skipped over without being decoded, and are missing from decoded
+        datums. Codecs with ``fields`` can not encode.
+    :type fields: Optional[Iterable[str]]
+    :param lazy: Decode records as :class:`LazyDatum`, which decode their
+        fields on first access, defaults to `False`. Ignored when resolving
+        ``writer_schema`` or decoding ``fields``.
+    :type lazy: bool
+    :raises NeoGenCodecError: If the schema cannot be compiled, if
+        ``writer_schema`` can not be resolved against it, if ``fields``
+        are not fields of the record schema, or if ``lazy`` is set for a
+        schema which is not a record.
+
+    .. note:: Union values are written against the first branch which
+        accepts them.
+    """
+
+    __slots__ = ("schema", "writer_schema", "fields", "_encode", "_decode", "_validate")
+
+    def __init__(
+        self,
+        schema: Union[AvroSchemaTypeAlias, Mapping[str, Any]],
+        writer_schema: Optional[Union[AvroSchemaTypeAlias, Mapping[str, Any]]] = None,
+        fields: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+    ) -> None:
+        """Initialize :class:`BinaryCodec`."""
+        self.schema = schema
+        self.writer_schema = schema if writer_schema is None else writer_schema
+        self.fields = None if fields is None else tuple(fields)
+        self._encode, self._decode, self._validate = _Compiler().compile(schema)
+        if self.fields is not None:
+            self._encode = _encode_projection
+            self._decode = _Resolver(self.writer_schema, schema).project(self.writer_schema, schema, self.fields)
+        elif writer_schema is not None:
+            self._decode = _Resolver(writer_schema, schema).resolve(writer_schema, None, schema, None)
+        elif lazy:
+            self._decode = _Resolver(schema, schema).lazy(schema)
+
+    def validate(self, datum: Any) -> bool:
+        """Check that ``datum`` can be encoded with this codec's schema."""
+        return self._validate(datum)
+
+    def encode(self, datum: Any) -> bytes:
+        """Encode ``datum`` as Avro binary.
+
+        :raises NeoGenCodecError: If ``datum`` does not match the schema.
+        """
+        out = bytearray()
+        self.encode_into(datum, out)
+        return bytes(out)
+
+    def encode_into(self, datum: Any, out: bytearray) -> None:
+        """Append the Avro binary encoding of ``datum`` to ``out``.
+
+        :raises NeoGenCodecError: If ``datum`` does not match the schema.
+        """
+        try:
+            self._encode(datum, out)
+        except (AttributeError, KeyError, TypeError, ValueError, struct.error) as err:
+            raise NeoGenCodecError(f"Datum does not match schema: {datum!r}") from err
+
+    def encode_object_into(self, schema_object: "AbstractNeoGenObject", out: bytearray) -> None:
+        """Append the Avro binary encoding of a generated class instance to ``out``.
+
+        Lazy records which are unmodified since they were decoded with this
+        codec's schema are copied through as their original bytes, rather
+        than decoded and encoded again.
+
+        :raises NeoGenCodecError: If the instance does not match the schema.
+        """
+        lazy_datum = getattr(schema_object, "_lazy_datum", None)
+        if (
+            lazy_datum is not None
+            and not lazy_datum.modified
+            and lazy_datum.schema is self.schema
+            and self.fields is None
+        ):
+            out += lazy_datum.raw
+        else:
+            self.encode_into(schema_object.encode(), out)
+
+    def decode(self, buf: Buffer, pos: int = 0) -> tuple[Any, int]:
+        """Decode a single datum from ``buf`` starting at ``pos``.
+
+        :return: The decoded datum and the offset of the first unread byte.
+        :rtype: tuple[Any, int]
+        :raises NeoGenCodecUnderflowError: If ``buf`` ends before the datum.
+        :raises NeoGenCodecError: If the bytes are not a valid encoding.
+        """
+        try:
+            return self._decode(buf, pos)
+        except IndexError as err:
+            raise NeoGenCodecUnderflowError from err
+        except (UnicodeDecodeError, struct.error) as err:
+            raise NeoGenCodecError from err
+
+    def read(self, source: BufferedIOBase) -> Any:
+        """Decode a single datum from a byte stream.
+
+        Exactly the bytes of the datum are consumed from ``source``.
+        """
+        if not source.seekable():
+            datum, _ = self.decode(_StreamBuffer(source))  # type: ignore
+            return datum
+
+        start = source.tell()
+        data = source.read(_READ_CHUNK_SIZE)
+        while True:
+            try:
+                datum, end = self.decode(data)
+                break
+            except NeoGenCodecUnderflowError:
+                chunk = source.read(max(len(data), _READ_CHUNK_SIZE))
+                if not chunk:
+                    raise
+                data += chunk
+        source.seek(start + end)
+        return datum
+
+    def read_many(self, source: BufferedIOBase, count: Optional[int] = None) -> list[Any]:
+        """Decode consecutive datums from a byte stream.
+
+        :param count: Number of datums to decode, defaults to decoding until
+            the end of ``source``.
+        :type count: Optional[int]
+        :raises NeoGenCodecUnderflowError: If ``source`` ends within a datum,
+            or before ``count`` datums.
+        """
+        datums: list[Any] = []
+        append = datums.append
+
+        if not source.seekable():
+            buf: Any = _StreamBuffer(source) if count is not None else source.read()
+            pos = 0
+            while len(datums) != count and (count is not None or pos < len(buf)):
+                datum, pos = self.decode(buf, pos)
+                append(datum)
+            return datums
+
+        start = source.tell()
+        consumed = pos = 0
+        data = b""
+        while len(datums) != count:
+            try:
+                datum, pos = self.decode(data, pos)
+            except NeoGenCodecUnderflowError:
+                chunk = source.read(max(len(data) - pos, _READ_CHUNK_SIZE))
+                if not chunk:
+                    if count is None and pos == len(data):
+                        break
+                    raise
+                consumed += pos
+                data = data[pos:] + chunk
+                pos = 0
+                continue
+            append(datum)
+        source.seek(start + consumed + pos)
+        return datums
+
+    def iter_read(self, source: BufferedIOBase, buffer_size: int = ITER_READ_BUFFER_SIZE) -> Iterator[Any]:
+        """Decode consecutive datums from a byte stream until it ends, see :func:`iter_decode`."""
+        return iter_decode(source, self.decode, buffer_size)
+
+    def write(self, datum: Any, target: BufferedIOBase) -> None:
+        """Encode a single datum onto a byte stream."""
+        out = bytearray()
+        self.encode_into(datum, out)
+        target.write(out)
+
+    def write_many(self, datums: Iterable[Any], target: BufferedIOBase) -> None:
+        """Encode consecutive datums onto a byte stream with a single write."""
+        out = bytearray()
+        for datum in datums:
+            self.encode_into(datum, out)
+        target.write(out)
+
+
+_binary_codecs: "WeakKeyDictionary[type, BinaryCodec]" = WeakKeyDictionary()
+_resolving_binary_codecs: "WeakKeyDictionary[type, dict[bytes, BinaryCodec]]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=256)
+def writer_schema_fingerprint(writer_schema: str) -> bytes:
+    """CRC-64-AVRO fingerprint of a writer schema given as JSON text.
+
+    Fingerprints are memoized on the schema text, so readers passing the same
+    writer schema on every call only canonicalize it once.
+
+    :param writer_schema: Writer schema JSON.
+    :type writer_schema: str
+    :return: Fingerprint, 8 bytes little-endian.
+    :rtype: bytes
+    """
+    return fingerprint64(parsing_canonical_form(writer_schema))
+
+
+def get_binary_codec(
+    schema_type: Type["AbstractNeoGenObject"], writer_schema: Optional[WriterSchema] = None
+) -> BinaryCodec:
+    """Fetch the compiled codec for a generated class, compiling on first use.
+
+    Resolving codecs are compiled once per writer schema fingerprint and
+    generated class, a writer schema with the same Parsing Canonical Form as
+    the class's own schema gets the plain codec. Codecs for record
+    projections, see :meth:`NeoGenRecord.projection`, only decode the
+    projected fields, and codecs for lazy records, see
+    :meth:`NeoGenRecord.lazy`, decode :class:`LazyDatum`.
+
+    :param schema_type: Generated class.
+    :type schema_type: Type[AbstractNeoGenObject]
+    :param writer_schema: Schema the data to decode was written with, as JSON
+        text or decoded JSON, defaults to the schema of ``schema_type``.
+    :type writer_schema: Optional[WriterSchema]
+    :return: Codec for ``schema_type.__canonical_schema__``.
+    :rtype: BinaryCodec
+    :raises NeoGenCodecError: If ``writer_schema`` can not be resolved
+        against the schema of ``schema_type``.
+    """
+    if writer_schema is None:
+        try:
+            return _binary_codecs[schema_type]
+        except KeyError:
+            codec = _binary_codecs[schema_type] = BinaryCodec(
+                schema_type.__canonical_schema__,
+                fields=getattr(schema_type, "__projection__", None),
+                lazy=getattr(schema_type, "__lazy__", False),
+            )
+            return codec
+
+    if not isinstance(writer_schema, str):
+        writer_schema = json.dumps(writer_schema)
+    return get_resolving_binary_codec(schema_type, writer_schema_fingerprint(writer_schema), writer_schema)
+
+
+def get_resolving_binary_codec(
+    schema_type: Type["AbstractNeoGenObject"], fingerprint: bytes, writer_schema: WriterSchema
+) -> BinaryCodec:
+    """Fetch the codec resolving a writer schema whose fingerprint is known.
+
+    Used when the fingerprint comes with the data, as in single object
+    encoding, so the writer schema is only canonicalized if no codec has been
+    compiled for it yet.
+
+    :param schema_type: Generated class.
+    :type schema_type: Type[AbstractNeoGenObject]
+    :param fingerprint: CRC-64-AVRO fingerprint of ``writer_schema``.
+    :type fingerprint: bytes
+    :param writer_schema: Schema the data to decode was written with, as JSON
+        text or decoded JSON.
+    :type writer_schema: WriterSchema
+    :return: Codec decoding ``writer_schema`` data as ``schema_type``.
+    :rtype: BinaryCodec
+    :raises NeoGenCodecError: If ``writer_schema`` can not be resolved
+        against the schema of ``schema_type``.
+    """
+    if fingerprint == schema_type.__fingerprint64__:
+        return get_binary_codec(schema_type)
+
+    codecs = _resolving_binary_codecs.get(schema_type)
+    if codecs is None:
+        codecs = _resolving_binary_codecs[schema_type] = {}
+    try:
+        return codecs[fingerprint]
+    except KeyError:
+        if isinstance(writer_schema, str):
+            writer_schema = json.loads(writer_schema)
+        # ``__schema__`` rather than ``__canonical_schema__``, resolution
+        # needs the reader's field defaults and aliases.
+        codec = codecs[fingerprint] = BinaryCodec(
+            schema_type.__schema__, writer_schema=writer_schema, fields=getattr(schema_type, "__projection__", None)
+        )
+        return codec
+
+
+def clear_binary_codec_cache(schema_type: Optional[type] = None) -> None:
+    """Drop cached codecs, for ``schema_type`` only if provided.
+
+    :param schema_type: Generated class to invalidate, defaults to all.
+    :type schema_type: Optional[type]
+    """
+    if schema_type is None:
+        _binary_codecs.clear()
+        _resolving_binary_codecs.clear()
+    else:
+        _binary_codecs.pop(schema_type, None)
+        _resolving_binary_codecs.pop(schema_type, None)
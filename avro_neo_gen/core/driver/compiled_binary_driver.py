@@ -0,0 +1,176 @@
+"""Driver impl. using schema specialized, pure Python binary codecs."""
+
+from io import BufferedIOBase
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Type, TypeVar
+
+from avro_neo_gen.core.driver.abstract_avro_driver import AbstractAvroDriver
+from avro_neo_gen.core.driver.binary_codec import (
+    ITER_READ_BUFFER_SIZE,
+    Buffer,
+    WriterSchema,
+    clear_binary_codec_cache,
+    get_binary_codec,
+)
+
+if TYPE_CHECKING:
+    from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+
+__all__ = ["CompiledBinaryDriver"]
+
+
+S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
+
+
+class CompiledBinaryDriver(AbstractAvroDriver):
+    """Driver impl. using schema specialized, pure Python binary codecs.
+
+    Each generated class has a :class:`BinaryCodec` compiled from its
+    ``__canonical_schema__`` on first use, which is then reused for every
+    subsequent read and write. No third party libraries are required.
+
+    Data written with a different version of a class's schema is read by
+    passing its ``writer_schema``, the resolving codec for each writer schema
+    is likewise compiled once and cached. Unmodified lazy records, see
+    :meth:`NeoGenRecord.lazy`, are written as the bytes they were read from.
+    """
+
+    def read(self, schema_type: Type[S], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> S:
+        """Read a single schema from source stream and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type``.
+        :rtype: S
+        """
+        return schema_type.decode(get_binary_codec(schema_type, writer_schema).read(source))
+
+    def write(self, schema: S, target: BufferedIOBase) -> None:
+        """Write a single schema to target stream.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param target: Stream to write the encoded datum to.
+        :type target: BufferedIOBase
+        """
+        out = bytearray()
+        get_binary_codec(schema.__class__).encode_object_into(schema, out)
+        target.write(out)
+
+    def read_many(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        count: Optional[int] = None,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> list[S]:
+        """Read consecutive schemas from source stream into typed instances.
+
+        The stream is read in chunks and decoded with a single codec lookup
+        for the whole batch.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param count: Number of records to read, defaults to reading until
+            the end of ``source``.
+        :type count: Optional[int]
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instances of ``schema_type``, in stream order.
+        :rtype: list[S]
+        """
+        decode = schema_type.decode
+        return [decode(datum) for datum in get_binary_codec(schema_type, writer_schema).read_many(source, count)]
+
+    def iter_read(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        buffer_size: int = ITER_READ_BUFFER_SIZE,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> Iterator[S]:
+        """Lazily read consecutive schemas from source stream until it ends.
+
+        The stream is read in chunks of ``buffer_size`` bytes and decoded with
+        a single codec lookup, see :func:`iter_decode`.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param buffer_size: Number of bytes to read from ``source`` at a time.
+        :type buffer_size: int
+        :param writer_schema: Schema the datums were written with, as JSON
+            text or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: Lazy iterator over new instances of ``schema_type``, in
+            stream order.
+        :rtype: Iterator[S]
+        """
+        decode = schema_type.decode
+        for datum in get_binary_codec(schema_type, writer_schema).iter_read(source, buffer_size):
+            yield decode(datum)
+
+    def write_many(self, schemas: Iterable[S], target: BufferedIOBase) -> None:
+        """Write consecutive schemas to target stream.
+
+        The batch is encoded into one buffer and written with a single call.
+
+        :param schemas: Generated class instances to encode.
+        :type schemas: Iterable[S]
+        :param target: Stream to write the encoded datums to.
+        :type target: BufferedIOBase
+        """
+        out = bytearray()
+        schema_type: Optional[type] = None
+        for schema in schemas:
+            if schema.__class__ is not schema_type:
+                schema_type = schema.__class__
+                encode_object_into = get_binary_codec(schema_type).encode_object_into
+            encode_object_into(schema, out)
+        target.write(out)
+
+    def from_bytes(
+        self, schema_type: Type[S], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[S, int]:
+        """Read a single schema from a buffer and return a typed instance.
+
+        The datum is decoded in place, ``memoryview`` inputs are sliced
+        rather than copied.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param buf: Buffer holding the encoded datum.
+        :type buf: Buffer
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :param writer_schema: Schema the datum was written with, as JSON text
+            or decoded JSON, defaults to the schema of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type`` and the offset of the first
+            byte after the datum.
+        :rtype: tuple[S, int]
+        """
+        datum, end = get_binary_codec(schema_type, writer_schema).decode(buf, offset)
+        return schema_type.decode(datum), end
+
+    def write_into(self, schema: S, out: bytearray) -> None:
+        """Append a single encoded schema to a buffer.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param out: Buffer to append the encoded datum to.
+        :type out: bytearray
+        """
+        get_binary_codec(schema.__class__).encode_object_into(schema, out)
+
+    def invalidate(self, schema_type: Optional[Type["AbstractNeoGenObject"]] = None) -> None:
+        """Drop compiled codecs, for ``schema_type`` only if provided."""
+        clear_binary_codec_cache(schema_type)
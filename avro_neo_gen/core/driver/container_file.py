@@ -0,0 +1,326 @@
+"""Avro Object Container File reader and writer.
+
+Container files hold a header (magic, metadata map, and sync marker) followed
+by blocks of binary encoded datums, each optionally compressed and followed
+by the sync marker. The ``null``, ``deflate``, ``bzip2``, and ``xz`` codecs are
+supported, all of which ship with the Python standard library.
+
+.. highlight:: python
+.. code-block::
+
+    with ContainerWriter(User, "users.avro", codec="deflate") as writer:
+        for user in users:
+            writer.write(user)
+
+    for user in iter_records(User, "users.avro"):
+        ...
+"""
+
+import bz2
+import json
+import lzma
+import os
+import zlib
+from io import BufferedIOBase
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from avro_neo_gen.core.driver.binary_codec import (
+    BinaryCodec,
+    get_binary_codec,
+    read_long,
+    write_long,
+)
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenCodecUnderflowError,
+    NeoGenContainerFileError,
+)
+
+if TYPE_CHECKING:
+    from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+
+__all__ = [
+    "CONTAINER_CODECS",
+    "ContainerReader",
+    "ContainerWriter",
+    "iter_records",
+]
+
+S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
+
+ContainerSource = Union[str, os.PathLike, IO[bytes], BufferedIOBase]
+
+MAGIC = b"Obj\x01"
+SYNC_SIZE = 16
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+_HEADER_CODEC = BinaryCodec(
+    {
+        "type": "record",
+        "name": "org.apache.avro.file.Header",
+        "fields": [
+            {"name": "magic", "type": {"type": "fixed", "name": "Magic", "size": len(MAGIC)}},
+            {"name": "meta", "type": {"type": "map", "values": "bytes"}},
+            {"name": "sync", "type": {"type": "fixed", "name": "Sync", "size": SYNC_SIZE}},
+        ],
+    }
+)
+
+
+class _ContainerCodec(NamedTuple):
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+CONTAINER_CODECS: dict[str, _ContainerCodec] = {
+    "null": _ContainerCodec(bytes, bytes),
+    "deflate": _ContainerCodec(_deflate, lambda data: zlib.decompress(data, -zlib.MAX_WBITS)),
+    "bzip2": _ContainerCodec(bz2.compress, bz2.decompress),
+    "xz": _ContainerCodec(lzma.compress, lzma.decompress),
+}
+
+
+def _container_codec(name: str) -> _ContainerCodec:
+    try:
+        return CONTAINER_CODECS[name]
+    except KeyError:
+        raise NeoGenContainerFileError(f"Unsupported container codec: {name}") from None
+
+
+def _open(source: ContainerSource, mode: str) -> tuple[Any, bool]:
+    """Open ``source`` if it is a path, returning the stream and ownership."""
+    if isinstance(source, str | os.PathLike):
+        return Path(source).open(mode), True
+    return source, False
+
+
+class ContainerWriter(Generic[S]):
+    """Buffered Object Container File writer.
+
+    :param schema_type: Generated class of the records being written.
+    :type schema_type: Type[S]
+    :param target: Path or binary stream to write to.
+    :type target: ContainerSource
+    :param codec: Block compression codec, defaults to ``"null"``.
+    :type codec: str
+    :param block_size: Uncompressed size in bytes at which a block is
+        flushed, defaults to 64 KiB.
+    :type block_size: int
+    :param metadata: Additional file metadata.
+    :type metadata: Optional[dict[str, bytes]]
+    :raises NeoGenContainerFileError: If ``codec`` is not supported.
+
+    Records are encoded into an in memory block which is compressed and
+    written once it reaches ``block_size``, and on :meth:`flush` or
+    :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        schema_type: Type[S],
+        target: ContainerSource,
+        codec: str = "null",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        metadata: Optional[dict[str, bytes]] = None,
+    ) -> None:
+        """Initialize ContainerWriter and write the file header."""
+        self._codec = _container_codec(codec)
+        self._datum_codec = get_binary_codec(schema_type)
+        self._block_size = block_size
+        self._block = bytearray()
+        self._block_count = 0
+        self._sync = os.urandom(SYNC_SIZE)
+        self._target, self._owns_target = _open(target, "wb")
+
+        meta = {
+            **(metadata or {}),
+            "avro.schema": json.dumps(schema_type.__schema__).encode("utf-8"),
+            "avro.codec": codec.encode("utf-8"),
+        }
+        self._target.write(_HEADER_CODEC.encode({"magic": MAGIC, "meta": meta, "sync": self._sync}))
+
+    def __enter__(self) -> "ContainerWriter[S]":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close writer on context exit."""
+        self.close()
+
+    def write(self, record: S) -> None:
+        """Append a record to the current block, flushing it when full."""
+        self._datum_codec.encode_object_into(record, self._block)
+        self._block_count += 1
+        if len(self._block) >= self._block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the current block, if it holds any records."""
+        if not self._block_count:
+            return
+
+        data = self._codec.compress(bytes(self._block))
+        header = bytearray()
+        write_long(self._block_count, header)
+        write_long(len(data), header)
+        self._target.write(header)
+        self._target.write(data)
+        self._target.write(self._sync)
+
+        self._block.clear()
+        self._block_count = 0
+
+    def close(self) -> None:
+        """Flush the final block and close the target if it was opened here."""
+        self.flush()
+        if self._owns_target:
+            self._target.close()
+
+
+class ContainerReader:
+    """Streaming Object Container File reader.
+
+    :param source: Path or binary stream to read from.
+    :type source: ContainerSource
+    :raises NeoGenContainerFileError: If the header is invalid or the codec
+        is not supported.
+
+    Iterating a reader yields raw datums decoded with the schema stored in
+    the file header, one block in memory at a time, see :meth:`iter_datums`
+    to decode them with another codec.
+    """
+
+    def __init__(self, source: ContainerSource) -> None:
+        """Initialize ContainerReader and read the file header."""
+        self._source, self._owns_source = _open(source, "rb")
+        try:
+            header = _HEADER_CODEC.read(self._source)
+        except NeoGenCodecUnderflowError as err:
+            raise NeoGenContainerFileError("Truncated container file header") from err
+
+        if header["magic"] != MAGIC:
+            raise NeoGenContainerFileError("Not an Avro object container file")
+
+        self.metadata: dict[str, bytes] = header["meta"]
+        self.schema = json.loads(self.metadata["avro.schema"])
+        self.codec_name = self.metadata.get("avro.codec", b"null").decode("utf-8")
+        self._codec = _container_codec(self.codec_name)
+        self._datum_codec = BinaryCodec(self.schema)
+        self._sync: bytes = header["sync"]
+
+    def __enter__(self) -> "ContainerReader":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close reader on context exit."""
+        self.close()
+
+    def _read_long(self) -> Optional[int]:
+        """Read a long from the source, or `None` if it is at its end."""
+        data = bytearray()
+        while not data or data[-1] & 0x80:
+            byte = self._source.read(1)
+            if not byte:
+                if data:
+                    raise NeoGenContainerFileError("Truncated container file block")
+                return None
+            data += byte
+        return read_long(data, 0)[0]
+
+    def iter_blocks(self) -> Iterator[tuple[int, bytes]]:
+        """Yield the record count and decompressed bytes of each block.
+
+        :raises NeoGenContainerFileError: If the file ends within a block.
+        """
+        while (count := self._read_long()) is not None:
+            size = self._read_long()
+            if size is None:
+                raise NeoGenContainerFileError("Truncated container file block")
+            if count < 0 or size < 0:
+                raise NeoGenContainerFileError("Corrupt container file block")
+
+            data = self._source.read(size)
+            if len(data) != size or self._source.read(SYNC_SIZE) != self._sync:
+                raise NeoGenContainerFileError("Corrupt container file block")
+            yield count, self._codec.decompress(data)
+
+    def iter_datums(self, codec: BinaryCodec) -> Iterator[Any]:
+        """Yield each datum in the file, decoded with ``codec``.
+
+        :param codec: Codec to decode datums written with the file's schema,
+            such as one resolving it against a reader schema.
+        :type codec: BinaryCodec
+        :raises NeoGenContainerFileError: If a block holds fewer or more bytes
+            than its datums.
+        """
+        decode = codec.decode
+        for count, data in self.iter_blocks():
+            pos = 0
+            for _ in range(count):
+                try:
+                    datum, pos = decode(data, pos)
+                except NeoGenCodecUnderflowError as err:
+                    raise NeoGenContainerFileError("Corrupt container file block") from err
+                yield datum
+            if pos != len(data):
+                raise NeoGenContainerFileError("Corrupt container file block")
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield each datum in the file."""
+        return self.iter_datums(self._datum_codec)
+
+    def close(self) -> None:
+        """Close the source if it was opened here."""
+        if self._owns_source:
+            self._source.close()
+
+
+def iter_records(schema_type: Type[S], source: ContainerSource) -> Iterator[S]:
+    """Stream the records of an Object Container File as typed instances.
+
+    :param schema_type: Generated class to decode records into.
+    :type schema_type: Type[S]
+    :param source: Path or binary stream to read from.
+    :type source: ContainerSource
+    :return: Lazy iterator over the records of the file.
+    :rtype: Iterator[S]
+    :raises NeoGenCodecError: If the schema of the file can not be resolved
+        against the schema of ``schema_type``.
+
+    Files written with another schema than that of ``schema_type`` are read
+    with schema resolution, see :func:`get_binary_codec`.
+    """
+    with ContainerReader(source) as reader:
+        decode = schema_type.decode
+        codec = get_binary_codec(schema_type, reader.metadata["avro.schema"].decode("utf-8"))
+        for datum in reader.iter_datums(codec):
+            yield decode(datum)
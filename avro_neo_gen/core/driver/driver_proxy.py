@@ -3,9 +3,14 @@
 from importlib import import_module
 from io import BufferedIOBase
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Type, TypeVar
 
 from avro_neo_gen.core.driver.abstract_avro_driver import AbstractAvroDriver
+from avro_neo_gen.core.driver.binary_codec import (
+    ITER_READ_BUFFER_SIZE,
+    Buffer,
+    WriterSchema,
+)
 from avro_neo_gen.core.neo_gen_error import (
     NeoGenDriverClassNotFound,
     NeoGenDriverLoadFailure,
@@ -92,10 +97,58 @@ class DriverProxy(AbstractAvroDriver, _Monostate):
             raise NeoGenDriverUnloadedError
         return self._driver
 
-    def read(self, schema_type: Type[S], source: BufferedIOBase) -> S:
+    def read(self, schema_type: Type[S], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> S:
         """Read a single schema from source stream and return a typed instance."""
-        return self.driver.read(schema_type=schema_type, source=source)
+        if writer_schema is None:
+            return self.driver.read(schema_type=schema_type, source=source)
+        return self.driver.read(schema_type=schema_type, source=source, writer_schema=writer_schema)
 
     def write(self, schema: S, target: BufferedIOBase) -> None:
         """Write a single schema to target stream."""
         self.driver.write(schema=schema, target=target)
+
+    def read_many(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        count: Optional[int] = None,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> list[S]:
+        """Read consecutive schemas from source stream into typed instances."""
+        if writer_schema is None:
+            return self.driver.read_many(schema_type=schema_type, source=source, count=count)
+        return self.driver.read_many(schema_type=schema_type, source=source, count=count, writer_schema=writer_schema)
+
+    def iter_read(
+        self,
+        schema_type: Type[S],
+        source: BufferedIOBase,
+        buffer_size: int = ITER_READ_BUFFER_SIZE,
+        writer_schema: Optional[WriterSchema] = None,
+    ) -> Iterator[S]:
+        """Lazily read consecutive schemas from source stream until it ends."""
+        if writer_schema is None:
+            return self.driver.iter_read(schema_type=schema_type, source=source, buffer_size=buffer_size)
+        return self.driver.iter_read(
+            schema_type=schema_type, source=source, buffer_size=buffer_size, writer_schema=writer_schema
+        )
+
+    def write_many(self, schemas: Iterable[S], target: BufferedIOBase) -> None:
+        """Write consecutive schemas to target stream."""
+        self.driver.write_many(schemas=schemas, target=target)
+
+    def from_bytes(
+        self, schema_type: Type[S], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[S, int]:
+        """Read a single schema from a buffer and return a typed instance."""
+        if writer_schema is None:
+            return self.driver.from_bytes(schema_type=schema_type, buf=buf, offset=offset)
+        return self.driver.from_bytes(schema_type=schema_type, buf=buf, offset=offset, writer_schema=writer_schema)
+
+    def write_into(self, schema: S, out: bytearray) -> None:
+        """Append a single encoded schema to a buffer."""
+        self.driver.write_into(schema=schema, out=out)
+
+    def invalidate(self, schema_type: Optional[Type["AbstractNeoGenObject"]] = None) -> None:
+        """Drop any per-class state cached by the driver."""
+        self.driver.invalidate(schema_type=schema_type)
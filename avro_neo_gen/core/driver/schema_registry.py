@@ -0,0 +1,148 @@
+"""Schema registry backends for :class:`SchemaRegistryDriver`.
+
+A backend assigns integer ids to schemas and resolves ids back to schemas.
+Remote registries are supported by implementing
+:class:`SchemaRegistryBackend`, in memory and file backed registries are
+provided for tests and offline use. Neither keeps track of subjects.
+"""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import Union
+
+from avro_neo_gen.core.neo_gen_error import NeoGenSchemaRegistryError
+
+__all__ = [
+    "FileSchemaRegistry",
+    "InMemorySchemaRegistry",
+    "SchemaRegistryBackend",
+]
+
+
+class SchemaRegistryBackend(ABC):
+    """Abstract base class for all schema registry backends.
+
+    Registering the same schema again, under any subject, returns the id it
+    was first assigned.
+    """
+
+    @abstractmethod
+    def register(self, subject: str, schema: str) -> int:
+        """Register a schema under a subject and return its id.
+
+        :param subject: Subject to register the schema under.
+        :type subject: str
+        :param schema: Schema JSON.
+        :type schema: str
+        :return: Schema id.
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_schema(self, schema_id: int) -> str:
+        """Fetch the schema JSON registered under an id.
+
+        :param schema_id: Schema id.
+        :type schema_id: int
+        :return: Schema JSON.
+        :rtype: str
+        :raises NeoGenSchemaRegistryError: If no schema has the id.
+        """
+        raise NotImplementedError
+
+
+class InMemorySchemaRegistry(SchemaRegistryBackend):
+    """Schema registry held in process memory, ids are assigned from 1."""
+
+    def __init__(self) -> None:
+        """Initialize :class:`InMemorySchemaRegistry`."""
+        self._schemas: dict[int, str] = {}
+        self._schema_ids: dict[str, int] = {}
+        self._lock = Lock()
+
+    def register(self, subject: str, schema: str) -> int:
+        """Register a schema under a subject and return its id."""
+        with self._lock:
+            schema_id = self._schema_ids.get(schema)
+            if schema_id is None:
+                schema_id = self._schema_ids[schema] = len(self._schemas) + 1
+                self._schemas[schema_id] = schema
+            return schema_id
+
+    def get_schema(self, schema_id: int) -> str:
+        """Fetch the schema JSON registered under an id."""
+        try:
+            return self._schemas[schema_id]
+        except KeyError:
+            raise NeoGenSchemaRegistryError(f"Unknown schema id: {schema_id}") from None
+
+
+class FileSchemaRegistry(SchemaRegistryBackend):
+    """Schema registry stored as one ``<id>.avsc`` file per schema.
+
+    :param path: Registry directory, created on first registration.
+    :type path: Union[str, Path]
+
+    Schemas are written to a staging file which is then hard linked into
+    place, so an id is claimed and its complete schema published in one
+    atomic step, and several processes may share a registry directory.
+    Should two processes register the same schema at once, both return the
+    lowest id it was stored under. A registry directory can be populated by
+    hand, or from an export of a remote registry, for offline use.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize :class:`FileSchemaRegistry`."""
+        self.path = Path(path)
+        self._lock = Lock()
+
+    def _schema_path(self, schema_id: int) -> Path:
+        return self.path / f"{schema_id}.avsc"
+
+    def _schema_ids(self) -> dict[str, int]:
+        """Map each stored schema to the lowest id it is stored under."""
+        if not self.path.is_dir():
+            return {}
+        schema_ids: dict[str, int] = {}
+        for schema_id in sorted(
+            int(schema_path.stem) for schema_path in self.path.glob("*.avsc") if schema_path.stem.isdigit()
+        ):
+            schema_ids.setdefault(self._schema_path(schema_id).read_text(encoding="utf-8"), schema_id)
+        return schema_ids
+
+    def register(self, subject: str, schema: str) -> int:
+        """Register a schema under a subject and return its id."""
+        with self._lock:
+            schema_ids = self._schema_ids()
+            if schema in schema_ids:
+                return schema_ids[schema]
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            fd, staging_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=self.path)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as staging_file:
+                    staging_file.write(schema)
+
+                schema_id = max(schema_ids.values(), default=0)
+                while True:
+                    schema_id += 1
+                    try:
+                        os.link(staging_path, self._schema_path(schema_id))
+                    except FileExistsError:
+                        continue
+                    break
+            finally:
+                os.unlink(staging_path)
+
+            return self._schema_ids()[schema]
+
+    def get_schema(self, schema_id: int) -> str:
+        """Fetch the schema JSON registered under an id."""
+        try:
+            return self._schema_path(schema_id).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise NeoGenSchemaRegistryError(f"Unknown schema id: {schema_id}") from None
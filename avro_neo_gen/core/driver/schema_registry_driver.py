@@ -0,0 +1,308 @@
+"""Driver impl. of the schema registry wire format.
+
+Each datum is framed as a zero magic byte, the 4 byte big-endian id of the
+writer's schema in a schema registry, and then the Avro binary encoding of
+the datum. Schema ids are resolved through a :class:`SchemaRegistryBackend`
+and cached in process, so the backend is only consulted once per schema.
+"""
+
+import json
+import os
+import struct
+from io import BufferedIOBase
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from avro_neo_gen.core.driver.abstract_avro_driver import AbstractAvroDriver
+from avro_neo_gen.core.driver.binary_codec import (
+    BinaryCodec,
+    Buffer,
+    WriterSchema,
+    clear_binary_codec_cache,
+    get_binary_codec,
+    get_resolving_binary_codec,
+)
+from avro_neo_gen.core.driver.schema_registry import (
+    FileSchemaRegistry,
+    InMemorySchemaRegistry,
+    SchemaRegistryBackend,
+)
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenCodecError,
+    NeoGenCodecUnderflowError,
+    NeoGenWireFormatError,
+)
+from avro_neo_gen.core.neo_gen_registry import (
+    fingerprint64,
+    lookup_schema_type,
+    parsing_canonical_form,
+)
+
+if TYPE_CHECKING:
+    from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+
+__all__ = ["SchemaRegistryDriver", "read_header", "record_name_subject"]
+
+
+S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
+
+WIRE_FORMAT_MAGIC = 0
+_WIRE_FORMAT_HEADER = struct.Struct(">BI")
+
+SCHEMA_REGISTRY_PATH_ENVVAR = "AVRO_NEOGEN_SCHEMA_REGISTRY_PATH"
+
+
+def read_header(buf: Buffer, offset: int = 0) -> tuple[int, int]:
+    """Read the magic byte and schema id of a wire format datum.
+
+    :param buf: Buffer holding the encoded datum.
+    :type buf: Buffer
+    :param offset: Offset of the first byte of the datum in ``buf``.
+    :type offset: int
+    :return: Writer schema id and the offset of the body.
+    :rtype: tuple[int, int]
+    :raises NeoGenCodecUnderflowError: If ``buf`` ends within the header.
+    :raises NeoGenWireFormatError: If the magic byte is wrong.
+    """
+    try:
+        magic, schema_id = _WIRE_FORMAT_HEADER.unpack_from(buf, offset)
+    except struct.error as err:
+        raise NeoGenCodecUnderflowError from err
+    if magic != WIRE_FORMAT_MAGIC:
+        raise NeoGenWireFormatError(f"Unknown wire format magic byte: {magic}")
+    return schema_id, offset + _WIRE_FORMAT_HEADER.size
+
+
+def record_name_subject(schema_type: Type["AbstractNeoGenObject"]) -> str:
+    """Subject named for the fullname of the schema, the record name strategy."""
+    return schema_type.__canonical_schema__["name"]
+
+
+def _default_backend() -> SchemaRegistryBackend:
+    path = os.environ.get(SCHEMA_REGISTRY_PATH_ENVVAR)
+    if path:
+        return FileSchemaRegistry(path)
+    return InMemorySchemaRegistry()
+
+
+class SchemaRegistryDriver(AbstractAvroDriver):
+    """Driver impl. of the schema registry wire format.
+
+    :param backend: Registry to resolve schema ids with, defaults to a
+        :class:`FileSchemaRegistry` at ``$AVRO_NEOGEN_SCHEMA_REGISTRY_PATH``
+        if it is set, or an :class:`InMemorySchemaRegistry` otherwise.
+    :type backend: Optional[SchemaRegistryBackend]
+    :param subject_name: Subject to register a class's schema under,
+        defaults to :func:`record_name_subject`.
+    :type subject_name: Callable[[Type[AbstractNeoGenObject]], str]
+
+    Writing a class registers its ``__canonical_schema__`` on first use.
+    Reading resolves the header schema id to a fingerprint on first use,
+    then checks it against the ``__fingerprint64__`` of the requested class.
+    Datums written with another version of the class's schema are resolved
+    against it, using the writer schema fetched from the registry. All
+    lookups are cached until :meth:`invalidate` or until the backend is
+    replaced.
+
+    .. highlight:: python
+    .. code-block::
+
+        DriverProxy.load_driver("schema_registry_driver")
+        DriverProxy().driver.backend = FileSchemaRegistry("schemas")
+    """
+
+    def __init__(
+        self,
+        backend: Optional[SchemaRegistryBackend] = None,
+        subject_name: Callable[[Type["AbstractNeoGenObject"]], str] = record_name_subject,
+    ) -> None:
+        """Initialize :class:`SchemaRegistryDriver`."""
+        self._backend = _default_backend() if backend is None else backend
+        self.subject_name = subject_name
+        self._schema_ids: "WeakKeyDictionary[type, int]" = WeakKeyDictionary()
+        self._fingerprints: dict[int, bytes] = {}
+        self._writer_schemas: dict[int, str] = {}
+
+    @property
+    def backend(self) -> SchemaRegistryBackend:
+        """Registry schema ids are resolved with, replacing it drops all cached ids."""
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: SchemaRegistryBackend) -> None:
+        self._backend = backend
+        self._schema_ids.clear()
+        self._fingerprints.clear()
+        self._writer_schemas.clear()
+
+    def schema_id(self, schema_type: Type["AbstractNeoGenObject"]) -> int:
+        """Id of a generated class's schema, registering it on first use.
+
+        :param schema_type: Generated class.
+        :type schema_type: Type[AbstractNeoGenObject]
+        :return: Schema id.
+        :rtype: int
+        """
+        try:
+            return self._schema_ids[schema_type]
+        except KeyError:
+            pass
+
+        canonical_form = json.dumps(schema_type.__canonical_schema__, separators=(",", ":"))
+        schema_id = self._schema_ids[schema_type] = self._backend.register(
+            self.subject_name(schema_type), canonical_form
+        )
+        self._fingerprints[schema_id] = schema_type.__fingerprint64__
+        return schema_id
+
+    def fingerprint(self, schema_id: int) -> bytes:
+        """CRC-64-AVRO fingerprint of the schema registered under an id.
+
+        :param schema_id: Schema id.
+        :type schema_id: int
+        :return: Fingerprint, 8 bytes little-endian.
+        :rtype: bytes
+        :raises NeoGenSchemaRegistryError: If the backend has no schema with
+            the id.
+        """
+        try:
+            return self._fingerprints[schema_id]
+        except KeyError:
+            pass
+
+        fingerprint = self._fingerprints[schema_id] = fingerprint64(
+            parsing_canonical_form(self._writer_schema(schema_id))
+        )
+        return fingerprint
+
+    def _writer_schema(self, schema_id: int) -> str:
+        try:
+            return self._writer_schemas[schema_id]
+        except KeyError:
+            schema = self._writer_schemas[schema_id] = self._backend.get_schema(schema_id)
+            return schema
+
+    def _codec(
+        self, schema_type: Type["AbstractNeoGenObject"], schema_id: int, writer_schema: Optional[WriterSchema]
+    ) -> BinaryCodec:
+        if self._schema_ids.get(schema_type) == schema_id:
+            return get_binary_codec(schema_type)
+        fingerprint = self.fingerprint(schema_id)
+        if fingerprint == schema_type.__fingerprint64__:
+            return get_binary_codec(schema_type)
+        try:
+            return get_resolving_binary_codec(
+                schema_type, fingerprint, self._writer_schema(schema_id) if writer_schema is None else writer_schema
+            )
+        except NeoGenCodecError as err:
+            raise NeoGenWireFormatError(
+                f"Schema id {schema_id} does not match {schema_type.__name__} and can not be resolved against it"
+            ) from err
+
+    def decode_any(self, buf: Buffer, offset: int = 0) -> "AbstractNeoGenObject":
+        """Decode a wire format datum into the generated class for its schema id.
+
+        :param buf: Buffer holding the encoded datum.
+        :type buf: Buffer
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :return: New instance of the class registered for the schema.
+        :rtype: AbstractNeoGenObject
+        :raises NeoGenFingerprintNotFound: If no imported generated class has
+            the writer's schema.
+        """
+        schema_id, offset = read_header(buf, offset)
+        schema_type = lookup_schema_type(self.fingerprint(schema_id))
+        datum, _ = get_binary_codec(schema_type).decode(buf, offset)
+        return schema_type.decode(datum)
+
+    def read(self, schema_type: Type[S], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> S:
+        """Read a single schema from source stream and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param writer_schema: Schema the datum was written with, defaults to
+            the schema registered under the header schema id.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type``.
+        :rtype: S
+        :raises NeoGenWireFormatError: If the datum was written with a
+            schema which can not be resolved against ``schema_type``.
+        """
+        schema_id, _ = read_header(source.read(_WIRE_FORMAT_HEADER.size))
+        return schema_type.decode(self._codec(schema_type, schema_id, writer_schema).read(source))
+
+    def write(self, schema: S, target: BufferedIOBase) -> None:
+        """Write a single schema to target stream.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param target: Stream to write the encoded datum to.
+        :type target: BufferedIOBase
+        """
+        out = bytearray()
+        self.write_into(schema, out)
+        target.write(out)
+
+    def write_many(self, schemas: Iterable[S], target: BufferedIOBase) -> None:
+        """Write consecutive schemas to target stream.
+
+        The batch is encoded into one buffer and written with a single call.
+
+        :param schemas: Generated class instances to encode.
+        :type schemas: Iterable[S]
+        :param target: Stream to write the encoded datums to.
+        :type target: BufferedIOBase
+        """
+        out = bytearray()
+        for schema in schemas:
+            self.write_into(schema, out)
+        target.write(out)
+
+    def from_bytes(
+        self, schema_type: Type[S], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[S, int]:
+        """Read a single schema from a buffer and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param buf: Buffer holding the encoded datum.
+        :type buf: Buffer
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :param writer_schema: Schema the datum was written with, defaults to
+            the schema registered under the header schema id.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type`` and the offset of the first
+            byte after the datum.
+        :rtype: tuple[S, int]
+        :raises NeoGenWireFormatError: If the datum was written with a
+            schema which can not be resolved against ``schema_type``.
+        """
+        schema_id, offset = read_header(buf, offset)
+        datum, end = self._codec(schema_type, schema_id, writer_schema).decode(buf, offset)
+        return schema_type.decode(datum), end
+
+    def write_into(self, schema: S, out: bytearray) -> None:
+        """Append a single encoded schema to a buffer.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param out: Buffer to append the encoded datum to.
+        :type out: bytearray
+        """
+        schema_type = schema.__class__
+        out += _WIRE_FORMAT_HEADER.pack(WIRE_FORMAT_MAGIC, self.schema_id(schema_type))
+        get_binary_codec(schema_type).encode_object_into(schema, out)
+
+    def invalidate(self, schema_type: Optional[Type["AbstractNeoGenObject"]] = None) -> None:
+        """Drop cached schema ids and codecs, for ``schema_type`` only if provided."""
+        if schema_type is None:
+            self._schema_ids.clear()
+            self._fingerprints.clear()
+            self._writer_schemas.clear()
+        else:
+            self._schema_ids.pop(schema_type, None)
+        clear_binary_codec_cache(schema_type)
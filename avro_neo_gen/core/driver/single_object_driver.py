@@ -0,0 +1,216 @@
+"""Driver impl. of Avro single object encoding.
+
+Each datum is framed as the two byte marker ``C3 01``, the 8 byte
+little-endian CRC-64-AVRO fingerprint of the writer's schema, and then the
+Avro binary encoding of the datum. The body is encoded with the same schema
+specialized codecs as :class:`CompiledBinaryDriver`.
+"""
+
+import json
+from io import BufferedIOBase
+from typing import TYPE_CHECKING, Iterable, Optional, Type, TypeVar
+
+from avro_neo_gen.core.driver.abstract_avro_driver import AbstractAvroDriver
+from avro_neo_gen.core.driver.binary_codec import (
+    BinaryCodec,
+    Buffer,
+    WriterSchema,
+    clear_binary_codec_cache,
+    get_binary_codec,
+    get_resolving_binary_codec,
+    writer_schema_fingerprint,
+)
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenCodecError,
+    NeoGenCodecUnderflowError,
+    NeoGenSingleObjectError,
+)
+from avro_neo_gen.core.neo_gen_registry import (
+    lookup_schema_type,
+    registered_schema_type,
+)
+
+if TYPE_CHECKING:
+    from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+
+__all__ = ["SingleObjectDriver", "decode_any", "read_header"]
+
+
+S = TypeVar("S", bound="AbstractNeoGenObject")  # noqa: VNE001 - Type variable.
+
+SINGLE_OBJECT_MARKER = b"\xc3\x01"
+SINGLE_OBJECT_HEADER_SIZE = len(SINGLE_OBJECT_MARKER) + 8
+
+
+def read_header(buf: Buffer, offset: int = 0) -> tuple[bytes, int]:
+    """Read the marker and fingerprint of a single object encoded datum.
+
+    :param buf: Buffer holding the encoded datum.
+    :type buf: Buffer
+    :param offset: Offset of the first byte of the datum in ``buf``.
+    :type offset: int
+    :return: Writer schema fingerprint and the offset of the body.
+    :rtype: tuple[bytes, int]
+    :raises NeoGenCodecUnderflowError: If ``buf`` ends within the header.
+    :raises NeoGenSingleObjectError: If the marker is missing.
+    """
+    end = offset + SINGLE_OBJECT_HEADER_SIZE
+    header = bytes(buf[offset:end])
+    if len(header) < SINGLE_OBJECT_HEADER_SIZE:
+        raise NeoGenCodecUnderflowError
+    if header[:2] != SINGLE_OBJECT_MARKER:
+        raise NeoGenSingleObjectError(f"Missing single object marker: {header[:2].hex()}")
+    return header[2:], end
+
+
+def _writer_schema(fingerprint: bytes, writer_schema: Optional[WriterSchema]) -> Optional[WriterSchema]:
+    """Writer schema for a header fingerprint, if it is known."""
+    if writer_schema is None:
+        writer_type = registered_schema_type(fingerprint)
+        return None if writer_type is None else writer_type.__canonical_schema__
+
+    if not isinstance(writer_schema, str):
+        writer_schema = json.dumps(writer_schema)
+    return writer_schema if writer_schema_fingerprint(writer_schema) == fingerprint else None
+
+
+def _codec(
+    schema_type: Type["AbstractNeoGenObject"], fingerprint: bytes, writer_schema: Optional[WriterSchema]
+) -> BinaryCodec:
+    """Codec decoding a datum with header ``fingerprint`` as ``schema_type``.
+
+    Data written with another schema is resolved against ``schema_type``,
+    the writer schema being either ``writer_schema`` or the schema of the
+    class registered for ``fingerprint``.
+    """
+    if fingerprint == schema_type.__fingerprint64__:
+        return get_binary_codec(schema_type)
+
+    message = f"Datum fingerprint {fingerprint.hex()} does not match {schema_type.__name__}"
+    writer_schema = _writer_schema(fingerprint, writer_schema)
+    if writer_schema is None:
+        raise NeoGenSingleObjectError(f"{message}: {schema_type.__fingerprint64__.hex()}")
+    try:
+        return get_resolving_binary_codec(schema_type, fingerprint, writer_schema)
+    except NeoGenCodecError as err:
+        raise NeoGenSingleObjectError(f"{message} and can not be resolved against it") from err
+
+
+def decode_any(buf: Buffer, offset: int = 0) -> "AbstractNeoGenObject":
+    """Decode a single object encoded datum into its registered generated class.
+
+    The generated class is found by a single registry lookup on the header
+    fingerprint, so mixed streams are decoded without trying each candidate
+    schema in turn. Classes are registered as they are imported.
+
+    :param buf: Buffer holding the encoded datum.
+    :type buf: Buffer
+    :param offset: Offset of the first byte of the datum in ``buf``.
+    :type offset: int
+    :return: New instance of the class registered for the fingerprint.
+    :rtype: AbstractNeoGenObject
+    :raises NeoGenFingerprintNotFound: If no imported generated class has
+        the writer's schema fingerprint.
+    """
+    fingerprint, offset = read_header(buf, offset)
+    schema_type = lookup_schema_type(fingerprint)
+    datum, _ = get_binary_codec(schema_type).decode(buf, offset)
+    return schema_type.decode(datum)
+
+
+class SingleObjectDriver(AbstractAvroDriver):
+    """Driver impl. of Avro single object encoding.
+
+    Reads check that the fingerprint in each header matches the
+    ``__fingerprint64__`` of the requested class, use :func:`decode_any`
+    when the class is not known up front. Datums written with another version
+    of the schema are resolved against the requested class, when either the
+    header fingerprint belongs to a registered class or the writer schema is
+    passed as ``writer_schema``.
+    """
+
+    def read(self, schema_type: Type[S], source: BufferedIOBase, writer_schema: Optional[WriterSchema] = None) -> S:
+        """Read a single schema from source stream and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param source: Stream positioned at the start of an encoded datum.
+        :type source: BufferedIOBase
+        :param writer_schema: Schema the datum was written with, used when
+            the header fingerprint is not that of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type``.
+        :rtype: S
+        :raises NeoGenSingleObjectError: If the datum was written with a
+            different schema which is not known.
+        """
+        fingerprint, _ = read_header(source.read(SINGLE_OBJECT_HEADER_SIZE))
+        return schema_type.decode(_codec(schema_type, fingerprint, writer_schema).read(source))
+
+    def write(self, schema: S, target: BufferedIOBase) -> None:
+        """Write a single schema to target stream.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param target: Stream to write the encoded datum to.
+        :type target: BufferedIOBase
+        """
+        out = bytearray()
+        self.write_into(schema, out)
+        target.write(out)
+
+    def write_many(self, schemas: Iterable[S], target: BufferedIOBase) -> None:
+        """Write consecutive schemas to target stream.
+
+        The batch is encoded into one buffer and written with a single call.
+
+        :param schemas: Generated class instances to encode.
+        :type schemas: Iterable[S]
+        :param target: Stream to write the encoded datums to.
+        :type target: BufferedIOBase
+        """
+        out = bytearray()
+        for schema in schemas:
+            self.write_into(schema, out)
+        target.write(out)
+
+    def from_bytes(
+        self, schema_type: Type[S], buf: Buffer, offset: int = 0, writer_schema: Optional[WriterSchema] = None
+    ) -> tuple[S, int]:
+        """Read a single schema from a buffer and return a typed instance.
+
+        :param schema_type: Generated class to decode into.
+        :type schema_type: Type[S]
+        :param buf: Buffer holding the encoded datum.
+        :type buf: Buffer
+        :param offset: Offset of the first byte of the datum in ``buf``.
+        :type offset: int
+        :param writer_schema: Schema the datum was written with, used when
+            the header fingerprint is not that of ``schema_type``.
+        :type writer_schema: Optional[WriterSchema]
+        :return: New instance of ``schema_type`` and the offset of the first
+            byte after the datum.
+        :rtype: tuple[S, int]
+        :raises NeoGenSingleObjectError: If the datum was written with a
+            different schema which is not known.
+        """
+        fingerprint, offset = read_header(buf, offset)
+        datum, end = _codec(schema_type, fingerprint, writer_schema).decode(buf, offset)
+        return schema_type.decode(datum), end
+
+    def write_into(self, schema: S, out: bytearray) -> None:
+        """Append a single encoded schema to a buffer.
+
+        :param schema: Generated class instance to encode.
+        :type schema: S
+        :param out: Buffer to append the encoded datum to.
+        :type out: bytearray
+        """
+        schema_type = schema.__class__
+        out += SINGLE_OBJECT_MARKER
+        out += schema_type.__fingerprint64__
+        get_binary_codec(schema_type).encode_object_into(schema, out)
+
+    def invalidate(self, schema_type: Optional[Type["AbstractNeoGenObject"]] = None) -> None:
+        """Drop compiled codecs, for ``schema_type`` only if provided."""
+        clear_binary_codec_cache(schema_type)
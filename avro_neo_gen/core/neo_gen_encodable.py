@@ -11,6 +11,8 @@ Self = TypeVar("Self", bound="NeoGenEncodable")
 class NeoGenEncodable(Protocol):
     """Generated Avro NeoGen type Protocol for encodable schemas."""
 
+    __slots__ = ()
+
     __driver_proxy__: DriverProxy
 
     @classmethod
@@ -53,3 +53,51 @@ class NeoGenDriverUnloadedError(NeoGenDriverError, AttributeError):
     """Attempt to use the driver proxy without first loading a target driver."""
 
     pass
+
+
+class NeoGenCodecError(NeoGenDriverError):
+    """Avro NeoGen binary codec failed to encode or decode a datum."""
+
+    pass
+
+
+class NeoGenCodecUnderflowError(NeoGenCodecError, EOFError):
+    """Avro NeoGen binary codec ran out of bytes before a datum was complete."""
+
+    pass
+
+
+class NeoGenContainerFileError(NeoGenError):
+    """Avro NeoGen Object Container File is malformed or unsupported."""
+
+    pass
+
+
+class NeoGenSingleObjectError(NeoGenCodecError):
+    """Avro NeoGen single object encoded datum is malformed or of the wrong schema."""
+
+    pass
+
+
+class NeoGenFingerprintNotFound(NeoGenSingleObjectError, LookupError):
+    """No generated class is registered for a schema fingerprint."""
+
+    pass
+
+
+class NeoGenSchemaRegistryError(NeoGenDriverError, LookupError):
+    """Avro NeoGen schema registry has no schema for the requested id."""
+
+    pass
+
+
+class NeoGenWireFormatError(NeoGenCodecError):
+    """Avro NeoGen schema registry wire format datum is malformed or of the wrong schema."""
+
+    pass
+
+
+class NeoGenRuntimeVersionError(NeoGenError, ImportError):
+    """Installed Avro NeoGen runtime is not compatible with a generated package."""
+
+    pass
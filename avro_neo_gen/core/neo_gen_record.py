@@ -1,25 +1,47 @@
 """Generated RecordSchema base class."""
 
-from typing import Any, Type, TypeVar
+from io import BufferedIOBase
+from typing import Any, Iterable, Iterator, Optional, Type, TypeVar
 
 from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+from avro_neo_gen.core.driver.binary_codec import (
+    ITER_READ_BUFFER_SIZE,
+    Buffer,
+    LazyDatum,
+    WriterSchema,
+)
+from avro_neo_gen.core.neo_gen_error import NeoGenAttributeError, NeoGenKeyError
 from avro_neo_gen.core.type_defs import AvroRecordTypeDef
 
 NeoGenRecordDatum = dict[str, Any]
 Self = TypeVar("Self", bound="NeoGenRecord")
 
 
+class _ProjectionDatum(dict):
+    """Field values of a partial record, see :meth:`NeoGenRecord.projection`."""
+
+    __slots__ = ()
+
+    def __missing__(self, name: str) -> Any:
+        """Fail like an unset slot, so field properties fall back to ``__getattr__``."""
+        raise NeoGenAttributeError(name)
+
+
 class NeoGenRecord(AbstractNeoGenObject):
-    """Generated RecordSchema base class."""
+    """Generated RecordSchema base class.
 
-    __schema__: AvroRecordTypeDef
+    Generated records hold their field values either in a ``_datum`` dict,
+    see :class:`NeoGenDictRecord`, or in one slot per field, see
+    :class:`NeoGenSlotsRecord`.
+    """
 
-    def __init__(self) -> None:
-        """Construct default instance.
+    __schema__: AvroRecordTypeDef
+    __slots__ = ()
 
-        NB. This is designed to be overwritten.
-        """
-        self._datum: dict[str, Any] = {}
+    __projection__: Optional[tuple[str, ...]] = None
+    __lazy__: bool = False
+    _lazy_datum: Optional[LazyDatum] = None
+    _datum: NeoGenRecordDatum
 
     def __repr__(self) -> str:
         """Repr instance."""
@@ -35,4 +57,301 @@ class NeoGenRecord(AbstractNeoGenObject):
     @classmethod
     def decode(cls: Type[Self], datum: NeoGenRecordDatum) -> Self:
         """Ingest datum to internal state, munging based on spec."""
+        if cls.__projection__ is not None:
+            return cls._decode_projection(datum)
+        if isinstance(datum, LazyDatum):
+            return cls._decode_lazy(datum)
         return cls(**datum)
+
+    @classmethod
+    def _decode_projection(cls: Type[Self], datum: NeoGenRecordDatum) -> Self:
+        record = cls.__new__(cls)
+        record._datum = _ProjectionDatum((name, datum[name]) for name in cls.__projection__)  # type: ignore
+        return record
+
+    @classmethod
+    def _decode_lazy(cls: Type[Self], datum: LazyDatum) -> Self:
+        record = cls.__new__(cls)
+        record._datum = record._lazy_datum = datum  # type: ignore
+        return record
+
+    @classmethod
+    def _derived_class(cls: Type[Self], key: Any, suffix: str, namespace: dict[str, Any]) -> Type[Self]:
+        """Create a subclass of ``cls`` once per ``key``, and cache it on ``cls``."""
+        derived_classes: dict[Any, Type[Self]] = cls.__dict__.get("__derived_classes__")  # type: ignore
+        if derived_classes is None:
+            derived_classes = {}
+            setattr(cls, "__derived_classes__", derived_classes)
+        elif key in derived_classes:
+            return derived_classes[key]
+
+        derived_classes[key] = type(cls)(  # type: ignore
+            f"{cls.__name__}{suffix}",
+            (cls,),
+            {
+                "__slots__": (),
+                "__module__": cls.__module__,
+                "__qualname__": f"{cls.__qualname__}{suffix}",
+                **namespace,
+            },
+        )
+        return derived_classes[key]
+
+    @classmethod
+    def projection(cls: Type[Self], *fields: str) -> Type[Self]:
+        """Subclass which reads only some fields of the record.
+
+        Projections are read like any generated class, through the loaded
+        driver, and decode into partial records holding only the projected
+        fields. Drivers using :class:`BinaryCodec` skip over the other fields
+        without decoding them, so reading a few fields of a wide record costs
+        little more than reading a narrow one. Partial records can not be
+        written, and reading a field which was not projected raises
+        :class:`NeoGenAttributeError`.
+
+        Projection classes are created once per set of fields and cached.
+
+        .. highlight:: python
+        .. code-block::
+
+            UserIds = User.projection("id", "ts")
+            users = UserIds.read_many(source)
+
+        :param fields: Names of the fields to read.
+        :type fields: str
+        :return: Projection subclass of ``cls``.
+        :rtype: Type[Self]
+        :raises NeoGenKeyError: If a field is not a field of the record.
+        """
+        key = frozenset(fields)
+        names = [field["name"] for field in cls.__canonical_schema__["fields"]]
+        unknown = key.difference(names)
+        if unknown:
+            raise NeoGenKeyError(f"{cls.__name__} has no fields: {', '.join(sorted(unknown))}")
+
+        return cls._derived_class(
+            key,
+            "Projection",
+            {"__projection__": tuple(name for name in names if name in key), "__getattr__": _projection_getattr},
+        )
+
+    @classmethod
+    def lazy(cls: Type[Self]) -> Type[Self]:
+        """Subclass whose instances decode each field on first access.
+
+        Lazy records read through drivers using :class:`BinaryCodec` keep a
+        copy of their encoded bytes, and only decode a field when it is first
+        read, see :class:`LazyDatum`. A lazy record with no assigned fields is
+        written as its original bytes, without decoding and encoding the
+        fields it was never asked for. Other drivers, and datums resolved
+        against a ``writer_schema``, decode eagerly.
+
+        The lazy class is created once and cached.
+
+        .. highlight:: python
+        .. code-block::
+
+            for user in User.lazy().read_many(source):
+                if user.active:
+                    user.write(target)
+
+        :return: Lazy subclass of ``cls``.
+        :rtype: Type[Self]
+        """
+        if cls.__lazy__:
+            return cls
+        return cls._derived_class("lazy", "Lazy", {"__slots__": ("_lazy_datum",), "__lazy__": True})
+
+    @classmethod
+    def read(  # type: ignore[override]
+        cls: Type[Self],
+        source: BufferedIOBase,
+        writer_schema: Optional[WriterSchema] = None,
+        fields: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+    ) -> Self:
+        """Read encoded avro schema via DriverProxy into a new typed instance.
+
+        :param writer_schema: Schema the datum was written with, defaults to
+            this class's schema.
+        :type writer_schema: Optional[WriterSchema]
+        :param fields: Fields to read, defaults to all, see :meth:`projection`.
+        :type fields: Optional[Iterable[str]]
+        :param lazy: Decode fields on first access, see :meth:`lazy`.
+        :type lazy: bool
+        """
+        if fields is not None:
+            return cls.projection(*fields).read(source, writer_schema)
+        if lazy:
+            return cls.lazy().read(source, writer_schema)
+        return super().read(source, writer_schema)
+
+    @classmethod
+    def from_bytes(  # type: ignore[override]
+        cls: Type[Self],
+        buf: Buffer,
+        offset: int = 0,
+        writer_schema: Optional[WriterSchema] = None,
+        fields: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+    ) -> tuple[Self, int]:
+        """Read encoded avro schema from a buffer via DriverProxy into a new typed instance.
+
+        :param fields: Fields to read, defaults to all, see :meth:`projection`.
+        :type fields: Optional[Iterable[str]]
+        :param lazy: Decode fields on first access, see :meth:`lazy`.
+        :type lazy: bool
+        """
+        if fields is not None:
+            return cls.projection(*fields).from_bytes(buf, offset, writer_schema)
+        if lazy:
+            return cls.lazy().from_bytes(buf, offset, writer_schema)
+        return super().from_bytes(buf, offset, writer_schema)
+
+    @classmethod
+    def read_many(  # type: ignore[override]
+        cls: Type[Self],
+        source: BufferedIOBase,
+        count: Optional[int] = None,
+        writer_schema: Optional[WriterSchema] = None,
+        fields: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+    ) -> list[Self]:
+        """Read consecutive encoded avro schemas via DriverProxy into new typed instances.
+
+        :param fields: Fields to read, defaults to all, see :meth:`projection`.
+        :type fields: Optional[Iterable[str]]
+        :param lazy: Decode fields on first access, see :meth:`lazy`.
+        :type lazy: bool
+        """
+        if fields is not None:
+            return cls.projection(*fields).read_many(source, count, writer_schema)
+        if lazy:
+            return cls.lazy().read_many(source, count, writer_schema)
+        return super().read_many(source, count, writer_schema)
+
+    @classmethod
+    def iter_read(  # type: ignore[override]
+        cls: Type[Self],
+        source: BufferedIOBase,
+        buffer_size: int = ITER_READ_BUFFER_SIZE,
+        writer_schema: Optional[WriterSchema] = None,
+        fields: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+    ) -> Iterator[Self]:
+        """Lazily read consecutive encoded avro schemas via DriverProxy until the end of ``source``.
+
+        :param fields: Fields to read, defaults to all, see :meth:`projection`.
+        :type fields: Optional[Iterable[str]]
+        :param lazy: Decode fields on first access, see :meth:`lazy`.
+        :type lazy: bool
+        """
+        if fields is not None:
+            return cls.projection(*fields).iter_read(source, buffer_size, writer_schema)
+        if lazy:
+            return cls.lazy().iter_read(source, buffer_size, writer_schema)
+        return super().iter_read(source, buffer_size, writer_schema)
+
+
+class NeoGenDictRecord(NeoGenRecord):
+    """Generated RecordSchema base class holding field values in a ``_datum`` dict."""
+
+    __slots__ = ("_datum",)
+
+    def __init__(self) -> None:
+        """Construct default instance.
+
+        NB. This is designed to be overwritten.
+        """
+        self._datum = {}
+
+
+class NeoGenSlotsRecord(NeoGenRecord):
+    """Generated RecordSchema base class with one slot per field.
+
+    Generated subclasses declare ``__slots__`` naming each Avro field, in
+    schema order, and store field values directly in those slots rather than
+    in a per-instance ``_datum`` dict. The same names are listed in
+    ``__fields__``, which subclasses inherit unchanged whatever slots they
+    add.
+    """
+
+    __slots__: tuple[str, ...] = ()
+    __fields__: tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        """Construct default instance.
+
+        NB. This is designed to be overwritten.
+        """
+
+    @property  # type: ignore
+    def _datum(self) -> NeoGenRecordDatum:  # type: ignore
+        """Field values keyed by field name, built from the instance slots."""
+        return {key: getattr(self, key) for key in self.__projection__ or self.__fields__}
+
+    def encode(self) -> NeoGenRecordDatum:
+        """Encode record as avro json."""
+        datum: NeoGenRecordDatum = {}
+        for key in self.__projection__ or self.__fields__:
+            value = getattr(self, key)
+            datum[key] = value.encode() if isinstance(value, AbstractNeoGenObject) else value
+        return datum
+
+    @classmethod
+    def _decode_projection(cls: Type[Self], datum: NeoGenRecordDatum) -> Self:
+        record = cls.__new__(cls)
+        for name in cls.__projection__:  # type: ignore
+            setattr(record, name, datum[name])
+        return record
+
+    @classmethod
+    def _decode_lazy(cls: Type[Self], datum: LazyDatum) -> Self:
+        record = cls.__new__(cls)
+        object.__setattr__(record, "_lazy_datum", datum)
+        return record
+
+    @classmethod
+    def lazy(cls: Type[Self]) -> Type[Self]:
+        """Subclass whose instances decode each field on first access.
+
+        Unread fields are left unset, and decoded into their slot by
+        ``__getattr__`` when first read. See :meth:`NeoGenRecord.lazy`.
+        """
+        if cls.__lazy__:
+            return cls
+        return cls._derived_class(
+            "lazy",
+            "Lazy",
+            {
+                "__slots__": ("_lazy_datum",),
+                "__lazy__": True,
+                "__getattr__": _lazy_slots_getattr,
+                "__setattr__": _lazy_slots_setattr,
+            },
+        )
+
+
+def _projection_getattr(self: NeoGenRecord, name: str) -> Any:
+    if any(field["name"] == name for field in self.__canonical_schema__["fields"]):
+        raise NeoGenAttributeError(f"{self.__class__.__name__} does not read field {name!r}")
+    raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+
+def _lazy_slots_getattr(self: NeoGenSlotsRecord, name: str) -> Any:
+    if name == "_lazy_datum":
+        # Unset on instances which were constructed or decoded eagerly.
+        return None
+    lazy_datum = self._lazy_datum
+    if lazy_datum is None or name not in lazy_datum:
+        raise AttributeError(name)
+    value = lazy_datum[name]
+    object.__setattr__(self, name, value)
+    return value
+
+
+def _lazy_slots_setattr(self: NeoGenSlotsRecord, name: str, value: Any) -> None:
+    object.__setattr__(self, name, value)
+    lazy_datum = self._lazy_datum
+    if lazy_datum is not None:
+        lazy_datum.modified = True
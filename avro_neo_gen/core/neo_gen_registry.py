@@ -0,0 +1,169 @@
+"""Runtime registry of generated classes keyed by schema fingerprint."""
+
+import json
+from typing import TYPE_CHECKING, Any, Optional, Type
+from weakref import WeakValueDictionary
+
+from avro_neo_gen.core.neo_gen_error import NeoGenFingerprintNotFound
+
+if TYPE_CHECKING:
+    from avro_neo_gen.core.abstract_neo_gen_object import AbstractNeoGenObject
+
+__all__ = [
+    "fingerprint64",
+    "lookup_schema_type",
+    "parsing_canonical_form",
+    "register_schema_type",
+    "registered_schema_type",
+]
+
+_schema_types: "WeakValueDictionary[bytes, Type[AbstractNeoGenObject]]" = WeakValueDictionary()
+
+_EMPTY64 = 0xC15D213AA4D7A795
+
+
+def _fingerprint64_table() -> list[int]:
+    table = []
+    for index in range(256):
+        fingerprint = index
+        for _ in range(8):
+            fingerprint = (fingerprint >> 1) ^ (_EMPTY64 & -(fingerprint & 1))
+        table.append(fingerprint)
+    return table
+
+
+_FINGERPRINT64_TABLE = _fingerprint64_table()
+
+
+def fingerprint64(canonical_form: str) -> bytes:
+    """CRC-64-AVRO fingerprint of a schema's Parsing Canonical Form.
+
+    Generated classes carry their fingerprint as ``__fingerprint64__``, this
+    is only needed for schemas only known at runtime, such as those fetched
+    from a schema registry.
+
+    :param canonical_form: Parsing Canonical Form of the schema.
+    :type canonical_form: str
+    :return: Fingerprint, 8 bytes little-endian.
+    :rtype: bytes
+    """
+    fingerprint = _EMPTY64
+    for byte in canonical_form.encode("utf-8"):
+        fingerprint = (fingerprint >> 8) ^ _FINGERPRINT64_TABLE[(fingerprint ^ byte) & 0xFF]
+    return fingerprint.to_bytes(8, "little")
+
+
+_PRIMITIVE_TYPES = frozenset(("null", "boolean", "int", "long", "float", "double", "bytes", "string"))
+_NAMED_TYPES = frozenset(("record", "error", "enum", "fixed"))
+
+
+def _canonical_fullname(name: str, namespace: Optional[str]) -> str:
+    if "." in name or not namespace:
+        return name
+    return f"{namespace}.{name}"
+
+
+def _canonical_schema(schema: Any, namespace: Optional[str], names: dict[str, Any]) -> Any:
+    """Apply the PRIMITIVES, FULLNAMES, STRIP and ORDER transforms.
+
+    Mirrors the output of the Apache Avro python library, which generated
+    fingerprints are computed with, where it departs from the spec: fixed
+    schemas are always written in full, and primitives with any attribute
+    besides ``type`` are written as objects.
+    """
+    match schema:
+        case str() if schema in _PRIMITIVE_TYPES:
+            return schema
+        case str():
+            fullname = _canonical_fullname(schema, namespace)
+            definition = names.get(fullname)
+            return definition if definition is not None and definition["type"] == "fixed" else fullname
+        case list():
+            return [_canonical_schema(branch, namespace, names) for branch in schema]
+        case {"type": str(type_name)} if type_name in _PRIMITIVE_TYPES:
+            return type_name if len(schema) == 1 else {"type": type_name}
+        case {"type": str(type_name)} if type_name in _NAMED_TYPES:
+            fullname = _canonical_fullname(schema["name"], schema.get("namespace", namespace))
+            if fullname in names and type_name != "fixed":
+                return fullname
+            namespace = fullname.rpartition(".")[0] or None
+            canonical: dict[str, Any] = {"name": fullname, "type": type_name}
+            names[fullname] = canonical
+            if "fields" in schema:
+                canonical["fields"] = [
+                    {"name": field["name"], "type": _canonical_schema(field["type"], namespace, names)}
+                    for field in schema["fields"]
+                ]
+            if "symbols" in schema:
+                canonical["symbols"] = schema["symbols"]
+            if "size" in schema:
+                canonical["size"] = int(schema["size"])
+            return canonical
+        case {"type": "array"}:
+            return {"type": "array", "items": _canonical_schema(schema["items"], namespace, names)}
+        case {"type": "map"}:
+            return {"type": "map", "values": _canonical_schema(schema["values"], namespace, names)}
+        case {"type": type_schema}:
+            return _canonical_schema(type_schema, namespace, names)
+        case _:
+            raise ValueError(f"Unsupported Avro schema: {schema!r}")
+
+
+def parsing_canonical_form(schema: Any) -> str:
+    """Parsing Canonical Form of a schema, per the Avro specification.
+
+    The output matches :attr:`avro.schema.Schema.canonical_form`, so
+    fingerprints of runtime schemas agree with the ``__fingerprint64__`` of
+    generated classes.
+
+    :param schema: Schema as JSON text, or as decoded JSON. Bare primitive
+        type names are accepted either way.
+    :type schema: Any
+    :return: Parsing Canonical Form.
+    :rtype: str
+    :raises ValueError: If ``schema`` is not a valid Avro schema.
+    """
+    if isinstance(schema, bytes) or isinstance(schema, str) and schema not in _PRIMITIVE_TYPES:
+        schema = json.loads(schema)
+    return json.dumps(_canonical_schema(schema, None, {}), separators=(",", ":"))
+
+
+def register_schema_type(schema_type: Type["AbstractNeoGenObject"]) -> None:
+    """Register a generated class under its CRC-64-AVRO fingerprint.
+
+    Generated classes are registered automatically when they are defined,
+    see :meth:`AbstractNeoGenObject.__init_subclass__`. Registering a class
+    with the fingerprint of an existing entry replaces that entry, so the
+    most recently imported definition of a schema wins.
+
+    :param schema_type: Generated class with a ``__fingerprint64__``.
+    :type schema_type: Type[AbstractNeoGenObject]
+    """
+    _schema_types[schema_type.__fingerprint64__] = schema_type
+
+
+def registered_schema_type(fingerprint: bytes) -> Optional[Type["AbstractNeoGenObject"]]:
+    """Fetch the generated class registered for a fingerprint, if any.
+
+    :param fingerprint: CRC-64-AVRO fingerprint, 8 bytes little-endian.
+    :type fingerprint: bytes
+    :return: Registered class or `None`.
+    :rtype: Optional[Type[AbstractNeoGenObject]]
+    """
+    return _schema_types.get(bytes(fingerprint))
+
+
+def lookup_schema_type(fingerprint: bytes) -> Type["AbstractNeoGenObject"]:
+    """Fetch the generated class registered for a fingerprint.
+
+    :param fingerprint: CRC-64-AVRO fingerprint, 8 bytes little-endian.
+    :type fingerprint: bytes
+    :return: Registered class.
+    :rtype: Type[AbstractNeoGenObject]
+    :raises NeoGenFingerprintNotFound: If no class has been registered for
+        ``fingerprint``.
+    """
+    schema_type = registered_schema_type(fingerprint)
+    if schema_type is None:
+        raise NeoGenFingerprintNotFound(f"No generated class registered for fingerprint: {bytes(fingerprint).hex()}")
+    return schema_type
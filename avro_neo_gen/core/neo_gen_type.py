@@ -9,8 +9,13 @@ from avro_neo_gen.core.type_defs import AvroSchemaTypeAlias
 class NeoGenType(Protocol):
     """Generated Avro NeoGen type Protocol."""
 
+    __slots__ = ()
+
     __canonical_schema__: OrderedDict[str, Any]
     __schema__: AvroSchemaTypeAlias
+    __fingerprint64__: bytes
+    __fingerprint_md5__: bytes
+    __fingerprint_sha256__: bytes
 
     @property
     def canonical_schema(self) -> OrderedDict[str, Any]:
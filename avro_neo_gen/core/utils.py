@@ -1,9 +1,21 @@
 """Public utility functions."""
 
 import inspect
+import re
 from types import FrameType
 from typing import Any, Optional
 
+from avro_neo_gen.core.neo_gen_error import NeoGenRuntimeVersionError
+
+_RELEASE_PATTERN = re.compile(r"\d+(?:\.\d+)*")
+
+
+def _release(version: str) -> tuple[int, ...]:
+    match = _RELEASE_PATTERN.match(version)
+    if match is None:
+        raise NeoGenRuntimeVersionError(f"Invalid Avro NeoGen version: {version!r}")
+    return tuple(map(int, match.group().split("."))) + (0, 0, 0)
+
 
 def record_builder_internal(self_name: str = "cls") -> dict[str, Any]:
     """Build a Record datum dict based on the kwargs of the enclosing method.
@@ -31,3 +43,24 @@ def record_builder_internal(self_name: str = "cls") -> dict[str, Any]:
 
     keys, _, _, values = inspect.getargvalues(current_frame)
     return {key: values[key] for key in keys if key != self_name}
+
+
+def require_runtime_version(version: str) -> None:
+    """Check the installed runtime can load a package generated by ``version``.
+
+    Packages linked against a shared runtime call this from their root
+    ``__init__.py``, in place of vendoring the corelib. The runtime must be
+    of the same major and minor version as the generator, and no older.
+
+    :param version: Avro NeoGen version the package was generated with.
+    :type version: str
+    :raises NeoGenRuntimeVersionError: If the installed runtime is not
+        compatible.
+    """
+    from avro_neo_gen.core import __version__
+
+    required, installed = _release(version)[:3], _release(__version__)[:3]
+    if installed[:2] != required[:2] or installed < required:
+        raise NeoGenRuntimeVersionError(
+            f"Package generated by Avro NeoGen {version} can not be loaded by the installed runtime {__version__}"
+        )
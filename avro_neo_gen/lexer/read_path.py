@@ -1,6 +1,9 @@
 """Parse Avro schemas from a directory."""
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Iterator, Union
 
@@ -10,7 +13,39 @@ from avro.schema import Schema
 __all__ = ["read_path"]
 
 
-def read_path(path: Union[str, Path], extension: str = "avsc", encoding: str = "utf-8") -> Iterator[Schema]:
+def _read_file(avro_file: Path, encoding: str) -> Schema:
+    """Read and parse a single avro schema file."""
+    avro_text = avro_file.read_text(encoding=encoding)
+    avro_json = json.loads(avro_text)
+    match avro_json:
+        case str():
+            raise NotImplementedError
+        case list():
+            raise NotImplementedError
+        case dict():
+            return avro.schema.parse(avro_text)
+        case _:
+            raise NotImplementedError
+
+
+def _annotate_errors(avro_files: list[Path], schemas: Iterator[Schema]) -> Iterator[Schema]:
+    """Pair each lexed schema with its file, noting the file on any error.
+
+    Notes are added here, rather than in :func:`_read_file`, as not every
+    exception keeps its notes when pickled back from a worker process.
+    """
+    for avro_file in avro_files:
+        try:
+            schema = next(schemas)
+        except Exception as exc:
+            exc.add_note(f"Failed to lex Avro schema file: {avro_file}")
+            raise
+        yield schema
+
+
+def read_path(
+    path: Union[str, Path], extension: str = "avsc", encoding: str = "utf-8", jobs: int = 1
+) -> Iterator[Schema]:
     """Read avro schema files into memory.
 
     :param path: Source directory containing avro schema files.
@@ -19,11 +54,17 @@ def read_path(path: Union[str, Path], extension: str = "avsc", encoding: str = "
     :type extension: str
     :param encoding: Text encoding of Avro schema files, defaults to ``"utf-8"``.
     :type encoding: str
+    :param jobs: Number of worker processes used to read and parse files,
+        ``0`` uses one per CPU, defaults to ``1`` which lexes in process.
+    :type jobs: int
     :return: A stream of avro schema files loaded into memory as Apache Avro objects.
     :rtype: Iterator[Schema]:
 
     Conceptually, one schema is a "token" for our compiler.
 
+    Schemas are always produced in sorted file path order, whatever the
+    number of ``jobs``. Errors carry a note naming the file which raised them.
+
     .. note:: If the extension of the ``path`` parameter matches the
         ``extension`` parameter then ``read_path`` will assume it is lexing a
         single file, otherwise it will search for all files under ``path``
@@ -36,15 +77,13 @@ def read_path(path: Union[str, Path], extension: str = "avsc", encoding: str = "
     else:
         avro_files = sorted(path.glob(f"**/*.{extension}"))
 
-    for avro_file in avro_files:
-        avro_text = avro_file.read_text(encoding=encoding)
-        avro_json = json.loads(avro_text)
-        match avro_json:
-            case str():
-                raise NotImplementedError
-            case list():
-                raise NotImplementedError
-            case dict():
-                yield avro.schema.parse(avro_text)
-            case _:
-                raise NotImplementedError
+    read_file = partial(_read_file, encoding=encoding)
+
+    if jobs == 1 or len(avro_files) <= 1:
+        yield from _annotate_errors(avro_files, map(read_file, avro_files))
+        return
+
+    workers = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(avro_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _annotate_errors(avro_files, executor.map(read_file, avro_files, chunksize=chunksize))
@@ -1,6 +1,14 @@
-from .avro_schema_required_imports import avro_schema_required_imports
+from .avro_schema_required_imports import (
+    avro_schema_foreign_namespaces,
+    avro_schema_required_imports,
+)
 from .emit_linker_file_map import emit_linker_file_map
+from .emit_linker_file_map_incremental import emit_linker_file_map_incremental
 from .inject_corelib_sys_path_shim import inject_corelib_sys_path_shim
-from .link_compiler_namespace_map import link_compiler_namespace_map
+from .inject_runtime_version_check import inject_runtime_version_check
+from .link_compiler_namespace_map import (
+    iter_link_compiler_namespace_map,
+    link_compiler_namespace_map,
+)
 from .link_corelib import link_corelib
-from .link_module import link_module
+from .link_module import iter_link_module, link_module
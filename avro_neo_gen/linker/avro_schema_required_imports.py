@@ -1,5 +1,7 @@
 """Identify required imports for a AvroSchema."""
 
+from typing import Iterator
+
 from avro.schema import (
     EnumSchema,
     FixedDecimalSchema,
@@ -30,12 +32,33 @@ def _logical_schema_required_imports(avro_schema: AvroSchema[LogicalSchema]) ->
             raise NotImplementedError
 
 
-def avro_schema_required_imports(avro_schema: AvroSchema[Schema]) -> LinkerRequiredImports:
+def avro_schema_foreign_namespaces(avro_schema: AvroSchema[Schema]) -> set[str]:
+    """Identify other namespaces whose schemas an AvroSchema refers to.
+
+    :param avro_schema: AvroSchema container of the Schema whos foreign
+        namespaces we are resolving.
+    :type avro_schema: :class:`AvroSchema[:class:`avro.schema.Schema`]`
+    :return: Namespaces of the contained schemas, other than the namespace
+        of ``avro_schema`` itself.
+    :rtype: set[str]
+    """
+    contained_schemas: Iterator[AvroSchema[Schema]] = avro_schema.contained_schemas()
+    return {
+        schema.namespace
+        for schema in contained_schemas
+        if schema.namespace and schema.namespace != avro_schema.namespace
+    }
+
+
+def avro_schema_required_imports(avro_schema: AvroSchema[Schema], slots: bool = False) -> LinkerRequiredImports:
     """Identify required imports for a AvroSchema.
 
     :param avro_schmea: AvroSchema container of the Schema whos required
         imports we are resolving.
     :type avro_schmea: :class:`AvroSchema[:class:`avro.schema.Schema`]`
+    :param slots: Records were compiled in ``__slots__`` mode, defaults to
+        `False`.
+    :type slots: bool
     :return: Map of namespace to set of classes required by the provided schema.
     :rtype: :class:`LinkerRequiredImports`
 
@@ -52,10 +75,8 @@ def avro_schema_required_imports(avro_schema: AvroSchema[Schema]) -> LinkerRequi
             if isinstance(avro_schema.schema, LogicalSchema):
                 required_imports = _logical_schema_required_imports(avro_schema)
         case RecordSchema():  # type: ignore
-            required_imports = {
-                "avro_neo_gen.core": {"AbstractNeoGenRecordBuilder", "NeoGenRecord"},
-                "avro_neo_gen.core.utils": {"record_builder_internal"},
-            }
+            record_base = "NeoGenSlotsRecord" if slots else "NeoGenDictRecord"
+            required_imports = {"avro_neo_gen.core": {"AbstractNeoGenRecordBuilder", record_base}}
         case EnumSchema():  # type: ignore
             required_imports = {"avro_neo_gen.core": {"NeoGenEnum"}}
         case FixedDecimalSchema():  # type: ignore
@@ -69,17 +90,17 @@ def avro_schema_required_imports(avro_schema: AvroSchema[Schema]) -> LinkerRequi
         case _:
             raise NotImplementedError
 
-    foreign_contained_schemas = [
-        schema
-        for schema in avro_schema.contained_schemas()
-        if schema.namespace and schema.namespace != avro_schema.namespace
-    ]
-    if foreign_contained_schemas:
+    foreign_namespaces = avro_schema_foreign_namespaces(avro_schema)
+    if foreign_namespaces:
         required_imports = dict_func_reduce(
             set.union,
             [
                 required_imports,
-                *[{schema.namespace: {schema.name}} for schema in foreign_contained_schemas],
+                *[
+                    {schema.namespace: {schema.name}}
+                    for schema in avro_schema.contained_schemas()
+                    if schema.namespace in foreign_namespaces
+                ],
             ],
         )
 
@@ -1,22 +1,33 @@
 """Write a linker file map to disk."""
 
 import ast
+import shutil
 from pathlib import Path
 from typing import Union
 
-from avro_neo_gen.type_defs import LinkerFileMap
+from avro_neo_gen.type_defs import LinkerFileMap, LinkerFileMapItems, LinkerSourceFile
 
 
-def emit_linker_file_map(linker_file_map: LinkerFileMap, base_path: Union[str, Path] = "./build") -> None:
+def emit_linker_file_map(
+    linker_file_map: Union[LinkerFileMap, LinkerFileMapItems], base_path: Union[str, Path] = "./build"
+) -> None:
     """Write a linker file map to disk.
 
-    :param linker_file_map: Linker file map to commit to disk.
-    :type linker_file_map: :class:`LinkerFileMap`
+    :param linker_file_map: Linker file map to commit to disk, or its items,
+        modules which are already unparsed are written as is, and
+        :class:`LinkerSourceFile` entries are copied. Items are written as
+        they are produced, see :func:`iter_link_module`.
+    :type linker_file_map: Union[:class:`LinkerFileMap`, :class:`LinkerFileMapItems`]
     :param base_path: Base path to write generated files and directories.
     :type base_path: Union[str, :class:`pathlib.Path`]
     """
     base_path = Path(base_path)
-    for filename, module in linker_file_map.items():
+    items = linker_file_map.items() if isinstance(linker_file_map, dict) else linker_file_map
+    for filename, module in items:
         file_path = base_path / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(ast.unparse(module) + "\n", encoding="utf-8")
+        if isinstance(module, LinkerSourceFile):
+            shutil.copyfile(module.path, file_path)
+            continue
+        source = module if isinstance(module, str) else ast.unparse(module)
+        file_path.write_text(source + "\n", encoding="utf-8")
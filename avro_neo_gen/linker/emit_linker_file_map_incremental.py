@@ -0,0 +1,150 @@
+"""Incrementally write a linker file map to disk."""
+
+import ast
+import hashlib
+import json
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from avro_neo_gen.type_defs import LinkerFileMap, LinkerFileMapItems, LinkerSourceFile
+
+MANIFEST_FILENAME = ".avro_neo_gen_manifest.json"
+
+
+class LinkerEmitReport(NamedTuple):
+    """Generated file paths, relative to the base path, by outcome."""
+
+    written: list[str]
+    unchanged: list[str]
+    deleted: list[str]
+
+
+class _ManifestEntry(NamedTuple):
+    """Digest of a generated file, and its size and mtime once written."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+def _read_manifest_entry(entry: object) -> Optional[_ManifestEntry]:
+    try:
+        return _ManifestEntry(**entry)  # type: ignore
+    except TypeError:
+        return None
+
+
+def _read_manifest(manifest_path: Path) -> dict[str, Optional[_ManifestEntry]]:
+    """Read the previous manifest, entries which can not be trusted are `None`."""
+    try:
+        files = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+    if not isinstance(files, dict):
+        return {}
+    return {filename: _read_manifest_entry(entry) for filename, entry in files.items()}
+
+
+def _stat_manifest_entry(file_path: Path, digest: str) -> _ManifestEntry:
+    stat = file_path.stat()
+    return _ManifestEntry(sha256=digest, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def _is_unchanged(file_path: Path, entry: _ManifestEntry, digest: str) -> bool:
+    """Check a file is as it was written, without reading it."""
+    if entry.sha256 != digest:
+        return False
+    try:
+        return _stat_manifest_entry(file_path, digest) == entry
+    except OSError:
+        return False
+
+
+def _prune_empty_dirs(directory: Path, base_path: Path) -> None:
+    while directory != base_path and directory.is_dir() and not any(directory.iterdir()):
+        directory.rmdir()
+        directory = directory.parent
+
+
+def emit_linker_file_map_incremental(
+    linker_file_map: Union[LinkerFileMap, LinkerFileMapItems], base_path: Union[str, Path] = "./build"
+) -> LinkerEmitReport:
+    """Write a linker file map to disk, touching only files that changed.
+
+    :param linker_file_map: Linker file map to commit to disk, or its items,
+        which are written as they are produced.
+    :type linker_file_map: Union[:class:`LinkerFileMap`, :class:`LinkerFileMapItems`]
+    :param base_path: Base path to write generated files and directories.
+    :type base_path: Union[str, :class:`pathlib.Path`]
+    :return: Paths written, left unchanged, and deleted.
+    :rtype: :class:`LinkerEmitReport`
+
+    A manifest of the SHA-256, size and mtime of every generated file is
+    kept in ``base_path``. Files are only rewritten when their content
+    changes, so their mtimes, and any bytecode or packaging caches keyed on
+    them, stay valid. Files listed in the previous manifest but no longer
+    generated are deleted, files which were never generated, and manifest
+    paths outside ``base_path``, are left alone.
+
+    Files whose digest, size and mtime all match the manifest are skipped
+    without being read, and :class:`LinkerSourceFile` entries carry their
+    digest, so unchanged ones are skipped without reading their source
+    either. Files edited or damaged since they were written no longer match
+    their size and mtime, and are compared in full and restored.
+    """
+    base_path = Path(base_path)
+    manifest_path = base_path / MANIFEST_FILENAME
+    previous_manifest = _read_manifest(manifest_path)
+    manifest: dict[str, _ManifestEntry] = {}
+    report = LinkerEmitReport(written=[], unchanged=[], deleted=[])
+
+    items = linker_file_map.items() if isinstance(linker_file_map, dict) else linker_file_map
+    for filename, module in items:
+        if isinstance(module, LinkerSourceFile):
+            source_path, digest = module.path, module.sha256
+        else:
+            source = (module if isinstance(module, str) else ast.unparse(module)) + "\n"
+            data = source.encode("utf-8")
+            source_path, digest = None, hashlib.sha256(data).hexdigest()
+
+        file_path = base_path / filename
+        previous_entry = previous_manifest.get(filename)
+        if previous_entry is not None and _is_unchanged(file_path, previous_entry, digest):
+            manifest[filename] = previous_entry
+            report.unchanged.append(filename)
+            continue
+
+        if source_path is not None:
+            data = source_path.read_bytes()
+
+        if file_path.is_file() and file_path.read_bytes() == data:
+            report.unchanged.append(filename)
+        else:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(data)
+            report.written.append(filename)
+        manifest[filename] = _stat_manifest_entry(file_path, digest)
+
+    report.written.sort()
+    report.unchanged.sort()
+
+    resolved_base_path = base_path.resolve()
+    for filename in sorted(previous_manifest.keys() - manifest.keys()):
+        file_path = base_path / filename
+        if not file_path.resolve().is_relative_to(resolved_base_path):
+            continue
+        file_path.unlink(missing_ok=True)
+        _prune_empty_dirs(file_path.parent, base_path)
+        report.deleted.append(filename)
+
+    manifest_source = (
+        json.dumps(
+            {"files": {filename: entry._asdict() for filename, entry in manifest.items()}}, indent=2, sort_keys=True
+        )
+        + "\n"
+    )
+    if not manifest_path.is_file() or manifest_path.read_text(encoding="utf-8") != manifest_source:
+        base_path.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(manifest_source, encoding="utf-8")
+
+    return report
@@ -3,7 +3,8 @@
 import ast
 from inspect import cleandoc
 
-from avro_neo_gen.type_defs import LinkerFileMap
+from avro_neo_gen.type_defs import LinkerFileMap, LinkerSourceFile
+from avro_neo_gen.utils import join_unparsed
 
 
 def inject_corelib_sys_path_shim(linker_file_map: LinkerFileMap) -> LinkerFileMap:
@@ -43,6 +44,11 @@ def inject_corelib_sys_path_shim(linker_file_map: LinkerFileMap) -> LinkerFileMa
         )
     )
     current_module = linker_file_map.get("__init__.py", ast.Module(type_ignores=[], body=[]))
+    if isinstance(current_module, LinkerSourceFile):
+        current_module = ast.parse(current_module.path.read_text(encoding="utf-8"))
+    if isinstance(current_module, str):
+        return linker_file_map | {"__init__.py": join_unparsed([ast.unparse(loader_shim_ast), current_module])}
+
     current_module.body = [
         *loader_shim_ast.body,
         *current_module.body,
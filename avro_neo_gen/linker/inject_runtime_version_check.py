@@ -0,0 +1,81 @@
+"""Inject shared runtime version check."""
+
+import ast
+from typing import Optional, Union
+
+from avro_neo_gen.core import UNKNOWN_VERSION
+from avro_neo_gen.core.neo_gen_error import NeoGenValueError
+from avro_neo_gen.type_defs import LinkerFileMap, LinkerSourceFile
+from avro_neo_gen.utils import join_unparsed
+
+
+def _inject_module(
+    module: Union[ast.Module, str, LinkerSourceFile], version_check_ast: ast.Module
+) -> Union[ast.Module, str]:
+    if isinstance(module, LinkerSourceFile):
+        module = ast.parse(module.path.read_text(encoding="utf-8"))
+    if isinstance(module, str):
+        return join_unparsed([ast.unparse(version_check_ast), module])
+
+    module.body = [
+        *version_check_ast.body,
+        *module.body,
+    ]
+    return module
+
+
+def inject_runtime_version_check(linker_file_map: LinkerFileMap, version: Optional[str] = None) -> LinkerFileMap:
+    """Inject shared runtime version check.
+
+    :param linker_file_map: Generated modules of a package which does not
+        vendor the corelib.
+    :type linker_file_map: LinkerFileMap
+    :param version: Avro NeoGen version the package is generated with,
+        defaults to the running version.
+    :type version: Optional[str]
+    :return: Updated :class:`LinkerFileMap` with the version check injected.
+    :rtype: :class:`LinkerFileMap`
+    :raises NeoGenValueError: If ``version`` is not known, such as when Avro
+        NeoGen is run from a source checkout rather than installed. No
+        released runtime could load the package.
+
+    Used when the generated package imports the installed
+    ``avro_neo_gen.core``. The check is prepended to every module in
+    ``linker_file_map``, not only the package root, because a generated
+    namespace is still importable on its own if the package root is put on
+    ``sys.path`` by hand. Whichever way a module is imported, the installed
+    runtime is checked before any of its generated classes are defined.
+
+    .. highlight:: python
+    .. code-block::
+
+        # Version check
+
+        from avro_neo_gen.core.utils import require_runtime_version
+
+        require_runtime_version('0.2.0')
+    """
+    if version is None:
+        from avro_neo_gen.core import __version__ as version
+
+    if version == UNKNOWN_VERSION:
+        raise NeoGenValueError(
+            f"Avro NeoGen version is unknown ({UNKNOWN_VERSION}), install avro-neo-gen to link a shared runtime package"
+        )
+
+    version_check_ast = ast.Module(
+        body=[
+            ast.ImportFrom(
+                module="avro_neo_gen.core.utils", names=[ast.alias(name="require_runtime_version")], level=0
+            ),
+            ast.Expr(
+                value=ast.Call(
+                    func=ast.Name(id="require_runtime_version", ctx=ast.Load()),
+                    args=[ast.Constant(value=version)],
+                    keywords=[],
+                )
+            ),
+        ],
+        type_ignores=[],
+    )
+    return {path: _inject_module(module, version_check_ast) for path, module in linker_file_map.items()}
@@ -1,40 +1,72 @@
 """Link compiler namespace map into a linker file map."""
 
-from ast import ImportFrom, Module, alias
+from ast import ImportFrom, Module, alias, stmt, unparse
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Union
 
 from avro_neo_gen.linker.avro_schema_required_imports import (
+    avro_schema_foreign_namespaces,
     avro_schema_required_imports,
 )
 from avro_neo_gen.type_defs import (
     CompilerNamespaceMap,
     CompilerNamespaceMapCell,
+    CompilerNamespaceMapItems,
     LinkerFileMap,
+    LinkerRequiredImports,
 )
-from avro_neo_gen.utils import dict_func_reduce, flat_map
+from avro_neo_gen.utils import dict_func_reduce, flat_map, join_unparsed
 
 
-def _link_map_entry(cells: Iterable[CompilerNamespaceMapCell]) -> Module:
+def _cell_required_imports(cell: CompilerNamespaceMapCell, slots: bool = False) -> LinkerRequiredImports:
+    if "required_imports" in cell:
+        return cell["required_imports"]
+    return avro_schema_required_imports(cell["schema"], slots=slots)
+
+
+def _cell_source(cell: CompilerNamespaceMapCell) -> str:
+    if "source" in cell:
+        return cell["source"]
+    return unparse(Module(body=cell["ast"] or [], type_ignores=[]))  # type: ignore[arg-type]
+
+
+def _link_map_entry(
+    namespace: str, cells: Iterable[CompilerNamespaceMapCell], slots: bool = False, relative_imports: bool = False
+) -> Union[Module, str]:
     """Determine requirements for a schema and link the AST.
 
+    :param namespace: Namespace the cells are linked into.
+    :type namespace: str
     :param cells: Internal :class:`CompilerNamespaceMap` list of cells containing
         avro schemas and compiled AST
     :type cells: Iterable[:class:`CompilerNamespaceMapCell`]
-    :return: Fully linked python AST for exporting
-    :rtype: :class:`ast.Module`
+    :param slots: Records were compiled in ``__slots__`` mode.
+    :type slots: bool
+    :param relative_imports: Import other generated namespaces relative to
+        the package root.
+    :type relative_imports: bool
+    :return: Fully linked python AST for exporting, or its unparsed source
+        if any cell was served from a compile cache.
+    :rtype: Union[:class:`ast.Module`, str]
     """
+    cells = list(cells)
     sorted_cells = sorted(cells, key=lambda cell: cell["schema"].name or "")
-    schemas = (cell["schema"] for cell in sorted_cells)
-    required_imports = dict_func_reduce(set.union, map(avro_schema_required_imports, schemas))
-    required_imports_ast = (
+    required_imports = dict_func_reduce(set.union, (_cell_required_imports(cell, slots=slots) for cell in sorted_cells))
+    relative_modules: set[str] = set()
+    if relative_imports:
+        relative_modules = set().union(*(avro_schema_foreign_namespaces(cell["schema"]) for cell in cells))
+    root_level = len([component for component in namespace.split(".") if component]) + 1
+    required_imports_ast: list[stmt] = [
         ImportFrom(
             module=module,
             names=[alias(name=name) for name in sorted(required_imports[module])],
-            level=0,
+            level=root_level if module in relative_modules else 0,
         )
         for module in sorted(required_imports.keys())
-    )
+    ]
+
+    if any("source" in cell for cell in cells):
+        return join_unparsed([unparse(Module(body=required_imports_ast, type_ignores=[])), *map(_cell_source, cells)])
 
     return Module(
         body=[
@@ -45,16 +77,47 @@ def _link_map_entry(cells: Iterable[CompilerNamespaceMapCell]) -> Module:
     )
 
 
-def link_compiler_namespace_map(compiler_namespace_map: CompilerNamespaceMap) -> LinkerFileMap:
+def iter_link_compiler_namespace_map(
+    compiler_namespace_items: CompilerNamespaceMapItems, slots: bool = False, relative_imports: bool = False
+) -> Iterator[tuple[str, Union[Module, str]]]:
+    """Link compiled namespaces into linker file map items, one at a time.
+
+    :param compiler_namespace_items: Namespaces and their compiled cells,
+        such as the items of a :class:`CompilerNamespaceMap` or the output of
+        :func:`iter_compile_parser_namespace_map`.
+    :type compiler_namespace_items: :class:`CompilerNamespaceMapItems`
+    :param slots: Records were compiled in ``__slots__`` mode, defaults to
+        `False`.
+    :type slots: bool
+    :param relative_imports: Import other generated namespaces relative to
+        the package root, so the package does not need to be on
+        ``sys.path``, defaults to `False`.
+    :type relative_imports: bool
+    :return: Paths and linked modules, in the order of the namespaces.
+    :rtype: Iterator[tuple[str, Union[:class:`ast.Module`, str]]]
+    """
+    path_base = Path("")
+    for namespace, cells in compiler_namespace_items:
+        path = str(path_base.joinpath(*namespace.split(".")) / "__init__.py")
+        yield path, _link_map_entry(namespace, cells, slots=slots, relative_imports=relative_imports)
+
+
+def link_compiler_namespace_map(
+    compiler_namespace_map: CompilerNamespaceMap, slots: bool = False, relative_imports: bool = False
+) -> LinkerFileMap:
     """Link compiler namespace map into a linker file map.
 
     :param compiler_namespace_map: Compiler namespace map to link.
     :type compiler_namespace_map: CompilerNamespaceMap
+    :param slots: Records were compiled in ``__slots__`` mode, defaults to
+        `False`.
+    :type slots: bool
+    :param relative_imports: Import other generated namespaces relative to
+        the package root, defaults to `False`.
+    :type relative_imports: bool
     :return: Linked namespace map ready for merging with corelib.
     :rtype: :class:`avro_neo_gen.type_defs.LinkerFileMap`
     """
-    path_base = Path("")
-    return {
-        str(path_base.joinpath(*namespace.split(".")) / "__init__.py"): _link_map_entry(cells)
-        for namespace, cells in compiler_namespace_map.items()
-    }
+    return dict(
+        iter_link_compiler_namespace_map(compiler_namespace_map.items(), slots=slots, relative_imports=relative_imports)
+    )
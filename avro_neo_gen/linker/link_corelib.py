@@ -1,9 +1,24 @@
 """Link corelib files."""
 
-import ast
+import hashlib
 from pathlib import Path
 
-from avro_neo_gen.type_defs import LinkerFileMap
+from avro_neo_gen.type_defs import LinkerFileMap, LinkerSourceFile
+
+_corelib_digests: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def _corelib_digest(corelib_file: Path) -> str:
+    """SHA-256 of a corelib file, recomputed only when its size or mtime changes."""
+    stat = corelib_file.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _corelib_digests.get(corelib_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256(corelib_file.read_bytes()).hexdigest()
+    _corelib_digests[corelib_file] = (signature, digest)
+    return digest
 
 
 def link_corelib() -> LinkerFileMap:
@@ -11,6 +26,10 @@ def link_corelib() -> LinkerFileMap:
 
     :return: File map of the current corelib files.
     :rtype: ``avro_neo_gen.type_defs.LinkerFileMap``
+
+    Corelib files are not parsed, they are mapped to
+    :class:`LinkerSourceFile` entries and copied verbatim, comments
+    included. Their digests are kept for the life of the process.
     """
     lib_path = Path(__file__).absolute().parent.parent.parent
     corelib_path = lib_path / "avro_neo_gen" / "core"
@@ -22,6 +41,8 @@ def link_corelib() -> LinkerFileMap:
     )
 
     return {
-        str(corelib_file): ast.parse((corelib_path / corelib_file).read_text(encoding="utf-8"))
+        str(corelib_file): LinkerSourceFile(
+            path=corelib_path / corelib_file, sha256=_corelib_digest(corelib_path / corelib_file)
+        )
         for corelib_file in corelib_files
     }
@@ -1,26 +1,104 @@
 """Link compiled namespace map into final module file map."""
 
+from ast import Module
 from pathlib import Path
+from typing import Iterator, Union
 
 from avro_neo_gen.linker.inject_corelib_sys_path_shim import (
     inject_corelib_sys_path_shim,
 )
-from avro_neo_gen.linker.link_compiler_namespace_map import link_compiler_namespace_map
+from avro_neo_gen.linker.inject_runtime_version_check import (
+    inject_runtime_version_check,
+)
+from avro_neo_gen.linker.link_compiler_namespace_map import (
+    iter_link_compiler_namespace_map,
+)
 from avro_neo_gen.linker.link_corelib import link_corelib
-from avro_neo_gen.type_defs import CompilerNamespaceMap, LinkerFileMap
+from avro_neo_gen.type_defs import (
+    CompilerNamespaceMap,
+    CompilerNamespaceMapItems,
+    LinkerFileMap,
+    LinkerSourceFile,
+)
+
+
+def iter_link_module(
+    compiler_namespace_items: CompilerNamespaceMapItems, slots: bool = False, shared_runtime: bool = False
+) -> Iterator[tuple[str, Union[Module, str, LinkerSourceFile]]]:
+    """Link compiled namespaces into final module file map items, one at a time.
+
+    :param compiler_namespace_items: Namespaces and their compiled cells,
+        such as the output of :func:`iter_compile_parser_namespace_map`.
+    :type compiler_namespace_items: :class:`CompilerNamespaceMapItems`
+    :param slots: Records were compiled in ``__slots__`` mode, defaults to
+        `False`.
+    :type slots: bool
+    :param shared_runtime: Import the installed ``avro_neo_gen.core`` rather
+        than vendoring the corelib, defaults to `False`.
+    :type shared_runtime: bool
+    :return: Paths and linked modules, generated namespaces first, then the
+        corelib.
+    :rtype: Iterator[tuple[str, Union[:class:`ast.Module`, str, :class:`LinkerSourceFile`]]]
 
+    Yields the same files as :func:`link_module`. Each namespace is linked
+    only when the next item is requested, so passing the result to
+    :func:`emit_linker_file_map` writes each namespace before the next one
+    is compiled.
+    """
+    root_path = "__init__.py"
+    linked_root = False
+    for path, module in iter_link_compiler_namespace_map(
+        compiler_namespace_items, slots=slots, relative_imports=shared_runtime
+    ):
+        linker_file_map: LinkerFileMap = {path: module}
+        if path == root_path:
+            linked_root = True
+            if not shared_runtime:
+                linker_file_map = inject_corelib_sys_path_shim(linker_file_map)
+        if shared_runtime:
+            linker_file_map = inject_runtime_version_check(linker_file_map)
+        yield path, linker_file_map[path]
+
+    if not linked_root:
+        linker_file_map = {root_path: Module(body=[], type_ignores=[])}
+        if shared_runtime:
+            linker_file_map = inject_runtime_version_check(linker_file_map)
+        else:
+            linker_file_map = inject_corelib_sys_path_shim(linker_file_map)
+        yield root_path, linker_file_map[root_path]
+
+    if shared_runtime:
+        return
 
-def link_module(namespace_map: CompilerNamespaceMap) -> LinkerFileMap:
+    for path, source_file in link_corelib().items():
+        yield str(Path("avro_neo_gen") / "core" / path), source_file
+
+
+def link_module(
+    namespace_map: CompilerNamespaceMap, slots: bool = False, shared_runtime: bool = False
+) -> LinkerFileMap:
     """Link compiled namespace map into final module file map.
 
     :param namespace_map: Source compiled namespace map to link and join with corelib.
     :type namespace_map: :class:`CompilerNamespaceMap`
+    :param slots: Records were compiled in ``__slots__`` mode, defaults to
+        `False`.
+    :type slots: bool
+    :param shared_runtime: Import the installed ``avro_neo_gen.core`` rather
+        than vendoring the corelib, defaults to `False`.
+    :type shared_runtime: bool
     :return: Final linked namepsace map for emitting to disk.
     :rtype: :class:`LinkerFileMap`
+
+    The root ``__init__.py`` puts the package on ``sys.path``, so generated
+    namespaces, and the corelib copied into the package as
+    ``avro_neo_gen.core``, can be imported absolutely. With
+    ``shared_runtime``, the corelib is left out, every generated module
+    checks the installed runtime instead, see
+    :func:`inject_runtime_version_check`, and the package is left off
+    ``sys.path``. Every package in a process then shares one
+    ``avro_neo_gen.core``, and generated namespaces import each other
+    relative to the package root, so their names can not collide with
+    another package's.
     """
-    corelib_linker_file_map = link_corelib()
-    generated_linker_file_map = link_compiler_namespace_map(namespace_map)
-    injected_linker_file_map = inject_corelib_sys_path_shim(generated_linker_file_map)
-    return injected_linker_file_map | {
-        str(Path("avro_neo_gen") / "core" / path): ast for path, ast in corelib_linker_file_map.items()
-    }
+    return dict(iter_link_module(namespace_map.items(), slots=slots, shared_runtime=shared_runtime))
@@ -1 +1,2 @@
 from .parse_schema import parse_schema
+from .parser_index import ParserIndex, SchemaRedefinitionError
@@ -0,0 +1,115 @@
+"""Accumulating index of parsed Avro schemas."""
+
+from functools import cached_property
+from typing import Iterable, Iterator
+
+from avro.schema import Schema
+
+from avro_neo_gen.avro_schema import AvroSchema
+from avro_neo_gen.type_defs import ParserNamespaceMap
+
+__all__ = ["ParserIndex", "SchemaRedefinitionError"]
+
+
+class SchemaRedefinitionError(ValueError):
+    """Named schema is defined more than once with differing definitions."""
+
+
+class ParserIndex:
+    """Accumulating index of parsed Avro schemas.
+
+    Every schema node, including those contained in other schemas, is
+    appended to ``namespace_map`` under its calculated namespace, in depth
+    first, children first order. Named schemas are also indexed by
+    ``fullname`` and, on first access, by ``fingerprint``.
+
+    Named schemas are interned by fullname, only their first definition,
+    and the schemas it contains, is indexed. Any later definition must be
+    identical to the first or :class:`SchemaRedefinitionError` is raised.
+
+    Building the index costs time and memory linear in the number of schema
+    nodes.
+
+    .. highlight:: python
+    .. code-block::
+
+        index = ParserIndex.from_schemas(read_path("schemas"))
+        index.namespace_map["com.acme"]
+        index.by_fullname["com.acme.User"]
+    """
+
+    def __init__(self) -> None:
+        """Initialize :class:`ParserIndex`."""
+        self.namespace_map: ParserNamespaceMap = {}
+        self.by_fullname: dict[str, AvroSchema] = {}
+
+    @classmethod
+    def from_schemas(cls, schemas: Iterable[Schema]) -> "ParserIndex":
+        """Build an index of ``schemas`` and their contained schemas.
+
+        :param schemas: Avro schemas to be indexed.
+        :type schemas: Iterable[:class:`avro.schema.Schema`]
+        :return: New index.
+        :rtype: :class:`ParserIndex`
+        """
+        index = cls()
+        for schema in schemas:
+            index.add(AvroSchema(schema))
+        return index
+
+    def add(self, avro_schema: AvroSchema, namespace: str = ".") -> None:
+        """Index a schema and, recursively, its contained schemas.
+
+        :param avro_schema: Schema to be indexed.
+        :type avro_schema: :class:`AvroSchema`
+        :param namespace: Namespace inherited from the enclosing schema,
+            defaults to the root namespace ``"."``.
+        :type namespace: str
+        :raises SchemaRedefinitionError: If a named schema differs from an
+            earlier definition of the same fullname.
+        """
+        stack: list[tuple[AvroSchema, str, Iterator[AvroSchema]]] = []
+        pending: set[str] = set()
+
+        def push(schema: AvroSchema, inherited_namespace: str) -> None:
+            if schema.is_named:
+                fullname = schema.schema.fullname
+                if fullname in pending or self._is_interned(fullname, schema):
+                    return
+                pending.add(fullname)
+            stack.append((schema, schema.namespace or inherited_namespace, iter(schema)))
+
+        push(avro_schema, namespace)
+        while stack:
+            schema, schema_namespace, children = stack[-1]
+            depth = len(stack)
+            for child in children:
+                push(child, schema_namespace)
+                if len(stack) > depth:
+                    break
+            else:
+                stack.pop()
+                self._append(schema, schema_namespace)
+
+    def _is_interned(self, fullname: str, avro_schema: AvroSchema) -> bool:
+        interned = self.by_fullname.get(fullname)
+        if interned is None:
+            return False
+        if interned.schema is not avro_schema.schema and interned != avro_schema:
+            raise SchemaRedefinitionError(f"Conflicting definitions of named schema: {fullname}")
+        return True
+
+    def _append(self, avro_schema: AvroSchema, namespace: str) -> None:
+        self.namespace_map.setdefault(namespace, []).append(avro_schema)
+        if avro_schema.is_named:
+            self.by_fullname[avro_schema.schema.fullname] = avro_schema
+        self.__dict__.pop("by_fingerprint", None)
+
+    @cached_property
+    def by_fingerprint(self) -> dict[bytes, AvroSchema]:
+        """Named schemas keyed by CRC-64-AVRO Parsing Canonical Form fingerprint.
+
+        Fingerprints are comparatively expensive, so this index is only built
+        when first used, and rebuilt after further schemas are added.
+        """
+        return {avro_schema.fingerprint64: avro_schema for avro_schema in self.by_fullname.values()}
@@ -1,31 +1,54 @@
 """Internal type defs."""
 
 from ast import AST, Module
-from typing import Optional, TypedDict
+from pathlib import Path
+from typing import Iterable, NamedTuple, NotRequired, Optional, TypedDict, Union
 
 from avro_neo_gen.avro_schema import AvroSchema
 
 ParserNamespaceMap = dict[str, list[AvroSchema]]
 
 
+LinkerRequiredImports = dict[str, set[str]]
+
+
 class CompilerNamespaceMapCell(TypedDict):
     """Internal data class for compiler namespace.
 
     Contains the schema and compiled AST for the schema. Namespace is gathered
     from the parent key of the list containing the cell in the namespace map.
+
+    Cells served from a compile cache carry the unparsed ``source`` and
+    ``required_imports`` of the schema in place of its AST.
     """
 
     schema: AvroSchema
     ast: Optional[list[AST]]
+    source: NotRequired[str]
+    required_imports: NotRequired[LinkerRequiredImports]
 
 
 CompilerNamespaceMap = dict[str, list[CompilerNamespaceMapCell]]
 
 
+CompilerNamespaceMapItems = Iterable[tuple[str, list[CompilerNamespaceMapCell]]]
+
+
 ModuleImports = dict[str, set]
 
 
-LinkerRequiredImports = dict[str, set[str]]
+class LinkerSourceFile(NamedTuple):
+    """Existing file to be emitted byte for byte, in place of a module.
+
+    ``sha256`` is the hex digest of the file's content, so an incremental
+    emit can tell the file is unchanged without reading it.
+    """
+
+    path: Path
+    sha256: str
+
+
+LinkerFileMap = dict[str, Union[Module, str, LinkerSourceFile]]
 
 
-LinkerFileMap = dict[str, Module]
+LinkerFileMapItems = Iterable[tuple[str, Union[Module, str, LinkerSourceFile]]]
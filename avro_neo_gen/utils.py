@@ -9,6 +9,7 @@ __all__ = [
     "dict_func_reduce",
     "flat_map",
     "flat_map_gen",
+    "join_unparsed",
     "pyast_load_name",
     "pyast_store_name",
 ]
@@ -17,6 +18,8 @@ __all__ = [
 A = TypeVar("A")  # noqa: VNE001 Type variable, length dictated by industry convention
 B = TypeVar("B")  # noqa: VNE001 Type variable, length dictated by industry convention
 
+_UNPARSED_DEF_PREFIXES = ("@", "class ", "def ", "async def ")
+
 
 def pyast_module(body: list[AST]) -> Module:
     return Module(type_ignores=[], body=body)
@@ -79,3 +82,18 @@ def dict_func_merge(reducer: Callable[[B, B], B], left: dict[A, B], right: dict[
 def dict_func_reduce(reducer: Callable[[B, B], B], dicts: Iterable[dict[A, B]]) -> dict[A, B]:
     """Deep merge a list of dicts, joining the values by `reducer'."""
     return reduce(lambda left, right: dict_func_merge(reducer, left, right), dicts, {})
+
+
+def join_unparsed(fragments: Iterable[str]) -> str:
+    """Join unparsed statement lists as ``ast.unparse`` would one Module.
+
+    ``ast.unparse`` separates class and function definitions from any
+    preceding statement by a blank line, other statements by a newline.
+    Empty fragments are skipped.
+    """
+    source = ""
+    for fragment in filter(None, fragments):
+        if source:
+            source += "\n\n" if fragment.startswith(_UNPARSED_DEF_PREFIXES) else "\n"
+        source += fragment
+    return source
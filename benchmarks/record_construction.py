@@ -0,0 +1,73 @@
+"""Benchmark generated record construction for wide records.
+
+Compares the dict literal ``__init__`` emitted by the compiler against the
+frame inspecting :func:`avro_neo_gen.core.utils.record_builder_internal`
+``__init__`` emitted by earlier versions.
+
+.. code-block:: shell
+
+    python -m benchmarks.record_construction
+"""
+
+import ast
+import json
+import timeit
+from collections import OrderedDict
+from typing import Any
+
+import avro.schema
+
+from avro_neo_gen.avro_schema import AvroSchema
+from avro_neo_gen.compiler import compile_avro_schema
+from avro_neo_gen.core import AbstractNeoGenRecordBuilder, NeoGenDictRecord
+from avro_neo_gen.core.utils import record_builder_internal
+
+FIELD_COUNTS = (4, 16, 64, 256)
+NUMBER = 20_000
+
+
+def _compile_record(field_count: int) -> type:
+    """Compile a record with ``field_count`` long fields into a live class."""
+    schema = avro.schema.parse(
+        json.dumps(
+            {
+                "type": "record",
+                "name": f"Wide{field_count}",
+                "fields": [{"name": f"field_{index}", "type": "long"} for index in range(field_count)],
+            }
+        )
+    )
+    namespace: dict[str, Any] = {
+        "AbstractNeoGenRecordBuilder": AbstractNeoGenRecordBuilder,
+        "NeoGenDictRecord": NeoGenDictRecord,
+        "OrderedDict": OrderedDict,
+    }
+    exec(ast.unparse(ast.Module(body=compile_avro_schema(AvroSchema(schema)), type_ignores=[])), namespace)
+    return namespace[f"Wide{field_count}"]
+
+
+def _frame_inspecting_init(record_class: type, field_count: int) -> type:
+    """Subclass ``record_class`` with the legacy frame inspecting ``__init__``."""
+    arguments = ", ".join(f"field_{index}" for index in range(field_count))
+    namespace: dict[str, Any] = {"record_builder_internal": record_builder_internal}
+    exec(f"def __init__(self, {arguments}):\n    self._datum = record_builder_internal(self_name='self')", namespace)
+    return type(f"Legacy{record_class.__name__}", (record_class,), {"__init__": namespace["__init__"]})
+
+
+def main() -> None:
+    """Print per-construction cost before and after for each record width."""
+    print(f"{'fields':>8} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for field_count in FIELD_COUNTS:
+        record_class = _compile_record(field_count)
+        legacy_class = _frame_inspecting_init(record_class, field_count)
+        values = tuple(range(field_count))
+
+        assert record_class(*values).encode() == legacy_class(*values).encode()
+
+        before = timeit.timeit(lambda: legacy_class(*values), number=NUMBER) / NUMBER * 1e6
+        after = timeit.timeit(lambda: record_class(*values), number=NUMBER) / NUMBER * 1e6
+        print(f"{field_count:>8} {before:>12.2f} {after:>12.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
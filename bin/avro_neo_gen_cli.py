@@ -1,17 +1,36 @@
 """Command line utility for Avro NeoGen."""
 
 import sys
+from collections import deque
 from pathlib import Path
+from typing import Optional, Union
 
 import click
 import structlog
 
+from avro_neo_gen.compiler.compile_cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_PATH,
+    CompileCache,
+)
 from avro_neo_gen.compiler.compile_parser_namespace_map import (
     compile_parser_namespace_map,
+    iter_compile_parser_namespace_map,
 )
+from avro_neo_gen.core import UNKNOWN_VERSION, __version__
 from avro_neo_gen.lexer.read_path import read_path
-from avro_neo_gen.linker import emit_linker_file_map, link_module
+from avro_neo_gen.linker import (
+    emit_linker_file_map,
+    emit_linker_file_map_incremental,
+    iter_link_module,
+    link_module,
+)
 from avro_neo_gen.parser.parse_schema import parse_schema
+from avro_neo_gen.type_defs import (
+    LinkerFileMap,
+    LinkerFileMapItems,
+    ParserNamespaceMap,
+)
 
 from .configure_logging import configure_logging
 
@@ -27,6 +46,26 @@ def _rmtree(directory: Path) -> None:
     return directory.rmdir()
 
 
+def _evict_compile_cache(cache: Optional[CompileCache]) -> None:
+    if cache is not None:
+        cache.evict()
+        logger.info("Compile cache statistics", **cache.stats._asdict())
+
+
+def _stream_module(
+    parser_namespace_map: ParserNamespaceMap,
+    slots: bool,
+    cache: Optional[CompileCache],
+    jobs: int,
+    shared_runtime: bool,
+) -> LinkerFileMapItems:
+    compiler_namespace_items = iter_compile_parser_namespace_map(
+        parser_namespace_map, slots=slots, cache=cache, jobs=jobs
+    )
+    yield from iter_link_module(compiler_namespace_items, slots=slots, shared_runtime=shared_runtime)
+    _evict_compile_cache(cache)
+
+
 @click.group()
 @click.option(
     "-l",
@@ -54,7 +93,15 @@ def avro_neo_gen(log_level: str, log_format: str) -> None:
 @avro_neo_gen.command()
 def list_drivers() -> None:
     """List provided Avro protocol drivers."""
-    ignored_stems = ("__init__", "abstract_avro_driver", "avro_driver_type", "driver_proxy")
+    ignored_stems = (
+        "__init__",
+        "abstract_avro_driver",
+        "avro_driver_type",
+        "binary_codec",
+        "container_file",
+        "driver_proxy",
+        "schema_registry",
+    )
     source_base_path = Path(__file__).parent.parent
     driver_module_path = source_base_path / "avro_neo_gen" / "core" / "driver"
 
@@ -93,6 +140,80 @@ def list_drivers() -> None:
     envvar="AVRO_NEOGEN_COMPILE_DRIVER",
     help="Driver for managing avro data in generated code.",
 )
+@click.option(
+    "-s",
+    "--slots",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    envvar="AVRO_NEOGEN_COMPILE_SLOTS",
+    help="Generate __slots__ backed record classes.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=0),
+    envvar="AVRO_NEOGEN_COMPILE_JOBS",
+    help="Worker processes used to lex and compile Avro schemas, 0 for one per CPU.",
+)
+@click.option(
+    "-c",
+    "--cache-directory",
+    default=DEFAULT_CACHE_PATH,
+    show_default=True,
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="AVRO_NEOGEN_COMPILE_CACHE_DIRECTORY",
+    help="Directory of the persistent compile cache.",
+)
+@click.option(
+    "--cache-max-size",
+    default=DEFAULT_CACHE_MAX_SIZE,
+    show_default=True,
+    type=click.IntRange(min=0),
+    envvar="AVRO_NEOGEN_COMPILE_CACHE_MAX_SIZE",
+    help="Size in bytes the compile cache is trimmed to after each run.",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    show_default=True,
+    default=False,
+    envvar="AVRO_NEOGEN_COMPILE_CACHE",
+    help="Reuse compiled schemas from the compile cache, and store new ones in it. Ignored on dry runs.",
+)
+@click.option(
+    "-R",
+    "--shared-runtime",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    envvar="AVRO_NEOGEN_COMPILE_SHARED_RUNTIME",
+    help=(
+        "Import the installed avro_neo_gen runtime instead of copying the corelib into the target. "
+        "Namespaces import each other relative to the target, which is not put on sys.path, "
+        "so import them through the target package."
+    ),
+)
+@click.option(
+    "-S",
+    "--streaming",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    envvar="AVRO_NEOGEN_COMPILE_STREAMING",
+    help="Compile, link and write one namespace at a time to bound memory use.",
+)
+@click.option(
+    "-i",
+    "--incremental",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    envvar="AVRO_NEOGEN_COMPILE_INCREMENTAL",
+    help="Update an existing target directory in place, rewriting only changed files.",
+)
 @click.option(
     "-d",
     "--dry-run",
@@ -115,26 +236,62 @@ def compile(  # noqa: A001
     avro_source_directory: Path,
     python_target_directory: Path,
     avro_driver: str,
+    slots: bool,
+    jobs: int,
+    cache_directory: Path,
+    cache_max_size: int,
+    use_cache: bool,
+    shared_runtime: bool,
+    streaming: bool,
+    incremental: bool,
     dry_run: bool,
     force: bool,
 ) -> None:
     """Compile Avro schema files into a typed Python module."""
+    if shared_runtime and __version__ == UNKNOWN_VERSION:
+        logger.error(
+            "Avro NeoGen version is unknown, bailing out as shared_runtime = True needs an installed avro-neo-gen."
+        )
+        sys.exit(1)
+
     logger.debug("Lexing Avro schema files")
-    schemas = read_path(path=avro_source_directory)
+    schemas = read_path(path=avro_source_directory, jobs=jobs)
 
     logger.debug("Parsing Avro schemas")
     parser_namespace_map = parse_schema(schemas)
 
-    logger.debug("Compiling Avro namespace tree")
-    compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map)
+    cache = CompileCache(cache_directory, max_size=cache_max_size) if use_cache and not dry_run else None
+    module: Union[LinkerFileMap, LinkerFileMapItems]
+    if streaming:
+        logger.debug("Compiling and linking Avro namespaces as they are written")
+        module = _stream_module(
+            parser_namespace_map, slots=slots, cache=cache, jobs=jobs, shared_runtime=shared_runtime
+        )
+    else:
+        logger.debug("Compiling Avro namespace tree")
+        compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map, slots=slots, cache=cache, jobs=jobs)
+        _evict_compile_cache(cache)
 
-    logger.debug("Linking generated Python module")
-    module = link_module(namespace_map=compiler_namespace_map)
+        logger.debug("Linking generated Python module")
+        module = link_module(namespace_map=compiler_namespace_map, slots=slots, shared_runtime=shared_runtime)
 
     if dry_run:
+        if streaming:
+            deque(module, maxlen=0)
         logger.info("dry_run = True ... exiting.")
         return
 
+    if incremental:
+        logger.info("Incrementally writing compiled Python module.")
+        report = emit_linker_file_map_incremental(linker_file_map=module, base_path=python_target_directory)
+        logger.info(
+            "Incremental build complete",
+            written=len(report.written),
+            unchanged=len(report.unchanged),
+            deleted=len(report.deleted),
+        )
+        return
+
     warning_message = f"Target build directory '{python_target_directory}' exists"
     if python_target_directory.exists():
         if force:
@@ -74,6 +74,22 @@ def avro_record_schema(avro_record_schema_json: str) -> Generator[RecordSchema,
     yield avro_schema_parse(avro_record_schema_json)
 
 
+@fixture
+def avro_record_writer_schema_json() -> Generator[str, None, None]:
+    yield json_encode(
+        {
+            "type": "record",
+            "name": "User",
+            "fields": [
+                {"name": "favorite_number", "type": "int"},
+                {"name": "age", "type": "long"},
+                {"name": "name", "type": "string"},
+                {"name": "favorite_color", "type": ["null", "string"]},
+            ],
+        }
+    )
+
+
 @fixture
 def avro_enum_schema_json() -> Generator[str, None, None]:
     yield json_encode({"type": "enum", "name": "Suit", "symbols": ["SPADES", "HEARTS", "DIAMONDS", "CLUBS"]})
@@ -114,7 +130,7 @@ def avro_fixed_decimal_schema(
     yield avro_schema_parse(avro_fixed_decimal_schema_json)
 
 
-def _compile_schema(fake_filesystem: FakeFilesystem, schema: NamedSchema) -> ModuleType:
+def _compile_schema(fake_filesystem: FakeFilesystem, schema: NamedSchema, slots: bool = False) -> ModuleType:
     from avro_neo_gen.avro_schema import AvroSchema
     from avro_neo_gen.compiler.compile_parser_namespace_map import (
         compile_parser_namespace_map,
@@ -129,8 +145,8 @@ def _compile_schema(fake_filesystem: FakeFilesystem, schema: NamedSchema) -> Mod
         avro_schema_parse(json_encode(json_decode(schema) | {"namespace": ""}))
     )
     parser_namespace_map = parse_schema([avro_schema])
-    compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map)
-    linker_file_map = link_compiler_namespace_map(compiler_namespace_map)
+    compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map, slots=slots)
+    linker_file_map = link_compiler_namespace_map(compiler_namespace_map, slots=slots)
     fake_filesystem.patch_open_code = PatchMode.AUTO
     fake_filesystem.create_file("/generated/__init__.py", create_missing_dirs=True, encoding="utf-8")
     emit_linker_file_map(linker_file_map, "/generated")
@@ -148,6 +164,34 @@ def neo_gen_record_module(
     yield _compile_schema(fake_filesystem, avro_record_schema_json)
 
 
+@fixture
+def neo_gen_record_default_module(
+    fake_filesystem: FakeFilesystem, avro_record_schema_json: str
+) -> Generator[ModuleType, None, None]:
+    schema = json_decode(avro_record_schema_json)
+    schema["fields"].append({"name": "age", "type": "long", "default": 42})
+    yield _compile_schema(fake_filesystem, json_encode(schema))
+
+
+@fixture
+def neo_gen_slots_record_module(
+    fake_filesystem: FakeFilesystem, avro_record_schema_json: str
+) -> Generator[ModuleType, None, None]:
+    yield _compile_schema(fake_filesystem, avro_record_schema_json, slots=True)
+
+
+@fixture
+def neo_gen_card_module(
+    fake_filesystem: FakeFilesystem, avro_enum_schema_json: str
+) -> Generator[ModuleType, None, None]:
+    card = {
+        "type": "record",
+        "name": "Card",
+        "fields": [{"name": "rank", "type": "int"}, {"name": "suit", "type": json_decode(avro_enum_schema_json)}],
+    }
+    yield _compile_schema(fake_filesystem, json_encode(card))
+
+
 @fixture
 def neo_gen_enum_module(
     fake_filesystem: FakeFilesystem, avro_enum_schema_json: str
@@ -189,3 +233,24 @@ def apache_avro_binary_core_driver_proxy(
     stateless_driver_proxy_factory: Callable[[str], DriverProxy]
 ) -> Generator["DriverProxy", None, None]:
     yield stateless_driver_proxy_factory("avro_neo_gen.core.driver.apache_avro_binary_driver")
+
+
+@fixture
+def compiled_binary_core_driver_proxy(
+    stateless_driver_proxy_factory: Callable[[str], DriverProxy]
+) -> Generator["DriverProxy", None, None]:
+    yield stateless_driver_proxy_factory("avro_neo_gen.core.driver.compiled_binary_driver")
+
+
+@fixture
+def single_object_core_driver_proxy(
+    stateless_driver_proxy_factory: Callable[[str], DriverProxy]
+) -> Generator["DriverProxy", None, None]:
+    yield stateless_driver_proxy_factory("avro_neo_gen.core.driver.single_object_driver")
+
+
+@fixture
+def schema_registry_core_driver_proxy(
+    stateless_driver_proxy_factory: Callable[[str], DriverProxy]
+) -> Generator["DriverProxy", None, None]:
+    yield stateless_driver_proxy_factory("avro_neo_gen.core.driver.schema_registry_driver")
@@ -1,4 +1,7 @@
+import copy
+import hashlib
 import json
+import pickle
 from typing import Callable, Optional
 
 import avro.schema
@@ -16,15 +19,53 @@ from avro_neo_gen.avro_schema import AvroSchema
 
 
 class TestAvroSchema:
-    def test___init__(self, avro_record_schema: RecordSchema) -> None:
+    def test___new__(self, avro_record_schema: RecordSchema) -> None:
         avro_schema: AvroSchema[RecordSchema] = AvroSchema(schema=avro_record_schema)
 
-        assert avro_schema is not AvroSchema(schema=avro_schema)
+        assert avro_schema is AvroSchema(schema=avro_schema)
+        assert avro_schema is AvroSchema(schema=avro_record_schema)
+        assert avro_schema is AvroSchema[RecordSchema](avro_record_schema)
         assert avro_schema.schema is AvroSchema(schema=avro_schema).schema
+        assert AvroSchema.__dictoffset__ == 0
 
         with pytest.raises(TypeError):
             AvroSchema(["weird-type"])
 
+    def test___new___repointed(self, avro_primitive_schema_factory: Callable[[str], PrimitiveSchema]) -> None:
+        schema = avro_primitive_schema_factory("string")
+        repointed: AvroSchema[PrimitiveSchema] = AvroSchema(schema)
+        repointed._schema = avro_primitive_schema_factory("long")
+
+        avro_schema = AvroSchema(schema)
+        assert avro_schema is not repointed
+        assert avro_schema.schema is schema
+        assert AvroSchema(schema) is avro_schema
+
+    def test___reduce__(self, avro_record_schema: RecordSchema) -> None:
+        avro_schema: AvroSchema[RecordSchema] = AvroSchema(schema=avro_record_schema)
+
+        assert pickle.loads(pickle.dumps(avro_schema)) == avro_schema
+        assert copy.copy(avro_schema) is avro_schema
+
+    def test_fingerprint(self, avro_primitive_schema_factory: Callable[[str], PrimitiveSchema]) -> None:
+        avro_schema: AvroSchema[PrimitiveSchema] = AvroSchema(avro_primitive_schema_factory("null"))
+
+        assert int.from_bytes(avro_schema.fingerprint64, "little", signed=True) == 7195948357588979594
+        assert avro_schema.fingerprint64 is avro_schema.fingerprint("CRC-64-AVRO")
+        assert avro_schema.fingerprint_md5 == hashlib.md5(b'"null"').digest()
+        assert avro_schema.fingerprint_sha256 == hashlib.sha256(b'"null"').digest()
+
+    def test_cached_properties(self, avro_record_schema: RecordSchema) -> None:
+        avro_schema: AvroSchema[RecordSchema] = AvroSchema(schema=avro_record_schema)
+
+        assert avro_schema.fields is not avro_schema.fields
+        assert all(a is b for a, b in zip(avro_schema.fields, avro_schema.fields))
+        assert all(a is b for a, b in zip(avro_schema.contained_schemas(), avro_schema.contained_schemas()))
+        assert avro_schema.fullname is avro_schema.fullname
+
+        avro_schema.namespace_components.append("mutated")
+        assert avro_schema.namespace_components == ["com", "acme"]
+
     def test___getattr__(self, avro_record_schema: RecordSchema) -> None:
         avro_schema: AvroSchema[RecordSchema] = AvroSchema(schema=avro_record_schema)
 
@@ -23,6 +23,9 @@ class TestCompilerCompilePyast:
             class Suit(NeoGenEnum):
                 __canonical_schema__ = OrderedDict(name='Suit', type='enum', symbols=['SPADES', 'HEARTS', 'DIAMONDS', 'CLUBS'])
                 __schema__ = dict(type='enum', name='Suit', symbols=['SPADES', 'HEARTS', 'DIAMONDS', 'CLUBS'])
+                __fingerprint64__ = bytes.fromhex('9618473a5e2bd886')
+                __fingerprint_md5__ = bytes.fromhex('c83f54689fad9a91d6bbd4cf312297a1')
+                __fingerprint_sha256__ = bytes.fromhex('54c1f47cf1e5da6e47ba28d4eb8ebf9009e74163209c34cbde6eb7ba6790d5e9')
         """
         )
 
@@ -36,6 +39,9 @@ class TestCompilerCompilePyast:
             class MD5(NeoGenFixed):
                 __canonical_schema__ = OrderedDict(name='MD5', type='fixed', size=16)
                 __schema__ = dict(type='fixed', name='MD5', size=16)
+                __fingerprint64__ = bytes.fromhex('d5cc851917fb7095')
+                __fingerprint_md5__ = bytes.fromhex('dc9ee0a1b10d3d570ff949f40ed34a6f')
+                __fingerprint_sha256__ = bytes.fromhex('8c8f76c9575122a57a4b7ddf8582c9cc4eeb8cfce571e559c4e5c54e18a9588b')
         """
         )
 
@@ -49,6 +55,9 @@ class TestCompilerCompilePyast:
             class FixNum(NeoGenFixedDecimal):
                 __canonical_schema__ = OrderedDict(name='FixNum', type='fixed', size=16)
                 __schema__ = dict(type='fixed', logicalType='decimal', precision=4, scale=2, name='FixNum', size=16)
+                __fingerprint64__ = bytes.fromhex('2e2bf93c1604c7b4')
+                __fingerprint_md5__ = bytes.fromhex('99f9a5e1906824cd331e83ef049ec245')
+                __fingerprint_sha256__ = bytes.fromhex('43869991f5c622406eeb0ee71c13e5607dbd6ecf7c606a354414889bd7d43133')
         """
         )
 
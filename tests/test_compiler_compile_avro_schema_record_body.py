@@ -1,6 +1,8 @@
 import ast
+import json
 from inspect import cleandoc
 
+import avro.schema
 from avro.schema import RecordSchema
 
 from avro_neo_gen.avro_schema import AvroSchema
@@ -16,7 +18,7 @@ class TestCompilerCompileAvroSchemaRecord:
         expected_python = cleandoc(
             """
             def __init__(self, name: str, favorite_number: Optional[int], favorite_color: Optional[str]) -> None:
-                self._datum = record_builder_internal(self_name='self')
+                self._datum = {'name': name, 'favorite_number': favorite_number, 'favorite_color': favorite_color}
         """
         )
 
@@ -46,7 +48,7 @@ class TestCompilerCompileAvroSchemaRecord:
         expected_python = cleandoc(
             """
             def __init__(self, name: str, favorite_number: Optional[int], favorite_color: Optional[str]) -> None:
-                self._datum = record_builder_internal(self_name='self')
+                self._datum = {'name': name, 'favorite_number': favorite_number, 'favorite_color': favorite_color}
 
             @property
             def name(self) -> str:
@@ -79,3 +81,44 @@ class TestCompilerCompileAvroSchemaRecord:
             ast.unparse(ast.Module(type_ignores=[], body=compile_avro_schema_record_body(avro_schema)))
             == expected_python
         )
+
+    def test_compile_avro_schema_record_body_slots(self, avro_record_schema: RecordSchema) -> None:
+        expected_python = cleandoc(
+            """
+            __slots__ = ('name', 'favorite_number', 'favorite_color')
+            __fields__ = ('name', 'favorite_number', 'favorite_color')
+            name: str
+            favorite_number: Optional[int]
+            favorite_color: Optional[str]
+
+            def __init__(self, name: str, favorite_number: Optional[int], favorite_color: Optional[str]) -> None:
+                self.name = name
+                self.favorite_number = favorite_number
+                self.favorite_color = favorite_color
+        """
+        )
+
+        avro_schema: AvroSchema[RecordSchema] = AvroSchema(avro_record_schema)
+        assert (
+            ast.unparse(ast.Module(type_ignores=[], body=compile_avro_schema_record_body(avro_schema, slots=True)))
+            == expected_python
+        )
+
+    def test_compile_avro_schema_record_body_slots_empty(self) -> None:
+        expected_python = cleandoc(
+            """
+            __slots__ = ()
+            __fields__ = ()
+
+            def __init__(self) -> None:
+                pass
+        """
+        )
+
+        avro_schema: AvroSchema[RecordSchema] = AvroSchema(
+            avro.schema.parse(json.dumps({"type": "record", "name": "Empty", "fields": []}))
+        )
+        assert (
+            ast.unparse(ast.Module(type_ignores=[], body=compile_avro_schema_record_body(avro_schema, slots=True)))
+            == expected_python
+        )
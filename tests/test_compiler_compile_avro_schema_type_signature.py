@@ -1,4 +1,5 @@
 import ast
+import gc
 import json
 from typing import Callable, Optional
 
@@ -18,6 +19,7 @@ from avro.schema import (
 
 from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.compiler.compile_avro_schema_type_signature import (
+    _type_signatures,
     compile_avro_schema_type_signature,
 )
 
@@ -60,6 +62,9 @@ class TestCompilerCompileAvroSchemaTypeSignature:
         fake_avro_schema: AvroSchema[LogicalSchema] = AvroSchema(fake_avro_primitive)
         assert ast.unparse(compile_avro_schema_type_signature(fake_avro_schema)) == "int"
 
+        # Type signatures are memoized per schema object, so mutate a fresh one.
+        fake_avro_primitive = avro_primitive_schema_factory("int", "date")
+        fake_avro_primitive.logical_type = "foo"
         fake_avro_primitive.type = "bang"
         avro_schema_logical: AvroSchema[LogicalSchema] = AvroSchema(fake_avro_primitive)
         with pytest.raises(NotImplementedError):
@@ -109,3 +114,31 @@ class TestCompilerCompileAvroSchemaTypeSignature:
 
         expected_python = "'Suit'"
         assert ast.unparse(compile_avro_schema_type_signature(AvroSchema(avro_enum_schema))) == expected_python
+
+    def test_compile_avro_schema_type_signature_memoized(self) -> None:
+        record = avro.schema.parse(
+            json.dumps(
+                {
+                    "type": "record",
+                    "name": "Test",
+                    "fields": [{"name": "test", "type": {"type": "map", "values": ["null", "string", "long"]}}],
+                }
+            )
+        )
+        field = AvroSchema(record.fields[0])
+        type_signature = compile_avro_schema_type_signature(field)
+
+        assert ast.unparse(type_signature) == "dict[str, Union[int, str, None]]"
+        assert compile_avro_schema_type_signature(field) is type_signature
+        assert compile_avro_schema_type_signature(field.type) is type_signature
+        assert compile_avro_schema_type_signature(AvroSchema(record.fields[0].type)) is type_signature
+        assert (
+            compile_avro_schema_type_signature(AvroSchema(avro.schema.parse(json.dumps(record.to_json())).fields[0]))
+            is not type_signature
+        )
+
+        key = id(record.fields[0].type)
+        assert key in _type_signatures
+        del field, record
+        gc.collect()
+        assert key not in _type_signatures
@@ -0,0 +1,119 @@
+import ast
+import json
+import os
+from pathlib import Path
+
+import avro.schema
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from avro_neo_gen.avro_schema import AvroSchema
+from avro_neo_gen.compiler.compile_cache import CompileCache, CompileCacheEntry
+from avro_neo_gen.compiler.compile_parser_namespace_map import (
+    compile_parser_namespace_map,
+)
+from avro_neo_gen.linker.inject_corelib_sys_path_shim import (
+    inject_corelib_sys_path_shim,
+)
+from avro_neo_gen.linker.link_compiler_namespace_map import link_compiler_namespace_map
+from avro_neo_gen.parser.parse_schema import parse_schema
+
+ENTRY = CompileCacheEntry(source="class Foo:\n    pass", required_imports={"typing": {"Optional", "Union"}})
+
+
+class TestCompilerCompileCache:
+    def test_key(self, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        avro_schema = AvroSchema(avro.schema.parse(avro_record_schema_json))
+        cache = CompileCache("cache")
+
+        assert cache.key(avro_schema) == cache.key(AvroSchema(avro.schema.parse(avro_record_schema_json)))
+        assert cache.key(avro_schema) != cache.key(avro_schema, slots=True)
+        assert cache.key(avro_schema) != cache.key(AvroSchema(avro.schema.parse(json.dumps(schema | {"doc": "x"}))))
+
+    def test_get_put(self, fake_filesystem: FakeFilesystem) -> None:
+        cache = CompileCache("cache")
+
+        assert cache.get("abcd") is None
+        cache.put("abcd", ENTRY)
+        assert cache.get("abcd") == ENTRY
+        assert CompileCache("cache").get("abcd") == ENTRY
+
+        Path("cache/ab/abcd.json").write_text("{", encoding="utf-8")
+        assert cache.get("abcd") is None
+
+        assert cache.stats._asdict() == {"hits": 1, "misses": 2, "writes": 1, "evictions": 0}
+
+    def test_evict(self, fake_filesystem: FakeFilesystem) -> None:
+        cache = CompileCache("cache")
+        cache.evict()
+
+        for index, key in enumerate(["aa01", "bb02", "cc03"]):
+            cache.put(key, ENTRY)
+            os.utime(f"cache/{key[:2]}/{key}.json", (index, index))
+
+        cache.get("aa01")
+        cache.max_size = 2 * Path("cache/aa/aa01.json").stat().st_size
+        cache.evict()
+
+        assert not Path("cache/bb/bb02.json").exists()
+        assert Path("cache/aa/aa01.json").exists()
+        assert Path("cache/cc/cc03.json").exists()
+        assert cache.stats.evictions == 1
+
+    def test_evict_staging_files(self, fake_filesystem: FakeFilesystem) -> None:
+        cache = CompileCache("cache")
+        cache.put("aa01", ENTRY)
+        size = Path("cache/aa/aa01.json").stat().st_size
+
+        staging_path = Path("cache/bb/bb02.1234.tmp")
+        staging_path.parent.mkdir()
+        staging_path.write_text("{", encoding="utf-8")
+        os.utime(staging_path, (0, 0))
+
+        cache.max_size = size
+        cache.evict()
+
+        assert not staging_path.exists()
+        assert Path("cache/aa/aa01.json").exists()
+        assert cache.stats.evictions == 1
+
+    def test_compile_parser_namespace_map(self, fake_filesystem: FakeFilesystem, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        root_record = avro.schema.parse(
+            json.dumps(
+                schema
+                | {
+                    "name": "RootTest",
+                    "namespace": None,
+                    "fields": [{"name": "org_test", "type": schema | {"name": "OrgTest", "namespace": "org.acme"}}],
+                }
+            )
+        )
+        parser_namespace_map = parse_schema([root_record])
+
+        expected_file_map = inject_corelib_sys_path_shim(
+            link_compiler_namespace_map(compile_parser_namespace_map(parser_namespace_map))
+        )
+        expected_source_map = {path: ast.unparse(module) for path, module in expected_file_map.items()}
+
+        cache = CompileCache("cache")
+        for expected_stats in [(0, 2, 2), (2, 2, 2)]:
+            compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map, cache=cache)
+            linker_file_map = inject_corelib_sys_path_shim(link_compiler_namespace_map(compiler_namespace_map))
+
+            assert linker_file_map == expected_source_map
+            assert cache.stats[:3] == expected_stats
+
+    def test_compile_parser_namespace_map_jobs(self, tmp_path: Path, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        fields = [{"name": f"field_{index}", "type": schema | {"name": f"Test{index}"}} for index in range(3)]
+        parser_namespace_map = parse_schema([avro.schema.parse(json.dumps(schema | {"fields": fields}))])
+
+        expected_source_map = link_compiler_namespace_map(compile_parser_namespace_map(parser_namespace_map, jobs=2))
+
+        cache = CompileCache(tmp_path)
+        for expected_stats in [(0, 4, 4), (4, 4, 4)]:
+            compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map, cache=cache, jobs=2)
+
+            assert link_compiler_namespace_map(compiler_namespace_map) == expected_source_map
+            assert cache.stats[:3] == expected_stats
@@ -3,11 +3,13 @@ import json
 from inspect import cleandoc
 
 import avro.schema
+import pytest
 
 from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.compiler.compile_parser_namespace_map import (
     compile_parser_namespace_map,
 )
+from avro_neo_gen.linker.link_compiler_namespace_map import link_compiler_namespace_map
 from avro_neo_gen.parser.parse_schema import parse_schema
 from avro_neo_gen.utils import pyast_module
 
@@ -39,12 +41,15 @@ class TestCompilerCompileParserNamespaceMap:
 
         expected_python = cleandoc(
             """
-            class ComTest(NeoGenRecord):
+            class ComTest(NeoGenDictRecord):
                 __canonical_schema__ = OrderedDict(name='com.acme.ComTest', type='record', fields=[OrderedDict([('name', 'org_test'), ('type', OrderedDict([('name', 'org.acme.OrgTest'), ('type', 'record'), ('fields', [OrderedDict([('name', 'name'), ('type', 'string')]), OrderedDict([('name', 'favorite_number'), ('type', ['int', 'null'])]), OrderedDict([('name', 'favorite_color'), ('type', ['string', 'null'])])])]))])])
                 __schema__ = dict(type='record', name='ComTest', namespace='com.acme', fields=[{'type': {'type': 'record', 'name': 'OrgTest', 'namespace': 'org.acme', 'fields': [{'type': 'string', 'name': 'name'}, {'type': ['int', 'null'], 'name': 'favorite_number'}, {'type': ['string', 'null'], 'name': 'favorite_color'}]}, 'name': 'org_test'}])
+                __fingerprint64__ = bytes.fromhex('49768eec46520dc0')
+                __fingerprint_md5__ = bytes.fromhex('f2714ee87293b1a3e9b9244c94a2d313')
+                __fingerprint_sha256__ = bytes.fromhex('187f4063c53684ae7f18645262e6802e8e44ff60ee2760a8c5c193e8c429d790')
 
                 def __init__(self, org_test: 'OrgTest') -> None:
-                    self._datum = record_builder_internal(self_name='self')
+                    self._datum = {'org_test': org_test}
 
                 @property
                 def org_test(self) -> 'OrgTest':
@@ -66,3 +71,28 @@ class TestCompilerCompileParserNamespaceMap:
         )
         assert compiler_namespace_map["com.acme"][-1]["ast"] is not None
         assert ast.unparse(pyast_module(body=compiler_namespace_map["com.acme"][-1]["ast"])) == expected_python
+
+    @pytest.mark.parametrize("jobs", [2, 0])
+    def test_compile_parser_namespace_map_jobs(self, avro_record_schema_json: str, jobs: int) -> None:
+        schema = json.loads(avro_record_schema_json)
+        fields = [
+            {"name": f"field_{index}", "type": schema | {"name": f"Test{index}", "namespace": f"org.acme{index % 3}"}}
+            for index in range(6)
+        ]
+        root_record = avro.schema.parse(json.dumps(schema | {"name": "RootTest", "namespace": None, "fields": fields}))
+        parser_namespace_map = parse_schema([AvroSchema(root_record)])
+
+        expected_source_map = {
+            path: ast.unparse(module)
+            for path, module in link_compiler_namespace_map(compile_parser_namespace_map(parser_namespace_map)).items()
+        }
+        compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map, jobs=jobs)
+
+        assert list(compiler_namespace_map) == list(parser_namespace_map)
+        assert all(
+            cell["ast"] is None and cell["source"]
+            for cells in compiler_namespace_map.values()
+            for cell in cells
+            if cell["schema"].is_named
+        )
+        assert link_compiler_namespace_map(compiler_namespace_map) == expected_source_map
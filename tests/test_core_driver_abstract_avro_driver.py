@@ -1,2 +1,48 @@
+from io import BufferedIOBase, BytesIO
+from typing import Any
+
+import pytest
+
+from avro_neo_gen.core.driver.abstract_avro_driver import AbstractAvroDriver
+
+
+class UnseekableBytesIO(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+class ByteDriver(AbstractAvroDriver):
+    def read(self, schema_type: Any, source: BufferedIOBase) -> Any:
+        return source.read(1)
+
+    def write(self, schema: Any, target: BufferedIOBase) -> None:
+        target.write(schema)
+
+
 class TestCoreDriverAbstractAvroDriver:
-    pass
+    @pytest.mark.parametrize("stream_type", [BytesIO, UnseekableBytesIO])
+    def test_read_many(self, stream_type: type) -> None:
+        driver = ByteDriver()
+
+        source = stream_type(b"abcde")
+        assert driver.read_many(None, source, count=2) == [b"a", b"b"]  # type: ignore
+        assert driver.read_many(None, source) == [b"c", b"d", b"e"]  # type: ignore
+        assert driver.read_many(None, source) == []  # type: ignore
+
+    @pytest.mark.parametrize("stream_type", [BytesIO, UnseekableBytesIO])
+    def test_iter_read(self, stream_type: type) -> None:
+        records = ByteDriver().iter_read(None, stream_type(b"abcde"), buffer_size=2)  # type: ignore
+        assert list(records) == [b"a", b"b", b"c", b"d", b"e"]
+
+    def test_write_many(self) -> None:
+        target = BytesIO()
+        ByteDriver().write_many([b"a", b"b"], target)  # type: ignore
+        assert target.getvalue() == b"ab"
+
+    def test_from_bytes(self) -> None:
+        assert ByteDriver().from_bytes(None, memoryview(b"abc"), 1) == (b"b", 2)  # type: ignore
+
+    def test_write_into(self) -> None:
+        out = bytearray(b"a")
+        ByteDriver().write_into(b"b", out)  # type: ignore
+        assert out == b"ab"
@@ -1,12 +1,16 @@
 import json
 from io import BytesIO
 from types import ModuleType
+from unittest.mock import patch
 
 import avro.io
 import avro.schema
+import pytest
 
 from avro_neo_gen.core.driver.apache_avro_binary_driver import ApacheAvroBinaryDriver
+from avro_neo_gen.core.driver.binary_codec import BinaryCodec
 from avro_neo_gen.core.driver.driver_proxy import DriverProxy
+from avro_neo_gen.core.neo_gen_error import NeoGenCodecUnderflowError
 from avro_neo_gen.core.neo_gen_record import NeoGenRecord
 
 
@@ -43,3 +47,111 @@ class TestCoreDriverApacheAvroBinaryDriver:
         generated_bytes.seek(0)
         generated_user.write(generated_bytes)
         assert expected_bytes.getvalue() == generated_bytes.getvalue()
+
+    def test_apache_avro_binary_driver_many(
+        self,
+        neo_gen_record_module: ModuleType,
+        apache_avro_binary_core_driver_proxy: DriverProxy,
+    ) -> None:
+        User = neo_gen_record_module.User
+        users = [User(name=f"user-{index}", favorite_number=index, favorite_color=None) for index in range(50)]
+
+        expected_bytes = BytesIO()
+        driver = ApacheAvroBinaryDriver()
+        for user in users:
+            driver.write(user, expected_bytes)
+
+        generated_bytes = BytesIO()
+        User.write_many(users, generated_bytes)
+        assert generated_bytes.getvalue() == expected_bytes.getvalue()
+
+        generated_bytes.seek(0)
+        head = User.read_many(generated_bytes, count=10)
+        tail = User.read_many(generated_bytes)
+        assert all(isinstance(user, User) for user in head + tail)
+        assert [user.encode() for user in head + tail] == [user.encode() for user in users]
+        assert User.read_many(generated_bytes) == []
+
+        streamed = User.iter_read(BytesIO(generated_bytes.getvalue()), buffer_size=16)
+        assert [user.encode() for user in streamed] == [user.encode() for user in users]
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            list(User.iter_read(BytesIO(generated_bytes.getvalue()[:-1]), buffer_size=16))
+
+    @pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+    def test_apache_avro_binary_driver_from_bytes(
+        self,
+        neo_gen_record_module: ModuleType,
+        apache_avro_binary_core_driver_proxy: DriverProxy,
+        buffer_type: type,
+    ) -> None:
+        User = neo_gen_record_module.User
+        alice = User(name="alice", favorite_number=10, favorite_color="red")
+        bob = User(name="bob", favorite_number=None, favorite_color=None)
+
+        expected_bytes = BytesIO()
+        ApacheAvroBinaryDriver().write_many([alice, bob], expected_bytes)
+
+        out = bytearray(b"prefix")
+        alice.write_into(out)
+        bob.write_into(out)
+        assert out == b"prefix" + expected_bytes.getvalue()
+        assert alice.to_bytes() + bob.to_bytes() == expected_bytes.getvalue()
+
+        buf = buffer_type(out)
+        generated_alice, offset = User.from_bytes(buf, 6)
+        generated_bob, end = User.from_bytes(buf, offset)
+        assert isinstance(generated_alice, User)
+        assert generated_alice.encode() == alice.encode()
+        assert generated_bob.encode() == bob.encode()
+        assert end == len(out)
+
+    def test_apache_avro_binary_driver_cache(
+        self,
+        neo_gen_record_module: ModuleType,
+        apache_avro_binary_core_driver_proxy: DriverProxy,
+    ) -> None:
+        User = neo_gen_record_module.User
+        alice = User(name="alice", favorite_number=10, favorite_color="red")
+
+        driver = ApacheAvroBinaryDriver()
+        with patch("avro.schema.parse", wraps=avro.schema.parse) as parse_mock:
+            for _ in range(3):
+                target = BytesIO()
+                driver.write(alice, target)
+                target.seek(0)
+                assert driver.read(User, target).encode() == alice.encode()
+
+            assert parse_mock.call_count == 1
+
+            driver.invalidate(User)
+            driver.write(alice, BytesIO())
+            assert parse_mock.call_count == 2
+
+            driver.invalidate()
+            driver.write(alice, BytesIO())
+            assert parse_mock.call_count == 3
+
+    def test_apache_avro_binary_driver_writer_schema(
+        self,
+        neo_gen_record_module: ModuleType,
+        apache_avro_binary_core_driver_proxy: DriverProxy,
+        avro_record_writer_schema_json: str,
+    ) -> None:
+        User = neo_gen_record_module.User
+        writer_codec = BinaryCodec(json.loads(avro_record_writer_schema_json))
+        datums = [
+            {"favorite_number": 10, "age": 30, "name": "alice", "favorite_color": "red"},
+            {"favorite_number": 20, "age": 40, "name": "bob", "favorite_color": None},
+        ]
+        expected = [{key: datum[key] for key in ("name", "favorite_number", "favorite_color")} for datum in datums]
+        encoded = writer_codec.encode(datums[0]) + writer_codec.encode(datums[1])
+
+        alice, offset = User.from_bytes(encoded, writer_schema=avro_record_writer_schema_json)
+        bob, end = User.from_bytes(encoded, offset, json.loads(avro_record_writer_schema_json))
+        assert [alice.encode(), bob.encode()] == expected
+        assert end == len(encoded)
+
+        assert User.read(BytesIO(encoded), writer_schema=avro_record_writer_schema_json).encode() == expected[0]
+        users = User.read_many(BytesIO(encoded), writer_schema=avro_record_writer_schema_json)
+        assert [user.encode() for user in users] == expected
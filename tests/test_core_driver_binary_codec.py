@@ -0,0 +1,556 @@
+import json
+from io import BytesIO
+from typing import Any
+
+import avro.io
+import avro.schema
+import pytest
+
+from avro_neo_gen.core.driver.binary_codec import (
+    BinaryCodec,
+    LazyDatum,
+    clear_binary_codec_cache,
+    get_binary_codec,
+    get_resolving_binary_codec,
+    read_long,
+    write_long,
+)
+from avro_neo_gen.core.neo_gen_error import NeoGenCodecError, NeoGenCodecUnderflowError
+from avro_neo_gen.core.neo_gen_registry import fingerprint64
+
+
+def _avro_encode(schema: Any, datum: Any) -> bytes:
+    buffer = BytesIO()
+    avro.io.DatumWriter(writers_schema=avro.schema.parse(json.dumps(schema))).write(
+        datum=datum, encoder=avro.io.BinaryEncoder(writer=buffer)
+    )
+    return buffer.getvalue()
+
+
+class UnseekableBytesIO(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+RECORD_SCHEMA = {
+    "type": "record",
+    "name": "Everything",
+    "namespace": "com.acme",
+    "fields": [
+        {"name": "null_field", "type": "null"},
+        {"name": "boolean_field", "type": "boolean"},
+        {"name": "int_field", "type": "int"},
+        {"name": "long_field", "type": "long"},
+        {"name": "float_field", "type": "float"},
+        {"name": "double_field", "type": "double"},
+        {"name": "bytes_field", "type": "bytes"},
+        {"name": "string_field", "type": "string"},
+        {"name": "enum_field", "type": {"type": "enum", "name": "Suit", "symbols": ["SPADES", "HEARTS"]}},
+        {"name": "fixed_field", "type": {"type": "fixed", "name": "Two", "size": 2}},
+        {"name": "array_field", "type": {"type": "array", "items": "Suit"}},
+        {"name": "map_field", "type": {"type": "map", "values": ["null", "long"]}},
+        {"name": "union_field", "type": ["null", "string", "Two"]},
+        {"name": "next", "type": ["null", "Everything"]},
+    ],
+}
+
+RECORD_DATUM = {
+    "null_field": None,
+    "boolean_field": True,
+    "int_field": -(1 << 31),
+    "long_field": (1 << 63) - 1,
+    "float_field": 1.5,
+    "double_field": -2.25,
+    "bytes_field": b"\x00\xff",
+    "string_field": "héllo",
+    "enum_field": "HEARTS",
+    "fixed_field": b"ab",
+    "array_field": ["SPADES", "HEARTS", "SPADES"],
+    "map_field": {"a": None, "b": -64},
+    "union_field": "text",
+    "next": None,
+}
+
+
+WRITER_SCHEMA = {
+    "type": "record",
+    "name": "Event",
+    "namespace": "com.acme",
+    "fields": [
+        {"name": "count", "type": "int"},
+        {"name": "dropped", "type": {"type": "array", "items": {"type": "record", "name": "Tag", "fields": []}}},
+        {"name": "label", "type": "string"},
+        {"name": "suit", "type": {"type": "enum", "name": "Suit", "symbols": ["SPADES", "HEARTS", "CLUBS"]}},
+        {"name": "value", "type": ["null", "int", "string"]},
+        {"name": "ratio", "type": "float"},
+        {"name": "next", "type": ["null", "Event"]},
+    ],
+}
+
+READER_SCHEMA = {
+    "type": "record",
+    "name": "Event",
+    "namespace": "com.acme",
+    "fields": [
+        {"name": "label", "type": "string"},
+        {"name": "count", "type": "long"},
+        {"name": "extra", "type": {"type": "map", "values": "bytes"}, "default": {"key": "\u00ff"}},
+        {"name": "suit", "type": {"type": "enum", "name": "Suit", "symbols": ["SPADES", "CLUBS"]}},
+        {"name": "value", "type": ["null", "double", "string"]},
+        {"name": "ratio", "type": "double"},
+        {"name": "next", "type": ["null", "Event"], "default": None},
+    ],
+}
+
+WRITER_DATUM = {
+    "count": 5,
+    "dropped": [{}, {}],
+    "label": "outer",
+    "suit": "SPADES",
+    "value": 7,
+    "ratio": 1.5,
+    "next": {"count": 1, "dropped": [], "label": "inner", "suit": "CLUBS", "value": "text", "ratio": 2.0, "next": None},
+}
+
+
+class TestCoreDriverBinaryCodec:
+    @pytest.mark.parametrize("value", [0, -1, 1, 63, -64, 64, 8191, -8192, (1 << 63) - 1, -(1 << 63)])
+    def test_long_round_trip(self, value: int) -> None:
+        out = bytearray()
+        write_long(value, out)
+
+        assert bytes(out) == _avro_encode("long", value)
+        assert read_long(out, 0) == (value, len(out))
+
+    def test_write_long_out_of_range(self) -> None:
+        with pytest.raises(NeoGenCodecError):
+            write_long(-(1 << 64), bytearray())
+
+        with pytest.raises(NeoGenCodecError):
+            write_long(1 << 63, bytearray())
+
+    def test_record_matches_reference(self) -> None:
+        nested = RECORD_DATUM | {"next": RECORD_DATUM | {"union_field": b"xy"}}
+        codec = BinaryCodec(RECORD_SCHEMA)
+
+        encoded = codec.encode(nested)
+
+        assert encoded == _avro_encode(RECORD_SCHEMA, nested)
+        assert codec.decode(encoded) == (nested, len(encoded))
+        assert codec.decode(memoryview(encoded)) == (nested, len(encoded))
+
+    def test_canonical_schema(self, avro_record_schema: avro.schema.RecordSchema) -> None:
+        datum = {"name": "alice", "favorite_number": None, "favorite_color": "red"}
+        codec = BinaryCodec(avro_record_schema.to_canonical_json())
+
+        assert codec.encode(datum) == _avro_encode(avro_record_schema.to_json(), datum)
+
+    def test_logical_type(self) -> None:
+        codec = BinaryCodec({"type": "long", "logicalType": "timestamp-millis"})
+
+        assert codec.encode(1_000) == BinaryCodec("long").encode(1_000)
+        assert codec.decode(codec.encode(1_000)) == (1_000, 2)
+
+    def test_decode_offset(self) -> None:
+        codec = BinaryCodec("string")
+        buffer = b"\xff" + codec.encode("one") + codec.encode("two")
+
+        value, offset = codec.decode(buffer, 1)
+        assert value == "one"
+        assert codec.decode(buffer, offset) == ("two", len(buffer))
+
+    def test_decode_block_encoded_array(self) -> None:
+        codec = BinaryCodec({"type": "array", "items": "int"})
+        # Two blocks: a negative count with a byte size, then a plain count.
+        buffer = bytes([0x03, 0x04, 0x02, 0x04, 0x02, 0x06, 0x00])
+
+        assert codec.decode(buffer) == ([1, 2, 3], len(buffer))
+
+    def test_decode_underflow(self) -> None:
+        codec = BinaryCodec(RECORD_SCHEMA)
+        encoded = codec.encode(RECORD_DATUM)
+
+        for size in (0, 3, len(encoded) - 1):
+            with pytest.raises(NeoGenCodecUnderflowError):
+                codec.decode(encoded[:size])
+
+    def test_decode_invalid(self) -> None:
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec(["null", "int"]).decode(b"\x04")
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": "enum", "name": "E", "symbols": ["A"]}).decode(b"\x02")
+
+    def test_encode_invalid(self) -> None:
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec(["null", "int"]).encode("not an int")
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": "enum", "name": "E", "symbols": ["A"]}).encode("B")
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": "fixed", "name": "F", "size": 2}).encode(b"abc")
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec("int").encode("not an int")
+
+    @pytest.mark.parametrize(
+        "schema, datum",
+        [("int", 2**31), ("int", -(2**31) - 1), ("int", 2**40), ("float", 1e300), ("double", 2**1100)],
+    )
+    def test_encode_out_of_range(self, schema: str, datum: Any) -> None:
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec(schema).encode(datum)
+
+    def test_union_branch_range(self) -> None:
+        codec = BinaryCodec(["int", "long", "float", "double"])
+
+        assert codec.decode(codec.encode(2**40)) == (2**40, 7)
+        assert codec.decode(codec.encode(1e300))[0] == 1e300
+
+    def test_union_enum_unhashable(self) -> None:
+        codec = BinaryCodec([{"type": "enum", "name": "E", "symbols": ["A"]}, {"type": "array", "items": "int"}])
+
+        assert codec.decode(codec.encode([1, 2]))[0] == [1, 2]
+        assert codec.decode(codec.encode("A"))[0] == "A"
+
+    def test_unknown_schema(self) -> None:
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec("com.acme.Missing")
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": {"type": "int"}})
+
+    @pytest.mark.parametrize("stream_type", [BytesIO, UnseekableBytesIO])
+    def test_read_write_stream(self, stream_type: type) -> None:
+        codec = BinaryCodec(RECORD_SCHEMA)
+        data = BytesIO()
+        codec.write(RECORD_DATUM, data)
+        codec.write(RECORD_DATUM | {"int_field": 7}, data)
+        data.write(b"trailing")
+
+        source = stream_type(data.getvalue())
+        assert codec.read(source) == RECORD_DATUM
+        assert codec.read(source) == RECORD_DATUM | {"int_field": 7}
+        assert source.read() == b"trailing"
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            codec.read(stream_type(b""))
+
+    @pytest.mark.parametrize("stream_type", [BytesIO, UnseekableBytesIO])
+    def test_read_write_many(self, stream_type: type) -> None:
+        codec = BinaryCodec(RECORD_SCHEMA)
+        datums = [RECORD_DATUM | {"int_field": index, "string_field": "x" * index} for index in range(200)]
+        data = BytesIO()
+        codec.write_many(datums, data)
+
+        source = stream_type(data.getvalue() + b"trailing")
+        assert codec.read_many(source, count=150) == datums[:150]
+        assert codec.read_many(source, count=50) == datums[150:]
+        assert source.read() == b"trailing"
+
+        assert codec.read_many(stream_type(data.getvalue())) == datums
+        assert codec.read_many(stream_type(b"")) == []
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            codec.read_many(stream_type(data.getvalue()[:-1]))
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            codec.read_many(stream_type(data.getvalue()), count=201)
+
+    @pytest.mark.parametrize("stream_type", [BytesIO, UnseekableBytesIO])
+    def test_iter_read(self, stream_type: type) -> None:
+        codec = BinaryCodec(RECORD_SCHEMA)
+        datums = [RECORD_DATUM | {"int_field": index, "string_field": "x" * index} for index in range(200)]
+        data = BytesIO()
+        codec.write_many(datums, data)
+
+        assert list(codec.iter_read(stream_type(data.getvalue()), buffer_size=64)) == datums
+        assert list(codec.iter_read(stream_type(data.getvalue()))) == datums
+        assert list(codec.iter_read(stream_type(b""))) == []
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            list(codec.iter_read(stream_type(data.getvalue()[:-1]), buffer_size=64))
+
+    def test_iter_read_position(self) -> None:
+        codec = BinaryCodec("long")
+        source = BytesIO(b"!" + codec.encode(1) + codec.encode(1000) + codec.encode(-1))
+        source.seek(1)
+
+        datums = codec.iter_read(source, buffer_size=2)
+        assert next(datums) == 1
+        assert next(datums) == 1000
+        datums.close()
+        assert source.tell() == 4
+        assert list(codec.iter_read(source)) == [-1]
+        assert source.tell() == 5
+
+    def test_read_large_datum(self) -> None:
+        codec = BinaryCodec("string")
+        value = "x" * 20_000
+        source = BytesIO(codec.encode(value) + b"!")
+
+        assert codec.read(source) == value
+        assert source.read() == b"!"
+
+    def test_get_binary_codec(self, neo_gen_record_module: Any) -> None:
+        User = neo_gen_record_module.User
+        codec = get_binary_codec(User)
+
+        assert codec is get_binary_codec(User)
+        assert codec.schema == User.__canonical_schema__
+
+        clear_binary_codec_cache(User)
+        assert codec is not get_binary_codec(User)
+
+        codec = get_binary_codec(User)
+        clear_binary_codec_cache()
+        assert codec is not get_binary_codec(User)
+
+    def test_resolve_writer_schema(self) -> None:
+        encoded = BinaryCodec(WRITER_SCHEMA).encode(WRITER_DATUM)
+        datum, end = BinaryCodec(READER_SCHEMA, writer_schema=WRITER_SCHEMA).decode(encoded)
+
+        reference = avro.io.DatumReader(
+            writers_schema=avro.schema.parse(json.dumps(WRITER_SCHEMA)),
+            readers_schema=avro.schema.parse(json.dumps(READER_SCHEMA)),
+        ).read(avro.io.BinaryDecoder(BytesIO(encoded)))
+
+        assert end == len(encoded)
+        # Apache Avro leaves promoted union branches unconverted, and encodes
+        # bytes defaults as UTF-8 rather than ISO-8859-1.
+        assert datum["value"] == 7.0 and isinstance(datum["value"], float)
+        assert datum["extra"] == datum["next"]["extra"] == {"key": b"\xff"}
+        for resolved in (datum, reference):
+            resolved["value"] = float(resolved["value"])
+            resolved["extra"] = resolved["next"]["extra"] = None
+        assert datum == reference
+
+    def test_resolve_aliases_and_enum_default(self) -> None:
+        writer = {
+            "type": "record",
+            "name": "Old",
+            "fields": [{"name": "suit", "type": WRITER_SCHEMA["fields"][3]["type"]}],
+        }
+        reader = {
+            "type": "record",
+            "name": "New",
+            "aliases": ["Old"],
+            "fields": [
+                {
+                    "name": "card_suit",
+                    "aliases": ["suit"],
+                    "type": {"type": "enum", "name": "Suit", "symbols": ["SPADES", "OTHER"], "default": "OTHER"},
+                },
+                {"name": "tags", "type": {"type": "array", "items": "string"}, "default": ["a"]},
+            ],
+        }
+        codec = BinaryCodec(reader, writer_schema=writer)
+        encode = BinaryCodec(writer).encode
+
+        first, _ = codec.decode(encode({"suit": "HEARTS"}))
+        second, _ = codec.decode(encode({"suit": "SPADES"}))
+        assert first == {"card_suit": "OTHER", "tags": ["a"]}
+        assert second == {"card_suit": "SPADES", "tags": ["a"]}
+
+        first["tags"].append("b")
+        assert codec.decode(encode({"suit": "SPADES"}))[0]["tags"] == ["a"]
+
+    def test_resolve_errors(self) -> None:
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": "record", "name": "R", "fields": [{"name": "a", "type": "int"}]}, writer_schema="int")
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec(
+                {"type": "record", "name": "R", "fields": [{"name": "a", "type": "int"}]},
+                writer_schema={"type": "record", "name": "R", "fields": []},
+            )
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec("int", writer_schema="long")
+
+        codec = BinaryCodec(READER_SCHEMA["fields"][3]["type"], writer_schema=WRITER_SCHEMA["fields"][3]["type"])
+        with pytest.raises(NeoGenCodecError):
+            codec.decode(b"\x02")
+
+        codec = BinaryCodec("string", writer_schema=["string", "int"])
+        assert codec.decode(b"\x00\x02a") == ("a", 3)
+        with pytest.raises(NeoGenCodecError):
+            codec.decode(b"\x02\x02")
+
+    def test_get_resolving_binary_codec(self, neo_gen_record_module: Any) -> None:
+        User = neo_gen_record_module.User
+        writer_schema = {
+            "type": "record",
+            "name": "User",
+            "namespace": "com.acme",
+            "fields": [
+                {"name": "age", "type": "int"},
+                {"name": "favorite_color", "type": "string"},
+                {"name": "favorite_number", "type": "int"},
+                {"name": "name", "type": "string"},
+            ],
+        }
+        fingerprint = fingerprint64(avro.schema.parse(json.dumps(writer_schema)).canonical_form)
+
+        codec = get_binary_codec(User, writer_schema)
+        assert codec is get_binary_codec(User, json.dumps(writer_schema))
+        assert codec is get_resolving_binary_codec(User, fingerprint, writer_schema)
+        assert get_binary_codec(User, User.__canonical_schema__) is get_binary_codec(User)
+
+        encoded = BinaryCodec(writer_schema).encode(
+            {"age": 3, "favorite_color": "red", "favorite_number": 7, "name": "a"}
+        )
+        assert codec.decode(encoded) == ({"favorite_color": "red", "favorite_number": 7, "name": "a"}, len(encoded))
+
+        clear_binary_codec_cache(User)
+        assert codec is not get_binary_codec(User, writer_schema)
+
+    @pytest.mark.parametrize(
+        "fields",
+        [(), ("int_field",), ("string_field", "next"), ("map_field", "null_field"), tuple(RECORD_DATUM)],
+    )
+    def test_projection(self, fields: tuple[str, ...]) -> None:
+        nested = RECORD_DATUM | {"next": RECORD_DATUM | {"union_field": b"xy"}}
+        encoded = BinaryCodec(RECORD_SCHEMA).encode(nested) + b"!"
+        codec = BinaryCodec(RECORD_SCHEMA, fields=fields)
+
+        assert codec.fields == fields
+        assert codec.decode(encoded) == ({name: nested[name] for name in fields}, len(encoded) - 1)
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            codec.decode(encoded[:-2])
+
+    def test_projection_skips_blocks(self) -> None:
+        schema = {
+            "type": "record",
+            "name": "Blocks",
+            "fields": [
+                {"name": "items", "type": {"type": "array", "items": "int"}},
+                {"name": "values", "type": {"type": "map", "values": "string"}},
+                {"name": "last", "type": "int"},
+            ],
+        }
+        # A sized block and a plain block of items, then a single map entry.
+        buffer = bytes([0x03, 0x04, 0x02, 0x04, 0x02, 0x06, 0x00, 0x02, 0x02, 0x6B, 0x02, 0x76, 0x00, 0x54])
+
+        assert BinaryCodec(schema).decode(buffer) == ({"items": [1, 2, 3], "values": {"k": "v"}, "last": 42}, 14)
+        assert BinaryCodec(schema, fields=["last"]).decode(buffer) == ({"last": 42}, 14)
+
+        schema["fields"][0]["type"]["items"] = "double"
+        encoded = BinaryCodec(schema).encode({"items": [1.0, 2.0], "values": {}, "last": 3})
+        codec = BinaryCodec(schema, fields=["last"])
+        assert codec.decode(encoded) == ({"last": 3}, len(encoded))
+        with pytest.raises(NeoGenCodecUnderflowError):
+            codec.decode(encoded[:9])
+
+    def test_projection_negative_length(self) -> None:
+        schema = {
+            "type": "record",
+            "name": "Sized",
+            "fields": [{"name": "s", "type": "string"}, {"name": "i", "type": "int"}],
+        }
+        with pytest.raises(NeoGenCodecError, match="Negative length prefix"):
+            BinaryCodec(schema, fields=["i"]).decode(b"\x03\x02")
+
+        schema["fields"][0]["type"] = {"type": "array", "items": "int"}
+        with pytest.raises(NeoGenCodecError, match="Negative length prefix"):
+            BinaryCodec(schema, fields=["i"]).decode(b"\x01\x03\x02")
+
+    def test_projection_writer_schema(self) -> None:
+        encoded = BinaryCodec(WRITER_SCHEMA).encode(WRITER_DATUM)
+        codec = BinaryCodec(READER_SCHEMA, writer_schema=WRITER_SCHEMA, fields=["count", "extra"])
+
+        assert codec.decode(encoded) == ({"count": 5, "extra": {"key": b"\xff"}}, len(encoded))
+
+    def test_projection_errors(self) -> None:
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec(RECORD_SCHEMA, fields=["missing"])
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": "array", "items": "int"}, fields=[])
+
+    def test_get_binary_codec_projection(self, neo_gen_record_module: Any) -> None:
+        User = neo_gen_record_module.User
+        UserNames = User.projection("name")
+
+        codec = get_binary_codec(UserNames)
+        assert codec is not get_binary_codec(User)
+        assert codec.fields == ("name",)
+        assert codec.decode(
+            get_binary_codec(User).encode({"name": "a", "favorite_number": 1, "favorite_color": None})
+        ) == (
+            {"name": "a"},
+            5,
+        )
+
+    def test_lazy(self) -> None:
+        encoded = BinaryCodec(RECORD_SCHEMA).encode(RECORD_DATUM)
+        codec = BinaryCodec(RECORD_SCHEMA, lazy=True)
+
+        datum, end = codec.decode(encoded * 2)
+        assert isinstance(datum, LazyDatum)
+        assert end == len(encoded)
+        assert datum.raw == encoded
+        assert datum._values == {}
+
+        assert datum["union_field"] == "text"
+        assert datum._values == {"union_field": "text"}
+        assert datum["int_field"] == -(1 << 31)
+        assert not datum.modified
+        assert len(datum) == len(RECORD_DATUM)
+        assert list(datum) == list(RECORD_DATUM)
+
+        with pytest.raises(KeyError):
+            datum["missing"]
+
+        assert datum == RECORD_DATUM
+        assert datum.modified
+
+    def test_lazy_modified(self) -> None:
+        encoded = BinaryCodec(RECORD_SCHEMA).encode(RECORD_DATUM)
+        datum, _ = BinaryCodec(RECORD_SCHEMA, lazy=True).decode(encoded)
+
+        datum["string_field"] = "changed"
+        assert datum.modified
+        assert datum["string_field"] == "changed"
+        assert BinaryCodec(RECORD_SCHEMA).encode(dict(datum)) == BinaryCodec(RECORD_SCHEMA).encode(
+            RECORD_DATUM | {"string_field": "changed"}
+        )
+
+    def test_lazy_errors(self) -> None:
+        encoded = BinaryCodec(RECORD_SCHEMA).encode(RECORD_DATUM)
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            BinaryCodec(RECORD_SCHEMA, lazy=True).decode(encoded[:-1])
+
+        with pytest.raises(NeoGenCodecError):
+            BinaryCodec({"type": "array", "items": "int"}, lazy=True)
+
+        datum, _ = BinaryCodec(
+            {"type": "record", "name": "R", "fields": [{"name": "s", "type": "string"}]}, lazy=True
+        ).decode(b"\x02\xff")
+        with pytest.raises(NeoGenCodecError):
+            datum["s"]
+
+    def test_encode_object_into(self, neo_gen_record_module: Any) -> None:
+        User = neo_gen_record_module.User
+        UserLazy = User.lazy()
+        codec = get_binary_codec(UserLazy)
+        encoded = get_binary_codec(User).encode({"name": "a", "favorite_number": 1, "favorite_color": None})
+
+        assert codec is not get_binary_codec(User)
+        user = UserLazy.decode(codec.decode(encoded)[0])
+        user._lazy_datum.raw = b"passed through"
+
+        out = bytearray()
+        codec.encode_object_into(user, out)
+        get_binary_codec(User).encode_object_into(user, out)
+        assert out == b"passed through" * 2
+
+        user = UserLazy.decode(codec.decode(encoded)[0])
+        out = bytearray()
+        BinaryCodec(json.loads(json.dumps(User.__canonical_schema__))).encode_object_into(user, out)
+        user.name = "b"
+        codec.encode_object_into(user, out)
+        assert out == encoded + encoded.replace(b"a", b"b")
@@ -0,0 +1,178 @@
+import json
+from io import BytesIO
+from pathlib import Path
+from types import ModuleType
+
+import avro.datafile
+import avro.io
+import avro.schema
+import pytest
+
+from avro_neo_gen.core.driver.binary_codec import BinaryCodec, write_long
+from avro_neo_gen.core.driver.container_file import (
+    ContainerReader,
+    ContainerWriter,
+    iter_records,
+)
+from avro_neo_gen.core.neo_gen_error import NeoGenContainerFileError
+
+USERS = [
+    {"name": f"user-{index}", "favorite_number": index, "favorite_color": None if index % 2 else "red"}
+    for index in range(100)
+]
+
+
+class TestCoreDriverContainerFile:
+    @pytest.mark.parametrize("codec", ["null", "deflate", "bzip2", "xz"])
+    def test_round_trip(self, neo_gen_record_module: ModuleType, codec: str) -> None:
+        User = neo_gen_record_module.User
+        target = BytesIO()
+
+        with ContainerWriter(User, target, codec=codec, block_size=256) as writer:
+            for datum in USERS:
+                writer.write(User(**datum))
+
+        target.seek(0)
+        with ContainerReader(target) as reader:
+            assert reader.codec_name == codec
+            assert sum(1 for _ in reader.iter_blocks()) > 1
+
+        target.seek(0)
+        users = list(iter_records(User, target))
+        assert [user.encode() for user in users] == USERS
+        assert all(isinstance(user, User) for user in users)
+
+    @pytest.mark.parametrize("codec", ["null", "deflate", "bzip2"])
+    def test_apache_avro_reads_written_file(self, neo_gen_record_module: ModuleType, codec: str) -> None:
+        User = neo_gen_record_module.User
+        target = BytesIO()
+
+        writer = ContainerWriter(User, target, codec=codec, block_size=256)
+        for datum in USERS:
+            writer.write(User(**datum))
+        writer.flush()
+
+        target.seek(0)
+        reader = avro.datafile.DataFileReader(target, avro.io.DatumReader())
+        assert list(reader) == USERS
+
+    @pytest.mark.parametrize("codec", ["null", "deflate", "bzip2"])
+    def test_reads_apache_avro_written_file(self, neo_gen_record_module: ModuleType, codec: str) -> None:
+        User = neo_gen_record_module.User
+        target = BytesIO()
+
+        user_schema = avro.schema.parse(json.dumps(User.__canonical_schema__))
+        writer = avro.datafile.DataFileWriter(target, avro.io.DatumWriter(), user_schema, codec=codec)
+        for datum in USERS:
+            writer.append(datum)
+        writer.flush()
+
+        target.seek(0)
+        assert [user.encode() for user in iter_records(User, target)] == USERS
+
+    def test_path(self, neo_gen_record_module: ModuleType) -> None:
+        User = neo_gen_record_module.User
+        path = Path("/data/users.avro")
+        path.parent.mkdir()
+
+        with ContainerWriter(User, path, metadata={"origin": b"test"}) as writer:
+            writer.write(User(**USERS[0]))
+
+        with ContainerReader(path) as reader:
+            assert reader.metadata["origin"] == b"test"
+            assert reader.schema == json.loads(json.dumps(User.__canonical_schema__))
+            assert list(reader) == USERS[:1]
+
+    def test_empty(self, neo_gen_record_module: ModuleType) -> None:
+        User = neo_gen_record_module.User
+        target = BytesIO()
+
+        ContainerWriter(User, target).close()
+        target.seek(0)
+
+        assert list(iter_records(User, target)) == []
+
+    def test_unsupported_codec(self, neo_gen_record_module: ModuleType) -> None:
+        with pytest.raises(NeoGenContainerFileError):
+            ContainerWriter(neo_gen_record_module.User, BytesIO(), codec="snappy")
+
+    def test_malformed(self, neo_gen_record_module: ModuleType) -> None:
+        User = neo_gen_record_module.User
+
+        with pytest.raises(NeoGenContainerFileError):
+            ContainerReader(BytesIO(b"Obj"))
+
+        with pytest.raises(NeoGenContainerFileError):
+            ContainerReader(BytesIO(b"Nope\x00" + bytes(16)))
+
+        target = BytesIO()
+        with ContainerWriter(User, target) as writer:
+            writer.write(User(**USERS[0]))
+
+        with pytest.raises(NeoGenContainerFileError):
+            list(ContainerReader(BytesIO(target.getvalue()[:-1])))
+
+    def test_reads_evolved_writer_schema(self, neo_gen_record_default_module: ModuleType) -> None:
+        User = neo_gen_record_default_module.User
+        target = BytesIO()
+
+        writer_schema = {
+            "type": "record",
+            "name": "User",
+            "fields": [
+                {"name": "name", "type": "string"},
+                {"name": "favorite_number", "type": "int"},
+                {"name": "favorite_color", "type": ["string", "null"]},
+                {"name": "extra", "type": "string"},
+            ],
+        }
+        writer = avro.datafile.DataFileWriter(
+            target, avro.io.DatumWriter(), avro.schema.parse(json.dumps(writer_schema))
+        )
+        for datum in USERS:
+            writer.append({**datum, "extra": "ignored"})
+        writer.flush()
+
+        target.seek(0)
+        assert [user.encode() for user in iter_records(User, target)] == [{**datum, "age": 42} for datum in USERS]
+
+    def test_truncated_block(self, neo_gen_record_module: ModuleType) -> None:
+        target = BytesIO()
+        ContainerWriter(neo_gen_record_module.User, target).close()
+        header = target.getvalue()
+
+        assert list(ContainerReader(BytesIO(header))) == []
+        for data in (header + b"\x80", header + b"\x02", header + b"\x02\x80"):
+            with pytest.raises(NeoGenContainerFileError):
+                list(ContainerReader(BytesIO(data)))
+
+    def test_header_schema(self, neo_gen_record_default_module: ModuleType) -> None:
+        User = neo_gen_record_default_module.User
+        target = BytesIO()
+        with ContainerWriter(User, target) as writer:
+            writer.write(User(**USERS[0], age=7))
+
+        target.seek(0)
+        reader = ContainerReader(target)
+        assert reader.schema == User.__schema__
+        assert reader.schema["fields"][-1]["default"] == 42
+
+        target.seek(0)
+        apache_reader = avro.datafile.DataFileReader(target, avro.io.DatumReader())
+        assert apache_reader.datum_reader.writers_schema.fields[-1].default == 42
+
+    def test_corrupt_block(self, neo_gen_record_module: ModuleType) -> None:
+        User = neo_gen_record_module.User
+        target = BytesIO()
+        ContainerWriter(User, target).close()
+        header = target.getvalue()
+        sync = header[-16:]
+        datum = BinaryCodec(User.__schema__).encode(USERS[0])
+
+        for count, data in ((2, datum), (1, datum + b"\x00")):
+            block = bytearray(header)
+            write_long(count, block)
+            write_long(len(data), block)
+            block += data + sync
+            with pytest.raises(NeoGenContainerFileError):
+                list(ContainerReader(BytesIO(bytes(block))))
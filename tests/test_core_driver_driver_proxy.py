@@ -72,3 +72,52 @@ class TestCoreDriverDriverProxy:
         driver_proxy._driver = MockWriter()  # type: ignore
         driver_proxy.write("test-value", None)  # type: ignore
         assert driver_proxy._driver.test_value == "test-value"  # type: ignore
+
+    def test_read_many(self) -> None:
+        class MockReader:
+            def read_many(self, schema_type: Any, source: Any, count: Any) -> list[str]:
+                return ["test-value"] * count
+
+        driver_proxy = DriverProxy()
+        driver_proxy._driver = MockReader()  # type: ignore
+        assert driver_proxy.read_many(None, None, 2) == ["test-value", "test-value"]  # type: ignore
+
+    def test_write_many(self) -> None:
+        class MockWriter:
+            def write_many(self, schemas: Any, target: Any) -> None:
+                self.test_value = schemas
+
+        driver_proxy = DriverProxy()
+        driver_proxy._driver = MockWriter()  # type: ignore
+        driver_proxy.write_many(["test-value"], None)  # type: ignore
+        assert driver_proxy._driver.test_value == ["test-value"]  # type: ignore
+
+    def test_from_bytes(self) -> None:
+        class MockReader:
+            def from_bytes(self, schema_type: Any, buf: Any, offset: Any) -> tuple[str, int]:
+                return "test-value", offset
+
+        driver_proxy = DriverProxy()
+        driver_proxy._driver = MockReader()  # type: ignore
+        assert driver_proxy.from_bytes(None, b"", 3) == ("test-value", 3)  # type: ignore
+
+    def test_write_into(self) -> None:
+        class MockWriter:
+            def write_into(self, schema: Any, out: Any) -> None:
+                out += schema
+
+        driver_proxy = DriverProxy()
+        driver_proxy._driver = MockWriter()  # type: ignore
+        out = bytearray()
+        driver_proxy.write_into(b"test-value", out)  # type: ignore
+        assert out == b"test-value"
+
+    def test_invalidate(self) -> None:
+        class MockInvalidator:
+            def invalidate(self, schema_type: Any) -> None:
+                self.test_value = schema_type
+
+        driver_proxy = DriverProxy()
+        driver_proxy._driver = MockInvalidator()  # type: ignore
+        driver_proxy.invalidate("test-value")  # type: ignore
+        assert driver_proxy._driver.test_value == "test-value"  # type: ignore
@@ -0,0 +1,63 @@
+import os
+from pathlib import Path
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from avro_neo_gen.core.driver.schema_registry import (
+    FileSchemaRegistry,
+    InMemorySchemaRegistry,
+)
+from avro_neo_gen.core.neo_gen_error import NeoGenSchemaRegistryError
+
+
+class TestCoreDriverSchemaRegistry:
+    def test_in_memory_schema_registry(self) -> None:
+        registry = InMemorySchemaRegistry()
+
+        assert registry.register("a", '"int"') == 1
+        assert registry.register("b", '"long"') == 2
+        assert registry.register("c", '"int"') == 1
+        assert registry.get_schema(2) == '"long"'
+
+        with pytest.raises(NeoGenSchemaRegistryError):
+            registry.get_schema(3)
+
+    def test_file_schema_registry(self, fake_filesystem: FakeFilesystem) -> None:
+        registry = FileSchemaRegistry("/registry")
+
+        with pytest.raises(NeoGenSchemaRegistryError):
+            registry.get_schema(1)
+
+        assert registry.register("a", '"int"') == 1
+        assert registry.register("b", '"long"') == 2
+        assert registry.register("c", '"int"') == 1
+        assert Path("/registry/2.avsc").read_text(encoding="utf-8") == '"long"'
+
+        Path("/registry/7.avsc").write_text('"string"', encoding="utf-8")
+        shared_registry = FileSchemaRegistry("/registry")
+        assert shared_registry.get_schema(7) == '"string"'
+        assert shared_registry.register("d", '"long"') == 2
+        assert shared_registry.register("e", '"double"') == 8
+        assert registry.get_schema(8) == '"double"'
+
+    def test_file_schema_registry_concurrent(
+        self, fake_filesystem: FakeFilesystem, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        registry = FileSchemaRegistry("/registry")
+        assert registry.register("a", '"int"') == 1
+
+        link = os.link
+
+        def concurrent_link(source: str, target: Path) -> None:
+            # Another process publishes the same schema under the next id first.
+            assert Path(source).read_text(encoding="utf-8") == '"long"'
+            if not Path("/registry/2.avsc").exists():
+                Path("/registry/2.avsc").write_text('"long"', encoding="utf-8")
+            link(source, target)
+
+        monkeypatch.setattr(os, "link", concurrent_link)
+
+        assert registry.register("b", '"long"') == 2
+        assert registry.register("c", '"long"') == 2
+        assert sorted(path.name for path in Path("/registry").iterdir()) == ["1.avsc", "2.avsc", "3.avsc"]
@@ -0,0 +1,136 @@
+import json
+from io import BytesIO
+from types import ModuleType
+
+import avro.schema
+import pytest
+
+from avro_neo_gen.core.driver.binary_codec import BinaryCodec, get_binary_codec
+from avro_neo_gen.core.driver.driver_proxy import DriverProxy
+from avro_neo_gen.core.driver.schema_registry import InMemorySchemaRegistry
+from avro_neo_gen.core.driver.schema_registry_driver import (
+    SchemaRegistryDriver,
+    read_header,
+)
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenCodecUnderflowError,
+    NeoGenFingerprintNotFound,
+    NeoGenSchemaRegistryError,
+    NeoGenWireFormatError,
+)
+
+
+class CountingSchemaRegistry(InMemorySchemaRegistry):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def register(self, subject: str, schema: str) -> int:
+        self.calls += 1
+        return super().register(subject, schema)
+
+    def get_schema(self, schema_id: int) -> str:
+        self.calls += 1
+        return super().get_schema(schema_id)
+
+
+class TestCoreDriverSchemaRegistryDriver:
+    def test_schema_registry_driver(
+        self,
+        neo_gen_record_module: ModuleType,
+        schema_registry_core_driver_proxy: DriverProxy,
+    ) -> None:
+        User = neo_gen_record_module.User
+        datum = {"name": "alice", "favorite_number": 10, "favorite_color": "red"}
+        alice = User(**datum)
+
+        encoded = alice.to_bytes()
+        assert encoded == b"\x00\x00\x00\x00\x01" + get_binary_codec(User).encode(datum)
+        assert read_header(encoded) == (1, 5)
+
+        user, end = User.from_bytes(b"\xff" + encoded, 1)
+        assert user._datum == datum
+        assert end == len(encoded) + 1
+
+        target = BytesIO()
+        alice.write(target)
+        User.write_many([alice, alice], target)
+        target.seek(0)
+        assert target.getvalue() == encoded * 3
+        assert User.read(target)._datum == datum
+        assert [user._datum for user in User.read_many(target)] == [datum, datum]
+        target.seek(0)
+        assert [user._datum for user in User.iter_read(target, buffer_size=8)] == [datum] * 3
+
+    def test_schema_registry_driver_caching(self, neo_gen_card_module: ModuleType) -> None:
+        Card = neo_gen_card_module.Card
+        Suit = neo_gen_card_module.Suit
+
+        registry = CountingSchemaRegistry()
+        suit_schema = {"type": "enum", "name": "Suit", "doc": "Not canonical", "symbols": Suit.__schema__["symbols"]}
+        suit_id = registry.register("Suit", json.dumps(suit_schema))
+        registry.calls = 0
+
+        writer = SchemaRegistryDriver(backend=registry)
+        out = bytearray()
+        for rank in range(3):
+            writer.write_into(Card(rank=rank, suit=Suit("SPADES")), out)
+        assert registry.calls == 1
+
+        reader = SchemaRegistryDriver(backend=registry)
+        offset = 0
+        for rank in range(3):
+            card, offset = reader.from_bytes(Card, out, offset)
+            assert card.rank == rank
+        assert registry.calls == 2
+
+        suit = reader.decode_any(b"\x00" + suit_id.to_bytes(4, "big") + get_binary_codec(Suit).encode("HEARTS"))
+        assert suit == Suit("HEARTS")
+        assert registry.calls == 3
+
+        reader.backend = CountingSchemaRegistry()
+        with pytest.raises(NeoGenSchemaRegistryError):
+            reader.from_bytes(Card, out)
+
+    def test_schema_registry_driver_errors(self, neo_gen_card_module: ModuleType) -> None:
+        Card = neo_gen_card_module.Card
+        Suit = neo_gen_card_module.Suit
+        driver = SchemaRegistryDriver(backend=InMemorySchemaRegistry())
+
+        out = bytearray()
+        driver.write_into(Suit("SPADES"), out)
+
+        with pytest.raises(NeoGenWireFormatError):
+            driver.from_bytes(Card, out)
+
+        with pytest.raises(NeoGenWireFormatError):
+            driver.read(Card, BytesIO(b"\x01" + bytes(out[1:])))
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            driver.read(Card, BytesIO(out[:3]))
+
+        unknown_id = driver.backend.register("Unknown", avro.schema.parse('"int"').canonical_form)
+        with pytest.raises(NeoGenFingerprintNotFound):
+            driver.decode_any(b"\x00" + unknown_id.to_bytes(4, "big") + b"\x02")
+
+    def test_schema_registry_driver_writer_schema(
+        self,
+        neo_gen_record_module: ModuleType,
+        avro_record_writer_schema_json: str,
+    ) -> None:
+        User = neo_gen_record_module.User
+        registry = CountingSchemaRegistry()
+        writer_id = registry.register("User", avro_record_writer_schema_json)
+        writer_codec = BinaryCodec(json.loads(avro_record_writer_schema_json))
+
+        out = bytearray()
+        for rank in range(3):
+            out += b"\x00" + writer_id.to_bytes(4, "big")
+            writer_codec.encode_into({"favorite_number": rank, "age": 30, "name": "alice", "favorite_color": None}, out)
+
+        driver = SchemaRegistryDriver(backend=registry)
+        offset = 0
+        for rank in range(3):
+            user, offset = driver.from_bytes(User, out, offset)
+            assert user.encode() == {"name": "alice", "favorite_number": rank, "favorite_color": None}
+        assert registry.calls == 2
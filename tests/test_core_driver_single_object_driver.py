@@ -0,0 +1,111 @@
+import json
+from io import BytesIO
+from types import ModuleType
+
+import avro.schema
+import pytest
+
+from avro_neo_gen.core.driver.binary_codec import BinaryCodec, get_binary_codec
+from avro_neo_gen.core.driver.driver_proxy import DriverProxy
+from avro_neo_gen.core.driver.single_object_driver import (
+    SingleObjectDriver,
+    decode_any,
+    read_header,
+)
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenCodecUnderflowError,
+    NeoGenFingerprintNotFound,
+    NeoGenSingleObjectError,
+)
+from avro_neo_gen.core.neo_gen_registry import fingerprint64
+
+
+class TestCoreDriverSingleObjectDriver:
+    def test_single_object_driver(
+        self,
+        neo_gen_record_module: ModuleType,
+        single_object_core_driver_proxy: DriverProxy,
+    ) -> None:
+        User = neo_gen_record_module.User
+        datum = {"name": "alice", "favorite_number": 10, "favorite_color": "red"}
+        alice = User(**datum)
+
+        encoded = alice.to_bytes()
+        assert encoded == b"\xc3\x01" + User.__fingerprint64__ + get_binary_codec(User).encode(datum)
+        assert read_header(encoded) == (User.__fingerprint64__, 10)
+
+        user, end = User.from_bytes(b"\x00" + encoded, 1)
+        assert user._datum == datum
+        assert end == len(encoded) + 1
+
+        target = BytesIO()
+        alice.write(target)
+        User.write_many([alice, alice], target)
+        target.seek(0)
+        assert target.getvalue() == encoded * 3
+        assert User.read(target)._datum == datum
+        assert [user._datum for user in User.read_many(target)] == [datum, datum]
+        target.seek(0)
+        assert [user._datum for user in User.iter_read(target, buffer_size=8)] == [datum] * 3
+
+    def test_single_object_driver_errors(self, neo_gen_card_module: ModuleType) -> None:
+        Card = neo_gen_card_module.Card
+        Suit = neo_gen_card_module.Suit
+        driver = SingleObjectDriver()
+
+        out = bytearray()
+        driver.write_into(Suit("SPADES"), out)
+
+        with pytest.raises(NeoGenSingleObjectError):
+            driver.from_bytes(Card, out)
+
+        with pytest.raises(NeoGenSingleObjectError):
+            driver.read(Card, BytesIO(b"\x00\x00" + Card.__fingerprint64__))
+
+        with pytest.raises(NeoGenCodecUnderflowError):
+            driver.read(Card, BytesIO(out[:4]))
+
+    def test_decode_any(self, neo_gen_card_module: ModuleType) -> None:
+        Card = neo_gen_card_module.Card
+        Suit = neo_gen_card_module.Suit
+        driver = SingleObjectDriver()
+
+        out = bytearray()
+        driver.write_into(Card(rank=12, suit=Suit("CLUBS")), out)
+        suit_offset = len(out)
+        driver.write_into(Suit("HEARTS"), out)
+
+        card = decode_any(out)
+        suit = decode_any(memoryview(out), suit_offset)
+
+        assert isinstance(card, Card)
+        assert card._datum == {"rank": 12, "suit": "CLUBS"}
+        assert isinstance(suit, Suit)
+        assert suit == Suit("HEARTS")
+
+        with pytest.raises(NeoGenFingerprintNotFound):
+            decode_any(b"\xc3\x01" + bytes(8))
+
+    def test_single_object_driver_writer_schema(
+        self,
+        neo_gen_record_module: ModuleType,
+        single_object_core_driver_proxy: DriverProxy,
+        avro_record_writer_schema_json: str,
+    ) -> None:
+        User = neo_gen_record_module.User
+        fingerprint = fingerprint64(avro.schema.parse(avro_record_writer_schema_json).canonical_form)
+        body = BinaryCodec(json.loads(avro_record_writer_schema_json)).encode(
+            {"favorite_number": 10, "age": 30, "name": "alice", "favorite_color": "red"}
+        )
+        encoded = b"\xc3\x01" + fingerprint + body
+
+        user, end = User.from_bytes(encoded, writer_schema=avro_record_writer_schema_json)
+        assert user.encode() == {"name": "alice", "favorite_number": 10, "favorite_color": "red"}
+        assert end == len(encoded)
+        assert User.read(BytesIO(encoded), json.loads(avro_record_writer_schema_json)).encode() == user.encode()
+
+        with pytest.raises(NeoGenSingleObjectError):
+            User.from_bytes(encoded)
+
+        with pytest.raises(NeoGenSingleObjectError):
+            User.from_bytes(b"\xc3\x01" + bytes(8) + body, writer_schema=avro_record_writer_schema_json)
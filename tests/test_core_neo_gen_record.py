@@ -1,15 +1,35 @@
+import hashlib
+import json
+from io import BytesIO
 from types import ModuleType
 
-from avro_neo_gen.core.neo_gen_record import NeoGenRecord
+import avro.schema
+import pytest
+
+from avro_neo_gen.core.driver.binary_codec import LazyDatum
+from avro_neo_gen.core.driver.driver_proxy import DriverProxy
+from avro_neo_gen.core.neo_gen_error import (
+    NeoGenAttributeError,
+    NeoGenCodecError,
+    NeoGenKeyError,
+)
+from avro_neo_gen.core.neo_gen_record import (
+    NeoGenDictRecord,
+    NeoGenRecord,
+    NeoGenSlotsRecord,
+)
+from avro_neo_gen.core.neo_gen_registry import fingerprint64
 
 
 class TestCoreNeoGenRecord:
     def test_neo_gen_record_base(self) -> None:
-        neo_gen_record = NeoGenRecord()
+        neo_gen_record = NeoGenDictRecord()
         assert neo_gen_record._datum == {}
+        assert NeoGenRecord.__slots__ == ()
 
     def test_neo_gen_record(self, neo_gen_record_module: ModuleType) -> None:
         User = neo_gen_record_module.User
+        assert issubclass(User, NeoGenDictRecord)
         assert issubclass(User, NeoGenRecord)
 
         alice = User(name="alice", favorite_number=10, favorite_color=None)
@@ -17,6 +37,14 @@ class TestCoreNeoGenRecord:
         assert isinstance(alice, NeoGenRecord)
         assert alice._datum == {"name": "alice", "favorite_number": 10, "favorite_color": None}
 
+    def test_fingerprints(self, neo_gen_record_module: ModuleType) -> None:
+        User = neo_gen_record_module.User
+        user_schema = avro.schema.parse(json.dumps(User.__canonical_schema__))
+
+        assert User.__fingerprint64__ == fingerprint64(user_schema.canonical_form)
+        assert User.__fingerprint_md5__ == hashlib.md5(user_schema.canonical_form.encode("utf-8")).digest()
+        assert User.__fingerprint_sha256__ == hashlib.sha256(user_schema.canonical_form.encode("utf-8")).digest()
+
     def test___repr__(self, neo_gen_record_module: ModuleType) -> None:
         User = neo_gen_record_module.User
         assert (
@@ -50,3 +78,158 @@ class TestCoreNeoGenRecord:
         alice.favorite_color = "teal"
 
         assert alice.encode()["favorite_color"] == "teal"
+
+    def test_projection(
+        self, neo_gen_record_module: ModuleType, compiled_binary_core_driver_proxy: DriverProxy
+    ) -> None:
+        User = neo_gen_record_module.User
+        UserNames = User.projection("favorite_color", "name")
+
+        assert User.projection("name", "favorite_color") is UserNames
+        assert issubclass(UserNames, User)
+        assert UserNames.__projection__ == ("name", "favorite_color")
+        assert User.__projection__ is None
+
+        alice = User(name="alice", favorite_number=10, favorite_color="red")
+        encoded = alice.to_bytes() * 2
+
+        partial, end = UserNames.from_bytes(encoded)
+        assert isinstance(partial, User)
+        assert partial.name == "alice"
+        assert partial.favorite_color == "red"
+        assert partial.encode() == {"name": "alice", "favorite_color": "red"}
+        assert end == len(encoded) // 2
+
+        with pytest.raises(NeoGenAttributeError, match="UserProjection does not read field 'favorite_number'"):
+            partial.favorite_number
+        with pytest.raises(AttributeError):
+            partial.missing
+
+        with pytest.raises(NeoGenCodecError):
+            partial.to_bytes()
+
+        assert User.read(BytesIO(encoded), fields=["name"]).encode() == {"name": "alice"}
+        assert User.from_bytes(encoded, end, fields=["name"])[0].encode() == {"name": "alice"}
+        assert [user.encode() for user in User.read_many(BytesIO(encoded), fields=[])] == [{}, {}]
+
+        with pytest.raises(NeoGenKeyError):
+            User.projection("name", "missing")
+
+    def test_lazy(self, neo_gen_record_module: ModuleType, compiled_binary_core_driver_proxy: DriverProxy) -> None:
+        User = neo_gen_record_module.User
+        UserLazy = User.lazy()
+
+        assert User.lazy() is UserLazy
+        assert UserLazy.lazy() is UserLazy
+        assert issubclass(UserLazy, User)
+        assert UserLazy.__lazy__ and not User.__lazy__
+
+        encoded = User(name="alice", favorite_number=10, favorite_color="red").to_bytes()
+        alice, end = User.from_bytes(encoded * 2, lazy=True)
+        assert isinstance(alice, UserLazy)
+        assert isinstance(alice._datum, LazyDatum)
+        assert end == len(encoded)
+
+        assert alice.favorite_color == "red"
+        assert alice._datum._values == {"favorite_color": "red"}
+        assert alice.to_bytes() == encoded
+
+        alice.favorite_color = "blue"
+        assert alice._lazy_datum.modified
+        assert alice.encode() == {"name": "alice", "favorite_number": 10, "favorite_color": "blue"}
+        assert User.from_bytes(alice.to_bytes())[0].favorite_color == "blue"
+
+        users = User.read_many(BytesIO(encoded * 2), lazy=True)
+        target = BytesIO()
+        User.write_many(users, target)
+        assert target.getvalue() == encoded * 2
+        assert User.read(BytesIO(encoded), lazy=True).name == "alice"
+        assert [user.name for user in User.iter_read(BytesIO(encoded * 2), lazy=True)] == ["alice", "alice"]
+        assert [user.encode() for user in User.iter_read(BytesIO(encoded), fields=["name"])] == [{"name": "alice"}]
+
+        assert (
+            UserLazy(name="bob", favorite_number=1, favorite_color=None).to_bytes()
+            == User(name="bob", favorite_number=1, favorite_color=None).to_bytes()
+        )
+
+
+class TestCoreNeoGenSlotsRecord:
+    def test_neo_gen_slots_record(self, neo_gen_slots_record_module: ModuleType) -> None:
+        User = neo_gen_slots_record_module.User
+        assert issubclass(User, NeoGenSlotsRecord)
+        assert issubclass(User, NeoGenRecord)
+        assert not issubclass(User, NeoGenDictRecord)
+        assert all("_datum" not in cls.__dict__.get("__slots__", ()) for cls in User.__mro__)
+        assert User.__slots__ == User.__fields__ == ("name", "favorite_number", "favorite_color")
+
+        alice = User(name="alice", favorite_number=10, favorite_color=None)
+
+        assert not hasattr(alice, "__dict__")
+        assert alice._datum == {"name": "alice", "favorite_number": 10, "favorite_color": None}
+
+    def test___repr__(self, neo_gen_slots_record_module: ModuleType) -> None:
+        User = neo_gen_slots_record_module.User
+        assert (
+            str(User(name="alice", favorite_number=10, favorite_color=None))
+            == "<User(datum={'name': 'alice', 'favorite_number': 10, 'favorite_color': None})>"
+        )
+
+    def test_encode_decode(self, neo_gen_slots_record_module: ModuleType) -> None:
+        User = neo_gen_slots_record_module.User
+        datum = {"name": "alice", "favorite_number": 10, "favorite_color": None}
+
+        alice = User.decode(datum)
+        assert alice.name == "alice"
+        assert alice.favorite_number == 10
+        assert alice.favorite_color is None
+        assert alice.encode() == datum
+
+        alice.favorite_color = "teal"
+        assert alice.encode()["favorite_color"] == "teal"
+
+    def test_builder(self, neo_gen_slots_record_module: ModuleType) -> None:
+        alice = neo_gen_slots_record_module.UserBuilder().name("alice").favorite_number(1).favorite_color(None).build()
+        assert isinstance(alice, NeoGenSlotsRecord)
+        assert alice.encode() == {"name": "alice", "favorite_number": 1, "favorite_color": None}
+
+    def test_projection(
+        self, neo_gen_slots_record_module: ModuleType, apache_avro_binary_core_driver_proxy: DriverProxy
+    ) -> None:
+        User = neo_gen_slots_record_module.User
+        alice = User(name="alice", favorite_number=10, favorite_color="red")
+
+        partial = User.read(BytesIO(alice.to_bytes()), fields=["favorite_number"])
+        assert partial.favorite_number == 10
+        assert partial._datum == partial.encode() == {"favorite_number": 10}
+
+        with pytest.raises(NeoGenAttributeError, match="UserProjection does not read field 'name'"):
+            partial.name
+        with pytest.raises(AttributeError):
+            partial.missing
+
+    def test_lazy(self, neo_gen_slots_record_module: ModuleType, single_object_core_driver_proxy: DriverProxy) -> None:
+        User = neo_gen_slots_record_module.User
+        UserLazy = User.lazy()
+        assert UserLazy.__slots__ == ("_lazy_datum",)
+        assert UserLazy.__fields__ == User.__fields__
+
+        encoded = User(name="alice", favorite_number=10, favorite_color="red").to_bytes()
+        alice = User.from_bytes(encoded, lazy=True)[0]
+        assert isinstance(alice, UserLazy)
+        assert not hasattr(alice, "__dict__")
+
+        assert alice.favorite_number == 10
+        assert alice._lazy_datum._values == {"favorite_number": 10}
+        assert alice.to_bytes() == encoded
+        assert alice._datum == {"name": "alice", "favorite_number": 10, "favorite_color": "red"}
+
+        with pytest.raises(AttributeError):
+            alice.missing
+
+        alice.name = "bob"
+        assert alice.encode() == {"name": "bob", "favorite_number": 10, "favorite_color": "red"}
+        assert User.from_bytes(alice.to_bytes())[0].name == "bob"
+
+        bob = UserLazy(name="bob", favorite_number=1, favorite_color=None)
+        assert bob._lazy_datum is None
+        assert bob.encode() == {"name": "bob", "favorite_number": 1, "favorite_color": None}
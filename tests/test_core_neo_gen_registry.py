@@ -0,0 +1,74 @@
+import json
+from types import ModuleType
+
+import avro.schema
+import pytest
+
+from avro_neo_gen.core.neo_gen_error import NeoGenFingerprintNotFound
+from avro_neo_gen.core.neo_gen_registry import (
+    fingerprint64,
+    lookup_schema_type,
+    parsing_canonical_form,
+    register_schema_type,
+    registered_schema_type,
+)
+
+
+class TestCoreNeoGenRegistry:
+    def test_register_schema_type(self, neo_gen_card_module: ModuleType) -> None:
+        Card = neo_gen_card_module.Card
+        Suit = neo_gen_card_module.Suit
+
+        assert lookup_schema_type(Card.__fingerprint64__) is Card
+        assert lookup_schema_type(memoryview(Suit.__fingerprint64__)) is Suit
+
+        class Replacement(Card):
+            pass
+
+        assert lookup_schema_type(Card.__fingerprint64__) is Card
+
+        register_schema_type(Replacement)
+        assert lookup_schema_type(Card.__fingerprint64__) is Replacement
+
+    def test_fingerprint64(self, neo_gen_record_module: ModuleType) -> None:
+        User = neo_gen_record_module.User
+        canonical_form = json.dumps(User.__canonical_schema__, separators=(",", ":"))
+
+        assert fingerprint64(canonical_form) == User.__fingerprint64__
+        assert int.from_bytes(fingerprint64('"null"'), "little", signed=True) == 7195948357588979594
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            '"int"',
+            '{"type": "string", "logicalType": "uuid"}',
+            '{"type": "array", "items": {"type": "map", "values": ["null", {"type": "long"}]}}',
+            '{"type": "fixed", "name": "md5", "namespace": "a.b", "size": 16, "doc": "Digest"}',
+            json.dumps(
+                {
+                    "type": "record",
+                    "name": "Node",
+                    "namespace": "com.acme",
+                    "doc": "Stripped",
+                    "aliases": ["Old"],
+                    "fields": [
+                        {"name": "hash", "type": {"type": "fixed", "name": "Hash", "size": 4}, "default": "abcd"},
+                        {"name": "suit", "type": {"type": "enum", "name": "x.Suit", "symbols": ["A"], "default": "A"}},
+                        {"name": "again", "type": ["null", "x.Suit", "Hash"]},
+                        {"name": "children", "type": {"type": "array", "items": "Node"}},
+                    ],
+                }
+            ),
+        ],
+    )
+    def test_parsing_canonical_form(self, schema: str) -> None:
+        canonical_form = avro.schema.parse(schema).canonical_form
+
+        assert parsing_canonical_form(schema) == canonical_form
+        assert parsing_canonical_form(json.loads(schema)) == canonical_form
+
+    def test_lookup_schema_type(self) -> None:
+        assert registered_schema_type(bytes(8)) is None
+
+        with pytest.raises(NeoGenFingerprintNotFound):
+            lookup_schema_type(bytes(8))
@@ -1,7 +1,13 @@
+import importlib
+from importlib.metadata import PackageNotFoundError
 from typing import Any
 from unittest.mock import Mock, patch
 
-from avro_neo_gen.core.utils import record_builder_internal
+import pytest
+
+import avro_neo_gen.core
+from avro_neo_gen.core.neo_gen_error import NeoGenRuntimeVersionError
+from avro_neo_gen.core.utils import record_builder_internal, require_runtime_version
 
 
 class TestCoreUtils:
@@ -24,3 +30,22 @@ class TestCoreUtils:
             return record_builder_internal()
 
         assert _test_func(10, "hello test") == {"field_one": 10, "field_two": "hello test"}
+
+    @patch("avro_neo_gen.core.__version__", "0.2.3")
+    def test_require_runtime_version(self) -> None:
+        for version in ["0.2", "0.2.0", "0.2.3", "0.2.3rc1"]:
+            require_runtime_version(version)
+
+        for version in ["0.2.4", "0.1.9", "0.3.0", "1.2.3", "dev"]:
+            with pytest.raises(NeoGenRuntimeVersionError):
+                require_runtime_version(version)
+
+    def test_version(self) -> None:
+        try:
+            with patch("importlib.metadata.version", return_value="1.2.3"):
+                assert importlib.reload(avro_neo_gen.core).__version__ == "1.2.3"
+
+            with patch("importlib.metadata.version", side_effect=PackageNotFoundError("avro-neo-gen")):
+                assert importlib.reload(avro_neo_gen.core).__version__ == "0.0.0"
+        finally:
+            importlib.reload(avro_neo_gen.core)
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import avro.schema
@@ -44,3 +45,23 @@ class TestLexerReadPath:
         Path("source/list.avsc").write_text(data="null", encoding="utf-8")
         with pytest.raises(NotImplementedError):
             _ = next(read_path(Path("source")))
+
+    @pytest.mark.parametrize("jobs", [1, 2, 0])
+    def test_read_path_jobs(self, tmp_path: Path, avro_record_schema_json: str, jobs: int) -> None:
+        names = [f"Record{index:02}" for index in range(12)]
+        for name in reversed(names):
+            (tmp_path / f"{name}.avsc").write_text(avro_record_schema_json.replace("User", name), encoding="utf-8")
+
+        schemas = list(read_path(tmp_path, jobs=jobs))
+        assert [schema.name for schema in schemas] == names
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_read_path_jobs_error(self, tmp_path: Path, avro_record_schema_json: str, jobs: int) -> None:
+        (tmp_path / "a.avsc").write_text(avro_record_schema_json, encoding="utf-8")
+        (tmp_path / "b.avsc").write_text("{", encoding="utf-8")
+        (tmp_path / "c.avsc").write_text("[]", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            list(read_path(tmp_path, jobs=jobs))
+
+        assert exc_info.value.__notes__ == [f"Failed to lex Avro schema file: {tmp_path / 'b.avsc'}"]
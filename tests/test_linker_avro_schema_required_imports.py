@@ -70,11 +70,10 @@ class TestLinkerAvroSchemaRequiredImports:
             "avro_neo_gen.core": {
                 "AbstractNeoGenRecordBuilder",
                 "NeoGenEnum",
+                "NeoGenDictRecord",
                 "NeoGenFixed",
                 "NeoGenFixedDecimal",
-                "NeoGenRecord",
             },
-            "avro_neo_gen.core.utils": {"record_builder_internal"},
             "collections": {"OrderedDict"},
             "datetime": {"date", "datetime", "time"},
             "org.acme": {"OrgTest"},
@@ -95,3 +94,9 @@ class TestLinkerAvroSchemaRequiredImports:
         invalid_logical_schema._schema.logical_type = "baz"
         with pytest.raises(NotImplementedError):
             _ = avro_schema_required_imports(invalid_logical_schema)
+
+    def test_avro_schema_required_imports_slots(self, avro_record_schema: avro.schema.RecordSchema) -> None:
+        assert avro_schema_required_imports(AvroSchema(avro_record_schema), slots=True) == {
+            "avro_neo_gen.core": {"AbstractNeoGenRecordBuilder", "NeoGenSlotsRecord"},
+            "collections": {"OrderedDict"},
+        }
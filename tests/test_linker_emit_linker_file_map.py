@@ -1,9 +1,11 @@
 from ast import Module, Pass
 from pathlib import Path
+from typing import Iterator
 
 from pyfakefs.fake_filesystem import FakeFilesystem
 
 from avro_neo_gen.linker.emit_linker_file_map import emit_linker_file_map
+from avro_neo_gen.type_defs import LinkerSourceFile
 
 
 class TestLinkerEmitLinkerFileMap:
@@ -18,3 +20,27 @@ class TestLinkerEmitLinkerFileMap:
 
         assert generated_path.exists()
         assert generated_path.read_text(encoding="utf-8") == "pass\npass\npass\n"
+
+    def test_emit_linker_file_map_source(self, fake_filesystem: FakeFilesystem) -> None:
+        emit_linker_file_map(linker_file_map={"test.py": "pass"}, base_path="target")
+
+        assert Path("target/test.py").read_text(encoding="utf-8") == "pass\n"
+
+    def test_emit_linker_file_map_items(self, fake_filesystem: FakeFilesystem) -> None:
+        def _linker_file_items() -> Iterator[tuple[str, str]]:
+            yield "foo/test.py", "pass"
+            assert Path("target/foo/test.py").exists()
+            yield "bar/test.py", "pass"
+
+        emit_linker_file_map(linker_file_map=_linker_file_items(), base_path="target")
+
+        assert Path("target/bar/test.py").read_text(encoding="utf-8") == "pass\n"
+
+    def test_emit_linker_file_map_source_file(self, fake_filesystem: FakeFilesystem) -> None:
+        fake_filesystem.create_file("corelib/test.py", contents="# Comment\npass\n")
+        emit_linker_file_map(
+            linker_file_map={"core/test.py": LinkerSourceFile(path=Path("corelib/test.py"), sha256="")},
+            base_path="target",
+        )
+
+        assert Path("target/core/test.py").read_text(encoding="utf-8") == "# Comment\npass\n"
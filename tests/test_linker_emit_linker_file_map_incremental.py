@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+from ast import Module, Pass
+from pathlib import Path
+
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from avro_neo_gen.linker.emit_linker_file_map_incremental import (
+    MANIFEST_FILENAME,
+    emit_linker_file_map_incremental,
+)
+from avro_neo_gen.type_defs import LinkerSourceFile
+
+
+class TestLinkerEmitLinkerFileMapIncremental:
+    def test_emit_linker_file_map_incremental(self, fake_filesystem: FakeFilesystem) -> None:
+        fake_filesystem.create_file("target/user.py", contents="# not generated\n")
+
+        report = emit_linker_file_map_incremental(
+            linker_file_map={
+                "foo/bar/test.py": Module(body=[Pass()], type_ignores=[]),
+                "foo/baz/test.py": "x = 1",
+                "keep.py": "y = 2",
+            },
+            base_path="target",
+        )
+        assert report.written == ["foo/bar/test.py", "foo/baz/test.py", "keep.py"]
+        assert Path("target/foo/bar/test.py").read_text(encoding="utf-8") == "pass\n"
+        assert set(json.loads(Path("target", MANIFEST_FILENAME).read_text(encoding="utf-8"))["files"]) == {
+            "foo/bar/test.py",
+            "foo/baz/test.py",
+            "keep.py",
+        }
+
+        for path in ["target/foo/bar/test.py", "target/keep.py", f"target/{MANIFEST_FILENAME}"]:
+            os.utime(path, (0, 0))
+
+        report = emit_linker_file_map_incremental(
+            linker_file_map={"foo/bar/test.py": "pass", "keep.py": "y = 3"},
+            base_path="target",
+        )
+        assert report.written == ["keep.py"]
+        assert report.unchanged == ["foo/bar/test.py"]
+        assert report.deleted == ["foo/baz/test.py"]
+
+        assert Path("target/foo/bar/test.py").stat().st_mtime == 0
+        assert Path("target/keep.py").read_text(encoding="utf-8") == "y = 3\n"
+        assert not Path("target/foo/baz").exists()
+        assert Path("target/user.py").exists()
+
+        os.utime(f"target/{MANIFEST_FILENAME}", (0, 0))
+        report = emit_linker_file_map_incremental(
+            linker_file_map={"foo/bar/test.py": "pass", "keep.py": "y = 3"},
+            base_path="target",
+        )
+        assert report.written == report.deleted == []
+        assert Path("target", MANIFEST_FILENAME).stat().st_mtime == 0
+
+    def test_emit_linker_file_map_incremental_unmanifested(self, fake_filesystem: FakeFilesystem) -> None:
+        fake_filesystem.create_file("target/same.py", contents="pass\n")
+        fake_filesystem.create_file("target/changed.py", contents="pass\n")
+        fake_filesystem.create_file(f"target/{MANIFEST_FILENAME}", contents="{")
+
+        report = emit_linker_file_map_incremental(
+            linker_file_map={"same.py": "pass", "changed.py": "x = 1"},
+            base_path="target",
+        )
+
+        assert report.written == ["changed.py"]
+        assert report.unchanged == ["same.py"]
+        assert report.deleted == []
+
+    def test_emit_linker_file_map_incremental_source_file(self, fake_filesystem: FakeFilesystem) -> None:
+        data = b"# Comment\npass\n"
+        fake_filesystem.create_file("corelib/test.py", contents=data)
+        linker_file_map = {
+            "core/test.py": LinkerSourceFile(path=Path("corelib/test.py"), sha256=hashlib.sha256(data).hexdigest())
+        }
+
+        report = emit_linker_file_map_incremental(linker_file_map=linker_file_map, base_path="target")
+        assert report.written == ["core/test.py"]
+        assert Path("target/core/test.py").read_bytes() == data
+
+        Path("corelib/test.py").unlink()
+        report = emit_linker_file_map_incremental(linker_file_map=linker_file_map, base_path="target")
+        assert report.unchanged == ["core/test.py"]
+
+    def test_emit_linker_file_map_incremental_restores_edited(self, fake_filesystem: FakeFilesystem) -> None:
+        linker_file_map = {"edited.py": "x = 1", "damaged.py": "y = 2"}
+        emit_linker_file_map_incremental(linker_file_map=linker_file_map, base_path="target")
+
+        Path("target/edited.py").write_text("x = 1  # edited\n", encoding="utf-8")
+        Path("target/damaged.py").write_bytes(b"\x00" * len("y = 2\n"))
+
+        report = emit_linker_file_map_incremental(linker_file_map=linker_file_map, base_path="target")
+        assert report.written == ["damaged.py", "edited.py"]
+        assert Path("target/edited.py").read_text(encoding="utf-8") == "x = 1\n"
+        assert Path("target/damaged.py").read_text(encoding="utf-8") == "y = 2\n"
+
+    def test_emit_linker_file_map_incremental_outside_base_path(self, fake_filesystem: FakeFilesystem) -> None:
+        fake_filesystem.create_file("outside.py", contents="pass\n")
+        fake_filesystem.create_file("target/stale.py", contents="pass\n")
+        fake_filesystem.create_file(
+            f"target/{MANIFEST_FILENAME}",
+            contents=json.dumps({"files": {"../outside.py": "0" * 64, "/outside.py": "0" * 64, "stale.py": "0" * 64}}),
+        )
+
+        report = emit_linker_file_map_incremental(linker_file_map={"keep.py": "pass"}, base_path="target")
+
+        assert report.deleted == ["stale.py"]
+        assert not Path("target/stale.py").exists()
+        assert Path("outside.py").exists()
@@ -1,9 +1,13 @@
 import ast
 from inspect import cleandoc
+from pathlib import Path
+
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from avro_neo_gen.linker.inject_corelib_sys_path_shim import (
     inject_corelib_sys_path_shim,
 )
+from avro_neo_gen.type_defs import LinkerSourceFile
 
 
 class TestInjectCorelibSysPathShim:
@@ -40,3 +44,11 @@ class TestInjectCorelibSysPathShim:
         )
 
         assert ast.unparse(injected_file_map["__init__.py"]) == expected_python
+
+    def test_inject_corelib_sys_path_shim_source_file(self, fake_filesystem: FakeFilesystem) -> None:
+        fake_filesystem.create_file("root.py", contents="pass\n")
+        linker_file_map = {"__init__.py": LinkerSourceFile(path=Path("root.py"), sha256="")}
+        injected_file_map = inject_corelib_sys_path_shim(linker_file_map)
+
+        assert ast.unparse(injected_file_map["__init__.py"]).splitlines()[0] == "import sys"
+        assert ast.unparse(injected_file_map["__init__.py"]).splitlines()[-1] == "pass"
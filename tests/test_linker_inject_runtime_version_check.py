@@ -0,0 +1,58 @@
+import ast
+from inspect import cleandoc
+from unittest.mock import patch
+
+import pytest
+
+from avro_neo_gen.core.neo_gen_error import NeoGenValueError
+from avro_neo_gen.linker.inject_runtime_version_check import (
+    inject_runtime_version_check,
+)
+
+
+class TestInjectRuntimeVersionCheck:
+    def test_inject_runtime_version_check(self) -> None:
+        linker_file_map = {"__init__.py": ast.Module(type_ignores=[], body=[ast.Pass()])}
+        injected_file_map = inject_runtime_version_check(linker_file_map, version="1.2.3")
+
+        expected_python = cleandoc("""
+            from avro_neo_gen.core.utils import require_runtime_version
+            require_runtime_version('1.2.3')
+            pass
+        """)
+
+        assert ast.unparse(injected_file_map["__init__.py"]) == expected_python
+
+    def test_inject_runtime_version_check_source(self) -> None:
+        injected_file_map = inject_runtime_version_check({"__init__.py": "pass"}, version="1.2.3")
+
+        assert injected_file_map["__init__.py"].splitlines() == [
+            "from avro_neo_gen.core.utils import require_runtime_version",
+            "require_runtime_version('1.2.3')",
+            "pass",
+        ]
+
+    @patch("avro_neo_gen.core.__version__", "0.2.3")
+    def test_inject_runtime_version_check_default(self) -> None:
+        injected_file_map = inject_runtime_version_check({"__init__.py": "pass"})
+
+        assert "require_runtime_version('0.2.3')" in injected_file_map["__init__.py"]
+
+    def test_inject_runtime_version_check_unknown_version(self) -> None:
+        with patch("avro_neo_gen.core.__version__", "0.0.0"):
+            with pytest.raises(NeoGenValueError):
+                inject_runtime_version_check({"__init__.py": "pass"})
+
+        with pytest.raises(NeoGenValueError):
+            inject_runtime_version_check({"__init__.py": "pass"}, version="0.0.0")
+
+    def test_inject_runtime_version_check_every_module(self) -> None:
+        linker_file_map = {
+            "__init__.py": "pass",
+            "com/acme/__init__.py": ast.Module(type_ignores=[], body=[ast.Pass()]),
+        }
+        injected_file_map = inject_runtime_version_check(linker_file_map, version="1.2.3")
+
+        assert set(injected_file_map.keys()) == set(linker_file_map.keys())
+        assert "require_runtime_version('1.2.3')" in injected_file_map["__init__.py"]
+        assert "require_runtime_version('1.2.3')" in ast.unparse(injected_file_map["com/acme/__init__.py"])
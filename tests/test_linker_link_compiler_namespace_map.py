@@ -32,19 +32,20 @@ class TestLinkerLinkCompilerNamespaceMap:
 
         assert set(linker_file_map.keys()) == {"com/acme/__init__.py", "org/acme/__init__.py"}
 
-        expected_org_python = cleandoc(
-            """
-            from avro_neo_gen.core import AbstractNeoGenRecordBuilder, NeoGenRecord
-            from avro_neo_gen.core.utils import record_builder_internal
+        expected_org_python = cleandoc("""
+            from avro_neo_gen.core import AbstractNeoGenRecordBuilder, NeoGenDictRecord
             from collections import OrderedDict
             from typing import Optional
 
-            class OrgTest(NeoGenRecord):
+            class OrgTest(NeoGenDictRecord):
                 __canonical_schema__ = OrderedDict(name='org.acme.OrgTest', type='record', fields=[OrderedDict([('name', 'name'), ('type', 'string')]), OrderedDict([('name', 'favorite_number'), ('type', ['int', 'null'])]), OrderedDict([('name', 'favorite_color'), ('type', ['string', 'null'])])])
                 __schema__ = dict(type='record', name='OrgTest', namespace='org.acme', fields=[{'type': 'string', 'name': 'name'}, {'type': ['int', 'null'], 'name': 'favorite_number'}, {'type': ['string', 'null'], 'name': 'favorite_color'}])
+                __fingerprint64__ = bytes.fromhex('924bb7fb07109007')
+                __fingerprint_md5__ = bytes.fromhex('69b97045736a91fe61aff6716eb13ae3')
+                __fingerprint_sha256__ = bytes.fromhex('7bf450a60e7da60b07e2d5524e89f851ba2a7817539e7d4ca72feb33e451cfcf')
 
                 def __init__(self, name: str, favorite_number: Optional[int], favorite_color: Optional[str]) -> None:
-                    self._datum = record_builder_internal(self_name='self')
+                    self._datum = {'name': name, 'favorite_number': favorite_number, 'favorite_color': favorite_color}
 
                 @property
                 def name(self) -> str:
@@ -86,23 +87,23 @@ class TestLinkerLinkCompilerNamespaceMap:
 
                 def build(self) -> 'OrgTest':
                     return OrgTest(**self._state)
-        """
-        )
+        """)
         assert ast.unparse(linker_file_map["org/acme/__init__.py"]) == expected_org_python
 
-        expected_com_python = cleandoc(
-            """
-            from avro_neo_gen.core import AbstractNeoGenRecordBuilder, NeoGenRecord
-            from avro_neo_gen.core.utils import record_builder_internal
+        expected_com_python = cleandoc("""
+            from avro_neo_gen.core import AbstractNeoGenRecordBuilder, NeoGenDictRecord
             from collections import OrderedDict
             from org.acme import OrgTest
 
-            class ComTest(NeoGenRecord):
+            class ComTest(NeoGenDictRecord):
                 __canonical_schema__ = OrderedDict(name='com.acme.ComTest', type='record', fields=[OrderedDict([('name', 'org_test'), ('type', OrderedDict([('name', 'org.acme.OrgTest'), ('type', 'record'), ('fields', [OrderedDict([('name', 'name'), ('type', 'string')]), OrderedDict([('name', 'favorite_number'), ('type', ['int', 'null'])]), OrderedDict([('name', 'favorite_color'), ('type', ['string', 'null'])])])]))])])
                 __schema__ = dict(type='record', name='ComTest', namespace='com.acme', fields=[{'type': {'type': 'record', 'name': 'OrgTest', 'namespace': 'org.acme', 'fields': [{'type': 'string', 'name': 'name'}, {'type': ['int', 'null'], 'name': 'favorite_number'}, {'type': ['string', 'null'], 'name': 'favorite_color'}]}, 'name': 'org_test'}])
+                __fingerprint64__ = bytes.fromhex('49768eec46520dc0')
+                __fingerprint_md5__ = bytes.fromhex('f2714ee87293b1a3e9b9244c94a2d313')
+                __fingerprint_sha256__ = bytes.fromhex('187f4063c53684ae7f18645262e6802e8e44ff60ee2760a8c5c193e8c429d790')
 
                 def __init__(self, org_test: 'OrgTest') -> None:
-                    self._datum = record_builder_internal(self_name='self')
+                    self._datum = {'org_test': org_test}
 
                 @property
                 def org_test(self) -> 'OrgTest':
@@ -120,6 +121,34 @@ class TestLinkerLinkCompilerNamespaceMap:
 
                 def build(self) -> 'ComTest':
                     return ComTest(**self._state)
-        """
-        )
+        """)
         assert ast.unparse(linker_file_map["com/acme/__init__.py"]) == expected_com_python
+
+    def test_link_compiler_namespace_map_relative_imports(self, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        org_record = schema | {"name": "OrgTest", "namespace": "org.acme"}
+        for root_namespace, expected_import in [
+            ("com.acme", "from ...org.acme import OrgTest"),
+            (None, "from .org.acme import OrgTest"),
+        ]:
+            root_record = avro.schema.parse(
+                json.dumps(
+                    schema
+                    | {
+                        "name": "RootTest",
+                        "namespace": root_namespace,
+                        "fields": [{"name": "org_test", "type": org_record}],
+                    }
+                )
+            )
+            compiler_namespace_map = compile_parser_namespace_map(parse_schema([AvroSchema(root_record)]))
+            linker_file_map = link_compiler_namespace_map(compiler_namespace_map, relative_imports=True)
+
+            root_path = "com/acme/__init__.py" if root_namespace else "__init__.py"
+            root_imports = ast.unparse(linker_file_map[root_path]).splitlines()[:3]
+            assert root_imports == [
+                "from avro_neo_gen.core import AbstractNeoGenRecordBuilder, NeoGenDictRecord",
+                "from collections import OrderedDict",
+                expected_import,
+            ]
+            assert "from avro_neo_gen.core import" in ast.unparse(linker_file_map["org/acme/__init__.py"])
@@ -1,7 +1,8 @@
-import ast
+import hashlib
 from pathlib import Path
 
 from avro_neo_gen.linker.link_corelib import link_corelib
+from avro_neo_gen.type_defs import LinkerSourceFile
 
 
 class TestLinkerLinkCorelib:
@@ -18,6 +19,8 @@ class TestLinkerLinkCorelib:
         corelib_linker_file_map = link_corelib()
 
         for corelib_file in corelib_files:
-            assert corelib_file in corelib_linker_file_map
-            source_python = ast.unparse(ast.parse((corelib_path / corelib_file).read_text(encoding="utf-8")))
-            assert source_python == ast.unparse(corelib_linker_file_map[corelib_file])
+            source_path = corelib_path / corelib_file
+            assert corelib_linker_file_map[corelib_file] == LinkerSourceFile(
+                path=source_path, sha256=hashlib.sha256(source_path.read_bytes()).hexdigest()
+            )
+        assert link_corelib() == corelib_linker_file_map
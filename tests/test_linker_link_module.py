@@ -1,13 +1,28 @@
+import ast
+import importlib
 import json
+import sys
+from pathlib import Path
+from typing import Iterator, Union
+from unittest.mock import patch
 
 import avro.schema
+import pytest
 
 from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.compiler.compile_parser_namespace_map import (
     compile_parser_namespace_map,
+    iter_compile_parser_namespace_map,
 )
-from avro_neo_gen.linker.link_module import link_module
+from avro_neo_gen.core.neo_gen_error import NeoGenRuntimeVersionError
+from avro_neo_gen.linker.emit_linker_file_map import emit_linker_file_map
+from avro_neo_gen.linker.link_module import iter_link_module, link_module
 from avro_neo_gen.parser.parse_schema import parse_schema
+from avro_neo_gen.type_defs import CompilerNamespaceMapCell, LinkerSourceFile
+
+
+def _unparse(module: Union[ast.Module, str, LinkerSourceFile]) -> Union[str, LinkerSourceFile]:
+    return module if isinstance(module, str | LinkerSourceFile) else ast.unparse(module)
 
 
 class TestLinkerLinkModule:
@@ -22,13 +37,20 @@ class TestLinkerLinkModule:
             "avro_neo_gen/core/driver/abstract_avro_driver.py",
             "avro_neo_gen/core/driver/apache_avro_binary_driver.py",
             "avro_neo_gen/core/driver/avro_driver_type.py",
+            "avro_neo_gen/core/driver/binary_codec.py",
+            "avro_neo_gen/core/driver/compiled_binary_driver.py",
+            "avro_neo_gen/core/driver/container_file.py",
             "avro_neo_gen/core/driver/driver_proxy.py",
+            "avro_neo_gen/core/driver/schema_registry.py",
+            "avro_neo_gen/core/driver/schema_registry_driver.py",
+            "avro_neo_gen/core/driver/single_object_driver.py",
             "avro_neo_gen/core/neo_gen_builder.py",
             "avro_neo_gen/core/neo_gen_encodable.py",
             "avro_neo_gen/core/neo_gen_enum.py",
             "avro_neo_gen/core/neo_gen_error.py",
             "avro_neo_gen/core/neo_gen_fixed.py",
             "avro_neo_gen/core/neo_gen_record.py",
+            "avro_neo_gen/core/neo_gen_registry.py",
             "avro_neo_gen/core/neo_gen_type.py",
             "avro_neo_gen/core/type_defs.py",
             "avro_neo_gen/core/utils.py",
@@ -62,14 +84,99 @@ class TestLinkerLinkModule:
             "avro_neo_gen/core/driver/abstract_avro_driver.py",
             "avro_neo_gen/core/driver/apache_avro_binary_driver.py",
             "avro_neo_gen/core/driver/avro_driver_type.py",
+            "avro_neo_gen/core/driver/binary_codec.py",
+            "avro_neo_gen/core/driver/compiled_binary_driver.py",
+            "avro_neo_gen/core/driver/container_file.py",
             "avro_neo_gen/core/driver/driver_proxy.py",
+            "avro_neo_gen/core/driver/schema_registry.py",
+            "avro_neo_gen/core/driver/schema_registry_driver.py",
+            "avro_neo_gen/core/driver/single_object_driver.py",
             "avro_neo_gen/core/neo_gen_builder.py",
             "avro_neo_gen/core/neo_gen_encodable.py",
             "avro_neo_gen/core/neo_gen_enum.py",
             "avro_neo_gen/core/neo_gen_error.py",
             "avro_neo_gen/core/neo_gen_fixed.py",
             "avro_neo_gen/core/neo_gen_record.py",
+            "avro_neo_gen/core/neo_gen_registry.py",
             "avro_neo_gen/core/neo_gen_type.py",
             "avro_neo_gen/core/type_defs.py",
             "avro_neo_gen/core/utils.py",
         }
+
+    def test_iter_link_module(self, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        for root_namespace in ["com.acme", None]:
+            root_record = avro.schema.parse(
+                json.dumps(
+                    schema
+                    | {
+                        "name": "RootTest",
+                        "namespace": root_namespace,
+                        "fields": [{"name": "org_test", "type": schema | {"name": "OrgTest", "namespace": "org.acme"}}],
+                    }
+                )
+            )
+            parser_namespace_map = parse_schema([AvroSchema(root_record)])
+            expected_file_map = link_module(compile_parser_namespace_map(parser_namespace_map))
+
+            linked_namespaces: list[str] = []
+
+            def _compiler_namespace_items() -> Iterator[tuple[str, list[CompilerNamespaceMapCell]]]:
+                for namespace, cells in iter_compile_parser_namespace_map(parser_namespace_map):
+                    linked_namespaces.append(namespace)
+                    yield namespace, cells
+
+            module_file_items = iter_link_module(_compiler_namespace_items())
+            path, module = next(module_file_items)
+            assert linked_namespaces == [next(iter(parser_namespace_map))]
+
+            module_file_map = {path: module, **dict(module_file_items)}
+            assert linked_namespaces == list(parser_namespace_map)
+            assert list(module_file_map) == list(expected_file_map)
+            assert {path: _unparse(module) for path, module in module_file_map.items()} == {
+                path: _unparse(module) for path, module in expected_file_map.items()
+            }
+
+    @patch("avro_neo_gen.core.__version__", "0.2.0")
+    def test_link_module_shared_runtime(self, avro_record_schema_json: str) -> None:
+        parser_namespace_map = parse_schema([AvroSchema(avro.schema.parse(avro_record_schema_json))])
+        compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map)
+
+        module_file_map = link_module(compiler_namespace_map, shared_runtime=True)
+        assert set(module_file_map.keys()) == {"__init__.py", "com/acme/__init__.py"}
+        assert "sys.path" not in _unparse(module_file_map["__init__.py"])
+
+        for module in module_file_map.values():
+            assert "require_runtime_version" in _unparse(module)
+
+    def test_link_module_shared_runtime_mismatch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, avro_record_schema_json: str
+    ) -> None:
+        monkeypatch.setattr("avro_neo_gen.core.__version__", "0.2.0")
+        schema = json.loads(avro_record_schema_json)
+        org_record = schema | {"name": "OrgTest", "namespace": "shared_runtime_test.org"}
+        com_record = schema | {
+            "name": "ComTest",
+            "namespace": "shared_runtime_test.com",
+            "fields": [{"name": "org_test", "type": org_record}],
+        }
+        parser_namespace_map = parse_schema([AvroSchema(avro.schema.parse(json.dumps(com_record)))])
+        compiler_namespace_map = compile_parser_namespace_map(parser_namespace_map)
+        package_path = tmp_path / "shared_runtime_package"
+        emit_linker_file_map(link_module(compiler_namespace_map, shared_runtime=True), package_path)
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+        name = "shared_runtime_package.shared_runtime_test.com"
+        with monkeypatch.context() as version_patch:
+            version_patch.setattr("avro_neo_gen.core.__version__", "9.9.9")
+            with pytest.raises(NeoGenRuntimeVersionError):
+                importlib.import_module(name)
+
+        module = importlib.import_module(name)
+        assert module.ComTest.__name__ == "ComTest"
+        assert module.OrgTest.__module__ == "shared_runtime_package.shared_runtime_test.org"
+        assert str(package_path) not in sys.path
+        assert "shared_runtime_test" not in sys.modules
+
+        for module_name in [module_name for module_name in sys.modules if "shared_runtime_package" in module_name]:
+            del sys.modules[module_name]
@@ -2,7 +2,9 @@ import json
 
 import avro.schema
 
+from avro_neo_gen.avro_schema import AvroSchema
 from avro_neo_gen.parser.parse_schema import parse_schema
+from avro_neo_gen.parser.parser_index import ParserIndex
 
 
 class TestParserParseSchema:
@@ -43,3 +45,16 @@ class TestParserParseSchema:
 
         assert "org.acme" in parser_namespace_map
         assert parser_namespace_map["org.acme"][-1] == org_record
+
+    def test_parse_schema_index(self, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        com_record = avro.schema.parse(json.dumps(schema | {"namespace": "com.acme", "name": "ComTest"}))
+        org_record = avro.schema.parse(json.dumps(schema | {"namespace": "org.acme", "name": "OrgTest"}))
+
+        index = ParserIndex()
+        assert parse_schema([com_record], index=index) is index.namespace_map
+        parser_namespace_map = parse_schema([org_record], index=index)
+
+        assert parser_namespace_map == parse_schema([com_record, org_record])
+        assert index.by_fullname["com.acme.ComTest"] == com_record
+        assert index.by_fingerprint[AvroSchema(org_record).fingerprint64] == org_record
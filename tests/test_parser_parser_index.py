@@ -0,0 +1,84 @@
+import json
+
+import avro.schema
+import pytest
+
+from avro_neo_gen.avro_schema import AvroSchema
+from avro_neo_gen.parser.parser_index import ParserIndex, SchemaRedefinitionError
+
+
+class TestParserParserIndex:
+    def test_from_schemas(self, avro_record_schema_json: str) -> None:
+        schema = json.loads(avro_record_schema_json)
+        com_record = avro.schema.parse(
+            json.dumps(
+                schema
+                | {
+                    "name": "ComTest",
+                    "namespace": "com.acme",
+                    "fields": [{"name": "org_test", "type": schema | {"name": "OrgTest", "namespace": "org.acme"}}],
+                }
+            )
+        )
+        org_record = com_record.fields[0].type
+
+        index = ParserIndex.from_schemas([com_record])
+
+        assert list(index.namespace_map) == ["org.acme", "com.acme"]
+        assert index.namespace_map["com.acme"] == [com_record]
+        assert index.namespace_map["org.acme"][-1] == org_record
+        assert index.by_fullname == {"com.acme.ComTest": com_record, "org.acme.OrgTest": org_record}
+        assert index.by_fingerprint == {
+            AvroSchema(com_record).fingerprint(): com_record,
+            AvroSchema(org_record).fingerprint(): org_record,
+        }
+
+    def test_add_refreshes_fingerprints(self, avro_record_schema: avro.schema.Schema) -> None:
+        index = ParserIndex()
+        assert index.by_fingerprint == {}
+
+        index.add(AvroSchema(avro_record_schema))
+        assert index.by_fingerprint == {AvroSchema(avro_record_schema).fingerprint(): avro_record_schema}
+
+    def test_recursive_schema(self) -> None:
+        node = avro.schema.parse(
+            json.dumps(
+                {
+                    "type": "record",
+                    "name": "Node",
+                    "fields": [{"name": "children", "type": {"type": "array", "items": "Node"}}],
+                }
+            )
+        )
+
+        index = ParserIndex.from_schemas([node])
+
+        assert index.by_fullname == {"Node": node}
+        assert [avro_schema.type for avro_schema in index.namespace_map["."]] == ["array", "record"]
+
+    def test_interns_named_schemas(self, avro_record_schema_json: str) -> None:
+        user = json.loads(avro_record_schema_json)
+        team = {
+            "type": "record",
+            "name": "Team",
+            "namespace": "org.acme",
+            "fields": [
+                {"name": "lead", "type": user},
+                {"name": "members", "type": {"type": "array", "items": "com.acme.User"}},
+            ],
+        }
+        team_schema = avro.schema.parse(json.dumps(team))
+        user_schema = avro.schema.parse(avro_record_schema_json)
+
+        index = ParserIndex.from_schemas([team_schema, user_schema])
+
+        assert [avro_schema for avro_schema in index.namespace_map["com.acme"] if avro_schema.is_named] == [user_schema]
+        assert index.by_fullname["com.acme.User"].schema is team_schema.fields[0].type
+        assert [avro_schema.type for avro_schema in index.namespace_map["org.acme"]] == ["array", "record"]
+
+    def test_schema_redefinition(self, avro_record_schema_json: str) -> None:
+        user = json.loads(avro_record_schema_json)
+        index = ParserIndex.from_schemas([avro.schema.parse(avro_record_schema_json)])
+
+        with pytest.raises(SchemaRedefinitionError):
+            index.add(AvroSchema(avro.schema.parse(json.dumps(user | {"fields": user["fields"][:1]}))))
@@ -4,6 +4,7 @@ from avro_neo_gen.utils import (
     dict_func_merge,
     dict_func_reduce,
     flat_map,
+    join_unparsed,
     pyast_load_name,
     pyast_store_name,
 )
@@ -36,3 +37,9 @@ class TestUtils:
                 {"a": {3}},
             ],
         )
+
+    def test_join_unparsed(self) -> None:
+        module = ast.parse("from a import b\nclass A:\n    pass\nx = 1\n@decorator\ndef f():\n    pass\ny = 2")
+        fragments = [ast.unparse(ast.Module(body=[node], type_ignores=[])) for node in module.body]
+
+        assert join_unparsed(["", *fragments, ""]) == ast.unparse(module)